@@ -0,0 +1,160 @@
+"""Benchmarks for simulation throughput and per-frame render cost.
+
+Simulation benchmarks time the batch engines in paths (or parameter sets) per
+second. Render benchmarks run each scene headless at low quality with movie
+writing and caching disabled, timing every ``play``/``wait`` call and the
+frames it produced.
+
+Usage:
+    python benchmarks.py -o bench.json
+    python benchmarks.py -o new.json --compare bench.json --threshold 0.1
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+
+SCENES = {
+    "CaseOpeningAnimation": "cs2_simulation_video",
+    "TradeUpAnimation": "tradeup_video",
+    "FlipperAnimation": "flipper_video",
+    "SmartInvestorAnimation": "investor_video",
+    "GrandFinale": "finale_video",
+}
+
+# Metrics checked by --compare, and whether a higher value is better.
+TRACKED_METRICS = {
+    "simulation": {"paths_per_second": True},
+    "render": {"seconds": False, "seconds_per_play": False, "seconds_per_frame": False},
+}
+
+
+def _best_of(repeat, func):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# --- SIMULATION THROUGHPUT ---
+
+def bench_simulation(num_paths=200_000, repeat=3):
+    from cs2sim import monte_carlo
+    from cs2sim.investor_model import _cached_sweep, investor_sweep
+
+    rng = np.random.default_rng(0)
+    axis = np.linspace(0.0, 1.0, int(round(num_paths ** 0.2)))
+    grid_size = len(axis) ** 5
+
+    def investor():
+        _cached_sweep.cache_clear()  # time the model, not the cache
+        investor_sweep(200 + 100 * axis, axis, axis, axis, np.arange(52, 52 + len(axis)))
+
+    cases = {
+        "case": (num_paths, lambda: monte_carlo.simulate_case_paths(num_paths, rng=rng)),
+        "tradeup": (num_paths, lambda: monte_carlo.simulate_tradeup_paths(num_paths, rng=rng)),
+        "flipper": (num_paths, lambda: monte_carlo.simulate_flipper_paths(num_paths, rng=rng)),
+        "investor": (grid_size, investor),
+    }
+    results = {}
+    for name, (paths, func) in cases.items():
+        seconds = _best_of(repeat, func)
+        results[name] = {"paths": paths, "seconds": seconds, "paths_per_second": paths / seconds}
+    return results
+
+
+# --- RENDER COST ---
+
+def bench_render(scenes=tuple(SCENES)):
+    import importlib
+
+    from manim import tempconfig
+
+    from instrumentation import Instrumentation
+
+    options = {"quality": "low_quality", "write_to_movie": False, "disable_caching": True,
+               "preview": False, "verbosity": "ERROR", "progress_bar": "none"}
+    results = {}
+    for scene_name in scenes:
+        scene_cls = getattr(importlib.import_module(SCENES[scene_name]), scene_name)
+        with tempconfig(options), Instrumentation(scene_name, trace_allocations=False) as instrumentation:
+            start = time.perf_counter()
+            instrumentation.attach(scene_cls()).render()
+            seconds = time.perf_counter() - start
+        calls, totals = instrumentation.calls, instrumentation.totals()
+        play_seconds = sum(call.seconds for call in calls)
+        results[scene_name] = {
+            "seconds": seconds,
+            "plays": len(calls),
+            "frames": totals["frames"],
+            "seconds_per_play": play_seconds / max(len(calls), 1),
+            "seconds_per_frame": play_seconds / max(totals["frames"], 1),
+            "slowest_play_seconds": max((call.seconds for call in calls), default=0.0),
+            "construct_seconds": totals["construct"],
+            "update_seconds": totals["update"],
+            "render_seconds": totals["render"],
+        }
+    return results
+
+
+# --- REPORTING ---
+
+def compare(current, baseline, threshold=0.1):
+    """List the metrics in ``current`` that are more than ``threshold`` worse than in ``baseline``."""
+    regressions = []
+    for section, tracked in TRACKED_METRICS.items():
+        for name, metrics in current.get(section, {}).items():
+            for metric, higher_is_better in tracked.items():
+                old = baseline.get(section, {}).get(name, {}).get(metric)
+                new = metrics.get(metric)
+                if not old or new is None:
+                    continue
+                change = (new - old) / old
+                if (change < -threshold) if higher_is_better else (change > threshold):
+                    regressions.append(f"{section}/{name}/{metric}: {old:.4g} -> {new:.4g} ({change:+.1%})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", default="benchmark_results.json")
+    parser.add_argument("--paths", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--scenes", nargs="*", default=list(SCENES), choices=list(SCENES))
+    parser.add_argument("--skip-render", action="store_true")
+    parser.add_argument("--skip-simulation", action="store_true")
+    parser.add_argument("--compare", help="earlier results JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    results = {"timestamp": time.time(), "python": platform.python_version(), "numpy": np.__version__,
+               "machine": platform.machine()}
+    if not args.skip_simulation:
+        results["simulation"] = bench_simulation(args.paths, args.repeat)
+        for name, metrics in results["simulation"].items():
+            print(f"{name:>10}: {metrics['paths_per_second']:>14,.0f} paths/s")
+    if not args.skip_render:
+        results["render"] = bench_render(args.scenes)
+        for name, metrics in results["render"].items():
+            print(f"{name:>24}: {metrics['seconds']:7.2f} s, {metrics['plays']:4d} plays, "
+                  f"{metrics['seconds_per_frame'] * 1000:7.2f} ms/frame")
+
+    with open(args.output, "w") as handle:
+        json.dump(results, handle, indent=2)
+
+    if args.compare:
+        with open(args.compare) as handle:
+            regressions = compare(results, json.load(handle), args.threshold)
+        for line in regressions:
+            print("REGRESSION", line)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,10 @@
+"""Headless simulation core for the CS2 profit videos.
+
+Everything in this package needs only the standard library and NumPy, so the
+models can be imported, swept and benchmarked without loading Manim. The
+model constants live in one module per strategy (``case``, ``tradeup``,
+``flipper``, ``investor``); the scene scripts import them from there.
+
+Submodules are not imported here, so ``import cs2sim.case`` costs next to
+nothing. ``python -m cs2sim`` runs any strategy from the command line.
+"""
@@ -0,0 +1,6 @@
+"""``python -m cs2sim``: see ``cs2sim.cli``."""
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,25 @@
+"""Fever Case data used by ``CaseOpeningAnimation``."""
+
+COST_PER_CASE = 3.48
+STARTING_BALANCE = 200.00
+NUM_CASES_TO_OPEN = 52
+
+# Item Pools with StatTrak™
+SKINS = {
+    'Blue': {'M4A4 | Choppa': 0.10, 'MP7 | Nexus': 0.12, 'MAC-10 | Resupply': 0.08, 'P2000 | Sure Grip': 0.09, 'SG 553 | Mockingbird': 0.11},
+    'ST_Blue': {'ST M4A4 | Choppa': 0.30, 'ST MP7 | Nexus': 0.35, 'ST MAC-10 | Resupply': 0.25, 'ST P2000 | Sure Grip': 0.28, 'ST SG 553 | Mockingbird': 0.32},
+    'Purple': {'Nova | Rising Sun': 0.50, 'P90 | Wave Breaker': 0.55, 'FAMAS | Bad Trip': 0.45, 'Galil AR | Control': 0.60, 'USP-S | PC-GRN': 0.40},
+    'ST_Purple': {'ST Nova | Rising Sun': 1.50, 'ST P90 | Wave Breaker': 1.60, 'ST FAMAS | Bad Trip': 1.40, 'ST Galil AR | Control': 1.75, 'ST USP-S | PC-GRN': 1.20},
+    'Pink': {'Desert Eagle | Serpent Strike': 3.00, 'UMP-45 | K.O. Factory': 2.20, 'Glock-18 | Shinobu': 2.50},
+    'ST_Pink': {'ST Desert Eagle | Serpent Strike': 7.00, 'ST UMP-45 | K.O. Factory': 5.50, 'ST Glock-18 | Shinobu': 6.00},
+    'Red': {'AK-47 | Searing Rage': 12.00, 'AWP | Printstream': 75.00},
+    'ST_Red': {'ST AK-47 | Searing Rage': 30.00, 'ST AWP | Printstream': 200.00},
+    'Gold': {'Navaja Knife | Slaughter': 280.00, 'Stiletto Knife | Case Hardened': 350.00, 'Ursus Knife | Doppler': 400.00, 'Talon Knife | Tiger Tooth': 500.00}
+}
+PROBABILITIES = {
+    'Blue': 0.71928, 'ST_Blue': 0.07992,
+    'Purple': 0.14382, 'ST_Purple': 0.01598,
+    'Pink': 0.0288, 'ST_Pink': 0.0032,
+    'Red': 0.00576, 'ST_Red': 0.00064,
+    'Gold': 0.0026
+}
@@ -0,0 +1,176 @@
+"""Catalogue-wide case EV ranking.
+
+Every case, in the same rarity -> item-pool shape as ``SKINS``/``PROBABILITIES``
+(or straight from an ``ItemStore``), is compiled into flat probability and
+value arrays once. The per-case statistics are then precomputed and kept in
+an index sorted by EV per dollar:
+
+    index = CaseIndex.from_definitions(cases)
+    index.top(20)                          # best EV/cost
+    index.query(min_p_profit=0.2)          # P(profit over 52 openings) > 20%
+    index.refresh(all_cases)               # sync with the whole catalogue: cases missing from it are dropped
+    index.update(changed_cases)            # add or replace just these cases
+
+Either way, only the cases whose data changed are recomputed.
+"""
+import hashlib
+from typing import NamedTuple
+
+import numpy as np
+
+from .case import NUM_CASES_TO_OPEN
+from .exact_distribution import CENT, iter_distributions, step_kernel
+
+STATTRAK_PREFIX = "ST_"
+KNIFE_RARITY = "Gold"
+
+
+class CompiledCase(NamedTuple):
+    cost: float
+    probs: np.ndarray     # probability of each possible drop
+    values: np.ndarray    # price of each possible drop
+    rarities: np.ndarray  # rarity label of each possible drop
+
+    def fingerprint(self):
+        digest = hashlib.blake2b(digest_size=16)
+        for array in (np.float64(self.cost), self.probs, self.values, self.rarities.astype("U")):
+            digest.update(np.ascontiguousarray(array).tobytes())
+        return digest.hexdigest()
+
+
+class CaseStats(NamedTuple):
+    name: str
+    cost: float
+    ev: float
+    ev_per_cost: float
+    std: float
+    stattrak_ev: float  # part of ``ev`` contributed by StatTrak drops
+    knife_mass: float   # probability of a knife (Gold) drop
+    p_profit: float     # P(total drop value > total cost) after ``openings`` openings
+
+
+# --- COMPILING ---
+
+def compile_definition(definition):
+    """Flatten an ``item_store.CaseDefinition`` (or any (cost, skins, probabilities[, weights]) tuple)."""
+    cost, skins, probabilities = definition[:3]
+    weights = (definition[3] if len(definition) > 3 else None) or {}
+    probs, values, rarities = [], [], []
+    for rarity, pool in skins.items():
+        pool_weights = np.array([weights.get(item, 1.0) for item in pool], dtype=np.float64)
+        probs.extend(probabilities[rarity] * pool_weights / pool_weights.sum())
+        values.extend(pool.values())
+        rarities.extend([rarity] * len(pool))
+    probs = np.array(probs)
+    return CompiledCase(float(cost), probs / probs.sum(), np.array(values, dtype=np.float64), np.array(rarities))
+
+
+def _to_cents(amount):
+    # The store keeps prices as float32; 4.33 comes back as 4.329999923706055.
+    return np.round(np.asarray(amount, dtype=np.float64), 2)
+
+
+def compile_store_case(store, case_id, snapshot=-1):
+    item_ids, probs, values = store.outcome_distribution(case_id, snapshot)
+    rarities = np.array(store.rarities)[store.item_rarity[item_ids]]
+    return CompiledCase(float(_to_cents(store.case_cost[case_id])), probs, _to_cents(values), rarities)
+
+
+def case_stats(name, case, openings=NUM_CASES_TO_OPEN, tick=CENT):
+    """Precompute a case's statistics.
+
+    With the default one-cent ``tick`` and cent prices, P(profit) is exact. A
+    coarser tick is faster but makes it a discretized approximation: each
+    opening's change is split between the nearest ticks, which keeps the mean
+    but can move a run across the break-even line.
+    """
+    ev = float(case.probs @ case.values)
+    std = float(np.sqrt(case.probs @ (case.values - ev) ** 2))
+    stattrak = np.char.startswith(case.rarities.astype("U"), STATTRAK_PREFIX)
+    kernel, offset = step_kernel(case.values - case.cost, case.probs, tick)
+    final = next(iter_distributions(0, kernel, offset, openings, tick=tick, every_step=False))
+    return CaseStats(
+        name, case.cost, ev, ev / case.cost if case.cost else np.inf, std,
+        stattrak_ev=float(case.probs[stattrak] @ case.values[stattrak]),
+        knife_mass=float(case.probs[case.rarities == KNIFE_RARITY].sum()),
+        p_profit=final.prob_above(0.0),
+    )
+
+
+# --- INDEX ---
+
+class CaseIndex:
+    """Precomputed per-case statistics, kept sorted by EV per dollar spent."""
+
+    def __init__(self, openings=NUM_CASES_TO_OPEN, tick=CENT):
+        self.openings = openings
+        self.tick = tick
+        self.stats = {}
+        self._fingerprints = {}
+        self._order = []
+
+    @classmethod
+    def from_definitions(cls, definitions, **kwargs):
+        index = cls(**kwargs)
+        index.refresh(definitions)
+        return index
+
+    @classmethod
+    def from_store(cls, store, snapshot=-1, **kwargs):
+        index = cls(**kwargs)
+        index.refresh_from_store(store, snapshot)
+        return index
+
+    def refresh(self, definitions):
+        """Sync the index with the complete catalogue ``definitions`` (name -> definition).
+
+        Cases not in ``definitions`` are removed; use ``update`` to change only
+        some of them. Returns the names recomputed.
+        """
+        return self._refresh({name: compile_definition(d) for name, d in definitions.items()})
+
+    def update(self, definitions):
+        """Add or replace the cases in ``definitions``, keeping every other case; returns the names recomputed."""
+        return self._refresh({name: compile_definition(d) for name, d in definitions.items()}, complete=False)
+
+    def refresh_from_store(self, store, snapshot=-1):
+        return self._refresh({name: compile_store_case(store, case_id, snapshot)
+                              for case_id, name in enumerate(store.case_names())})
+
+    def _refresh(self, compiled, complete=True):
+        changed = []
+        for name, case in compiled.items():
+            fingerprint = case.fingerprint()
+            if self._fingerprints.get(name) != fingerprint:
+                self.stats[name] = case_stats(name, case, self.openings, self.tick)
+                self._fingerprints[name] = fingerprint
+                changed.append(name)
+        for name in set(self.stats) - set(compiled) if complete else ():
+            del self.stats[name], self._fingerprints[name]
+        names = list(self.stats)
+        ratios = np.array([self.stats[name].ev_per_cost for name in names])
+        self._order = [names[i] for i in np.argsort(-ratios, kind="stable")]
+        return changed
+
+    def __len__(self):
+        return len(self.stats)
+
+    def top(self, k=20):
+        """The ``k`` cases with the best EV per dollar."""
+        return [self.stats[name] for name in self._order[:k]]
+
+    def query(self, min_p_profit=None, min_ev_per_cost=None, max_cost=None, limit=None):
+        """Cases passing every given filter, best EV per dollar first."""
+        matches = []
+        for name in self._order:
+            stats = self.stats[name]
+            if min_p_profit is not None and not stats.p_profit > min_p_profit:
+                continue
+            if min_ev_per_cost is not None and stats.ev_per_cost < min_ev_per_cost:
+                continue
+            if max_cost is not None and stats.cost > max_cost:
+                continue
+            matches.append(stats)
+            if limit is not None and len(matches) == limit:
+                break
+        return matches
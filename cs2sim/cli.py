@@ -0,0 +1,136 @@
+"""Run any strategy headless and write the results as CSV, JSON or NPY.
+
+Usage:
+    python -m cs2sim case --paths 100000 --summary
+    python -m cs2sim tradeup --seeds 1 2 3 --set cost_per_attempt=4.33,5 -f csv -o tradeup.csv
+    python -m cs2sim flipper --paths 1000 -f npy -o flipper.npy
+
+``--set name=v1,v2`` sweeps a model parameter; several ``--set`` options
+form a grid. Without ``--summary`` every path is written out, one row per
+(parameter set, seed, path) with one column per step. With ``--summary``
+each row holds statistics of the final balance instead.
+"""
+import argparse
+import ast
+import csv
+import io
+import json
+import sys
+
+import numpy as np
+
+from .sweep import STRATEGIES, param_grid, run_sweep, strategy_params
+
+SUMMARY_STATS = ("mean", "std", "min", "p5", "p50", "p95", "max")
+
+
+def _parse_value(text):
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+def _parse_axes(assignments):
+    axes = {}
+    for assignment in assignments:
+        name, sep, values = assignment.partition("=")
+        if not sep or not name:
+            raise argparse.ArgumentTypeError(f"expected name=value[,value...], got {assignment!r}")
+        axes[name] = [_parse_value(value) for value in values.split(",")]
+    return axes
+
+
+def summarize(final):
+    """``SUMMARY_STATS`` of final balances along the last axis."""
+    p5, p50, p95 = np.percentile(final, [5, 50, 95], axis=-1)
+    return np.stack([final.mean(axis=-1), final.std(axis=-1), final.min(axis=-1), p5, p50, p95,
+                     final.max(axis=-1)], axis=-1)
+
+
+# --- OUTPUT ---
+
+def _rows(param_sets, seeds, data, summary):
+    """(params, seed, path, values) for every row to write; ``path`` is None for summaries."""
+    for param_idx, params in enumerate(param_sets):
+        for seed_idx, seed in enumerate(seeds):
+            if summary:
+                yield params, seed, None, data[param_idx, seed_idx]
+            else:
+                for path, values in enumerate(data[param_idx, seed_idx]):
+                    yield params, seed, path, values
+
+
+def write_csv(handle, param_sets, seeds, data, summary):
+    names = list(param_sets[0])
+    columns = list(SUMMARY_STATS) if summary else [f"step_{step}" for step in range(1, data.shape[-1] + 1)]
+    writer = csv.writer(handle)
+    writer.writerow(names + ["seed"] + ([] if summary else ["path"]) + columns)
+    for params, seed, path, values in _rows(param_sets, seeds, data, summary):
+        writer.writerow([params[name] for name in names] + [seed] + ([] if summary else [path])
+                        + [repr(float(v)) for v in values])
+
+
+def write_json(handle, strategy, num_paths, param_sets, seeds, data, summary):
+    runs = []
+    for param_idx, params in enumerate(param_sets):
+        for seed_idx, seed in enumerate(seeds):
+            block = data[param_idx, seed_idx]
+            run = {"params": params, "seed": seed}
+            run.update({"summary": dict(zip(SUMMARY_STATS, block.tolist()))} if summary else {"paths": block.tolist()})
+            runs.append(run)
+    json.dump({"strategy": strategy, "num_paths": num_paths, "runs": runs}, handle)
+    handle.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m cs2sim", description=__doc__.splitlines()[0])
+    parser.add_argument("strategy", choices=sorted(STRATEGIES))
+    parser.add_argument("-n", "--paths", type=int, default=10_000)
+    parser.add_argument("--seeds", type=int, nargs="+", default=[42])
+    parser.add_argument("--set", dest="axes", action="append", default=[], metavar="NAME=V1[,V2...]",
+                        help="model parameter, or comma-separated values to sweep")
+    parser.add_argument("--summary", action="store_true", help="write final-balance statistics instead of paths")
+    parser.add_argument("-f", "--format", choices=("csv", "json", "npy"), default="csv")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("-j", "--workers", type=int, default=0, help="worker processes (0 = run in this process)")
+    parser.add_argument("--block-size", type=int, default=10_000)
+    parser.add_argument("--float32", action="store_true", help="store results as float32 to halve memory")
+    args = parser.parse_args(argv)
+
+    try:
+        axes = _parse_axes(args.axes)
+    except argparse.ArgumentTypeError as error:
+        parser.error(str(error))
+    allowed = strategy_params(args.strategy)
+    unknown = [name for name in axes if name not in allowed]
+    if unknown:
+        parser.error(f"unknown {args.strategy} parameter(s) {', '.join(unknown)}; expected one of {', '.join(allowed)}")
+    param_sets = param_grid(**axes)
+    try:
+        data = run_sweep(args.strategy, param_sets, args.seeds, args.paths, args.block_size, args.workers,
+                         np.float32 if args.float32 else np.float64)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.summary:
+        data = summarize(data[..., -1])
+
+    if args.format == "npy":
+        if args.output == "-":
+            buffer = io.BytesIO()
+            np.save(buffer, data)
+            sys.stdout.buffer.write(buffer.getvalue())
+        else:
+            np.save(args.output, data)
+        return 0
+
+    handle = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    try:
+        if args.format == "csv":
+            write_csv(handle, param_sets, args.seeds, data, args.summary)
+        else:
+            write_json(handle, args.strategy, args.paths, param_sets, args.seeds, data, args.summary)
+    finally:
+        if handle is not sys.stdout:
+            handle.close()
+    return 0
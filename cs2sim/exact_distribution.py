@@ -0,0 +1,212 @@
+"""Exact balance distributions for the case and trade-up models.
+
+Balances are discretized to a grid of ``tick`` dollars (one cent by default)
+and probability mass is propagated step by step. Outcomes already on the
+grid (every case price) are exact. An off-grid outcome, such as a trade-up
+value after the 15% fee, has its probability split between the two
+neighbouring ticks so that the mean stays exact. Each step's change is then
+off by less than one tick, and percentiles by at most one tick per step.
+
+Listing every step carries one distribution forward, convolving it once per
+step with the one-step kernel and absorbing what falls below the barrier.
+When only the final distribution is wanted, the steps before any path can
+reach the case-opening barrier are independent, so that whole run is
+collapsed into a single FFT power of the kernel. Carried distributions drop
+at most ``TAIL_MASS`` of probability from each end per step: a case's
+many-knife tail would otherwise stretch the grid six-fold.
+"""
+import numpy as np
+
+from .case import COST_PER_CASE, NUM_CASES_TO_OPEN, PROBABILITIES, SKINS
+from .case import STARTING_BALANCE as CASE_STARTING_BALANCE
+from .tradeup import COST_PER_ATTEMPT, NUM_ATTEMPTS, STEAM_FEE_MULTIPLIER, TRADE_UP_OUTCOMES
+from .tradeup import PROBABILITIES as TRADE_UP_PROBABILITIES
+from .tradeup import STARTING_BALANCE as TRADE_UP_STARTING_BALANCE
+
+CENT = 0.01
+TAIL_MASS = 1e-18  # outer mass dropped from each end of a carried distribution, far below float64 resolution
+
+# --- DISTRIBUTION CONTAINER ---
+
+class BalanceDistribution:
+    """Probability mass over the balances ``(origin + i) * tick`` for ``i`` in ``range(len(pmf))``."""
+
+    def __init__(self, pmf, origin, tick=CENT):
+        self.pmf = pmf
+        self.origin = origin
+        self.tick = tick
+
+    @property
+    def balances(self):
+        return (self.origin + np.arange(len(self.pmf))) * self.tick
+
+    def mean(self):
+        return float(self.pmf @ self.balances)
+
+    def std(self):
+        return float(np.sqrt(self.pmf @ (self.balances - self.mean()) ** 2))
+
+    def prob_below(self, balance):
+        """P(balance < ``balance``)."""
+        cut = int(np.ceil(round(balance / self.tick, 9))) - self.origin
+        return float(self.pmf[:max(cut, 0)].sum())
+
+    def prob_above(self, balance):
+        """P(balance > ``balance``)."""
+        cut = int(np.floor(round(balance / self.tick, 9))) - self.origin + 1
+        return float(self.pmf[max(cut, 0):].sum())
+
+    def percentile(self, q):
+        """Smallest balance whose cumulative probability reaches ``q`` percent."""
+        cdf = np.cumsum(self.pmf)
+        index = np.searchsorted(cdf, np.asarray(q) / 100 * cdf[-1])
+        return (self.origin + np.minimum(index, len(self.pmf) - 1)) * self.tick
+
+
+# --- GRID HELPERS ---
+
+def to_ticks(amount, tick=CENT):
+    return int(round(amount / tick))
+
+
+def step_kernel(outcomes, probabilities, tick=CENT):
+    """One-step pmf over net balance changes, returned as (kernel, offset of index 0 in ticks).
+
+    Off-grid changes are split between the ticks either side in proportion to
+    their distance, which keeps the kernel's mean equal to the outcomes' mean.
+    """
+    ticks = np.round(np.asarray(outcomes, dtype=np.float64) / tick, 9)  # keep on-grid values from spilling over
+    below = np.floor(ticks).astype(np.int64)
+    upper_share = ticks - below
+    probabilities = np.asarray(probabilities, dtype=np.float64)
+    offset = int(below.min())
+    kernel = np.zeros(int(below.max()) - offset + 2)
+    np.add.at(kernel, below - offset, probabilities * (1.0 - upper_share))
+    np.add.at(kernel, below - offset + 1, probabilities * upper_share)
+    return np.trim_zeros(kernel, "b"), offset
+
+
+def _fft_size(n):
+    return 1 << int(n - 1).bit_length()
+
+
+def _convolve(a, kernel):
+    size = len(a) + len(kernel) - 1
+    n = _fft_size(size)
+    support = np.flatnonzero(kernel)
+    if len(support) < 2 * n.bit_length():
+        # A case kernel spans hundreds of dollars but holds only a few dozen
+        # outcomes, so shifting and adding beats a full-grid FFT.
+        out = np.zeros(size)
+        for shift in support:
+            out[shift:shift + len(a)] += kernel[shift] * a
+        return out
+    out = np.fft.irfft(np.fft.rfft(a, n) * np.fft.rfft(kernel, n), n)[:size]
+    return np.maximum(out, 0.0)  # drop FFT round-off below zero
+
+
+def _trim(pmf, origin, tail_mass=TAIL_MASS):
+    """Drop the outer entries holding at most ``tail_mass`` at either end, as (pmf, origin)."""
+    lo = int(np.searchsorted(np.cumsum(pmf), tail_mass, side="right"))
+    hi = len(pmf) - int(np.searchsorted(np.cumsum(pmf[::-1]), tail_mass, side="right"))
+    return pmf[lo:hi], origin + lo
+
+
+def _kernel_power(kernel, steps):
+    size = steps * (len(kernel) - 1) + 1
+    n = _fft_size(size)
+    out = np.fft.irfft(np.fft.rfft(kernel, n) ** steps, n)[:size]
+    return np.maximum(out, 0.0)
+
+
+# --- PROPAGATION ---
+
+def iter_distributions(start, kernel, offset, num_steps, barrier=None, tick=CENT, every_step=True):
+    """Yield the BalanceDistribution after each of ``num_steps`` steps.
+
+    ``start`` and ``barrier`` are in ticks. Mass sitting below ``barrier`` is
+    absorbed: it no longer takes steps, like a player who can't afford a case.
+    With ``every_step=False`` only the final distribution is produced, which
+    lets the barrier-free prefix collapse into a single FFT.
+    """
+    # Steps before the lowest reachable balance can touch the barrier are plain
+    # convolutions, so without intermediate steps to report they are one FFT power.
+    if every_step:
+        free_steps = 0
+    elif barrier is None or offset >= 0:
+        free_steps = num_steps if barrier is None or start >= barrier else 0
+    else:
+        free_steps = min(num_steps, max((start - barrier) // -offset + 1, 0))
+
+    if free_steps:
+        pmf, origin = _kernel_power(kernel, free_steps), start + free_steps * offset
+    else:
+        pmf, origin = np.ones(1), start
+    if not every_step and free_steps == num_steps:
+        yield BalanceDistribution(pmf, origin, tick)
+        return
+
+    for step in range(free_steps, num_steps):
+        split = 0 if barrier is None else min(max(barrier - origin, 0), len(pmf))
+        absorbed, live = pmf[:split], pmf[split:]
+        moved = _convolve(live, kernel) if live.any() else np.zeros(0)
+        moved_origin = origin + split + offset
+
+        lo = min(origin, moved_origin) if len(moved) else origin
+        hi = max(origin + split, moved_origin + len(moved))
+        new = np.zeros(hi - lo)
+        new[origin - lo:origin - lo + split] += absorbed
+        new[moved_origin - lo:moved_origin - lo + len(moved)] += moved
+
+        pmf, origin = _trim(new, lo)
+        if every_step or step == num_steps - 1:
+            yield BalanceDistribution(pmf, origin, tick)
+
+
+# --- STRATEGY MODELS ---
+
+def case_outcomes(skins=SKINS, probabilities=PROBABILITIES, cost_per_case=COST_PER_CASE):
+    """Net balance change and probability of every possible case opening."""
+    changes, probs = [], []
+    for rarity, pool in skins.items():
+        for value in pool.values():
+            changes.append(value - cost_per_case)
+            probs.append(probabilities[rarity] / len(pool))
+    return np.array(changes), np.array(probs) / sum(probs)
+
+
+def iter_case_distributions(num_cases=NUM_CASES_TO_OPEN, starting_balance=CASE_STARTING_BALANCE,
+                            cost_per_case=COST_PER_CASE, skins=SKINS, probabilities=PROBABILITIES,
+                            tick=CENT, every_step=True):
+    changes, probs = case_outcomes(skins, probabilities, cost_per_case)
+    kernel, offset = step_kernel(changes, probs, tick)
+    yield from iter_distributions(to_ticks(starting_balance, tick), kernel, offset, num_cases,
+                                  barrier=to_ticks(cost_per_case, tick), tick=tick, every_step=every_step)
+
+
+def case_final_distribution(**kwargs):
+    """Exact distribution of the balance after the last case; see ``iter_case_distributions``."""
+    return next(iter_case_distributions(every_step=False, **kwargs))
+
+
+def tradeup_outcomes(outcomes=TRADE_UP_OUTCOMES, probabilities=TRADE_UP_PROBABILITIES,
+                     cost_per_attempt=COST_PER_ATTEMPT, fee_multiplier=STEAM_FEE_MULTIPLIER):
+    """Net balance change and probability of every trade-up result, after the Steam fee."""
+    values = np.array(list(outcomes.values()))
+    return values * fee_multiplier - cost_per_attempt, np.asarray(probabilities)
+
+
+def iter_tradeup_distributions(num_attempts=NUM_ATTEMPTS, starting_balance=TRADE_UP_STARTING_BALANCE,
+                               cost_per_attempt=COST_PER_ATTEMPT, fee_multiplier=STEAM_FEE_MULTIPLIER,
+                               outcomes=TRADE_UP_OUTCOMES, probabilities=TRADE_UP_PROBABILITIES,
+                               tick=CENT, every_step=True):
+    # TradeUpAnimation keeps trading regardless of balance, so there is no barrier.
+    changes, probs = tradeup_outcomes(outcomes, probabilities, cost_per_attempt, fee_multiplier)
+    kernel, offset = step_kernel(changes, probs, tick)
+    yield from iter_distributions(to_ticks(starting_balance, tick), kernel, offset, num_attempts,
+                                  tick=tick, every_step=every_step)
+
+
+def tradeup_final_distribution(**kwargs):
+    """Exact distribution of the balance after the last trade-up; see ``iter_tradeup_distributions``."""
+    return next(iter_tradeup_distributions(every_step=False, **kwargs))
@@ -0,0 +1,69 @@
+"""Weekly balances of all four strategies for the three-year finale race.
+
+Each strategy keeps the rules and seed of its own video, stretched to
+``RACE_WEEKS``. The case and the trade-up make one attempt a week. The
+flipper's daily walk is read off every seventh day and valued with the
+leftover cash. The investor follows the closed-form model. Traces go through
+``TraceCache``, so they are simulated once and reused by every render.
+"""
+import sys
+
+import numpy as np
+
+from . import case, flipper, investor, investor_model, trace_cache, traces, tradeup
+from .trace_cache import TraceCache, module_constants
+
+RACE_WEEKS = 156
+DAYS_PER_WEEK = 7
+SEEDS = {"case": 42, "tradeup": tradeup.SEED, "flipper": 5, "investor": 0}
+
+
+def _case_race(weeks, seed):
+    trace = traces.case_opening_trace(case.SKINS, case.PROBABILITIES, case.COST_PER_CASE, case.STARTING_BALANCE,
+                                      weeks, seed)
+    return {"balance": [case.STARTING_BALANCE] + [step.balance for step in trace],
+            "rarity": [step.rarity for step in trace]}
+
+
+def _tradeup_race(weeks, seed):
+    trace = traces.tradeup_trace(tradeup.TRADE_UP_OUTCOMES, tradeup.PROBABILITIES, tradeup.COST_PER_ATTEMPT,
+                                 tradeup.STEAM_FEE_MULTIPLIER, tradeup.STARTING_BALANCE, weeks, seed)
+    return {"balance": [tradeup.STARTING_BALANCE] + [step.balance for step in trace],
+            "outcome": [step.outcome for step in trace]}
+
+
+def _flipper_race(weeks, seed):
+    trace = traces.flipper_trace(flipper.BUY_PRICE_PER_UNIT, flipper.NUM_UNITS, flipper.DAILY_PRICE_CHANGE_RANGE,
+                                 weeks * DAYS_PER_WEEK, seed)
+    cash = flipper.INITIAL_CAPITAL - flipper.INITIAL_COST
+    price = np.array([flipper.BUY_PRICE_PER_UNIT] + [step.price for step in trace])[::DAYS_PER_WEEK]
+    return {"balance": cash + price * flipper.NUM_UNITS, "price": price}
+
+
+def _investor_race(weeks, seed):
+    history = investor_model.investor_history(investor.INITIAL_CAPITAL, investor.WEEKLY_DEPOSIT, investor.APY,
+                                              investor.ASSET_APPRECIATION, weeks)
+    return {"balance": history.total, "baseline": history.baseline}
+
+
+# strategy -> (builder, module whose constants are its inputs)
+RACES = {
+    "case": (_case_race, case),
+    "tradeup": (_tradeup_race, tradeup),
+    "flipper": (_flipper_race, flipper),
+    "investor": (_investor_race, investor),
+}
+
+
+def race_trace(strategy, weeks=RACE_WEEKS, seed=None, cache=None):
+    """One strategy's race as a dict of arrays; ``balance`` has ``weeks + 1`` entries, from week 0."""
+    build, constants = RACES[strategy]
+    seed = SEEDS[strategy] if seed is None else seed
+    params = {"weeks": weeks, "days_per_week": DAYS_PER_WEEK, **module_constants(constants)}
+    code = (sys.modules[__name__], trace_cache, traces, investor_model)
+    return (cache or TraceCache()).get_or_compute(strategy, params, seed, lambda: build(weeks, seed), code)
+
+
+def race_traces(weeks=RACE_WEEKS, cache=None):
+    cache = cache or TraceCache()
+    return {strategy: race_trace(strategy, weeks, cache=cache) for strategy in RACES}
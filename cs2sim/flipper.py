@@ -0,0 +1,13 @@
+"""AK-47 | Slate flipping data used by ``FlipperAnimation``."""
+
+INITIAL_CAPITAL = 200.00
+BUY_PRICE_PER_UNIT = 2.70
+NUM_UNITS = 74
+INITIAL_COST = BUY_PRICE_PER_UNIT * NUM_UNITS
+
+STEAM_FEE_MULTIPLIER = 0.85
+DAYS_TO_SIMULATE = 90
+DAILY_PRICE_CHANGE_RANGE = (-0.05, 0.065) # Biased random walk: slightly more upside per day than downside
+
+BREAK_EVEN_PRICE = BUY_PRICE_PER_UNIT / STEAM_FEE_MULTIPLIER
+BREAK_EVEN_PORTFOLIO_VALUE = BREAK_EVEN_PRICE * NUM_UNITS
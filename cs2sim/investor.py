@@ -0,0 +1,7 @@
+"""Smart Investor data used by ``SmartInvestorAnimation``."""
+
+INITIAL_CAPITAL = 200.00
+WEEKLY_DEPOSIT = 0.50
+WEEKS_TO_SIMULATE = 156
+APY = 0.15
+ASSET_APPRECIATION = 0.30
@@ -0,0 +1,103 @@
+"""Closed-form version of the Smart Investor deposit + APY + appreciation model.
+
+Week ``k`` of ``SmartInvestorAnimation`` adds the deposit and then compounds,
+so the principal follows ``P_k = (P_{k-1} + D) * g`` with ``g`` the weekly
+growth factor. That recurrence has the closed form
+
+    P_k = C * g**k + D * g * (g**k - 1) / (g - 1)
+
+and the asset gain is ``P_k * A * k / W``, so any week of any parameter set can
+be evaluated without stepping through the weeks before it.
+"""
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+from .investor import APY, ASSET_APPRECIATION, INITIAL_CAPITAL, WEEKLY_DEPOSIT, WEEKS_TO_SIMULATE
+
+WEEKS_PER_YEAR = 52
+
+
+class InvestorBreakdown(NamedTuple):
+    principal: np.ndarray
+    deposits: np.ndarray
+    apy_gains: np.ndarray
+    asset_gains: np.ndarray
+
+    @property
+    def baseline(self):
+        return self.principal + self.deposits
+
+    @property
+    def with_apy(self):
+        return self.baseline + self.apy_gains
+
+    @property
+    def total(self):
+        return self.with_apy + self.asset_gains
+
+
+def weekly_rate(apy):
+    return (1 + np.asarray(apy, dtype=np.float64)) ** (1 / WEEKS_PER_YEAR) - 1
+
+
+def investor_breakdown(week, initial_capital=INITIAL_CAPITAL, weekly_deposit=WEEKLY_DEPOSIT, apy=APY,
+                       asset_appreciation=ASSET_APPRECIATION, weeks_to_simulate=WEEKS_TO_SIMULATE):
+    """Evaluate the model at ``week``; every argument broadcasts against the others."""
+    week = np.asarray(week, dtype=np.float64)
+    capital = np.asarray(initial_capital, dtype=np.float64)
+    deposit = np.asarray(weekly_deposit, dtype=np.float64)
+    rate = weekly_rate(apy)
+
+    growth = (1 + rate) ** week
+    with np.errstate(invalid="ignore", divide="ignore"):
+        deposit_growth = np.where(rate == 0, week, (1 + rate) * (growth - 1) / np.where(rate == 0, 1, rate))
+    balance = capital * growth + deposit * deposit_growth
+
+    deposits = deposit * week
+    apy_gains = balance - capital - deposits
+    asset_gains = balance * (asset_appreciation * (week / weeks_to_simulate))
+    principal = np.broadcast_to(capital, np.broadcast(balance, capital).shape)
+    return InvestorBreakdown(principal, deposits, apy_gains, asset_gains)
+
+
+def investor_history(initial_capital=INITIAL_CAPITAL, weekly_deposit=WEEKLY_DEPOSIT, apy=APY,
+                     asset_appreciation=ASSET_APPRECIATION, weeks_to_simulate=WEEKS_TO_SIMULATE):
+    """Weeks 0..``weeks_to_simulate`` of one parameter set, as plotted by the scene."""
+    return investor_breakdown(np.arange(weeks_to_simulate + 1), initial_capital, weekly_deposit, apy,
+                              asset_appreciation, weeks_to_simulate)
+
+
+# --- PARAMETER SWEEPS ---
+
+def _axis(values):
+    return tuple(float(v) for v in np.atleast_1d(values))
+
+
+@lru_cache(maxsize=256)
+def _cached_sweep(initial_capital, weekly_deposit, apy, asset_appreciation, weeks_to_simulate):
+    grids = np.meshgrid(*(np.array(axis) for axis in (initial_capital, weekly_deposit, apy,
+                                                      asset_appreciation, weeks_to_simulate)),
+                        indexing="ij", sparse=True)
+    capital, deposit, rate, appreciation, weeks = grids
+    result = investor_breakdown(weeks, capital, deposit, rate, appreciation, weeks)
+    fields = []
+    for field in result:
+        field = np.array(np.broadcast_to(field, np.broadcast(*grids).shape))
+        field.flags.writeable = False  # shared by every caller that hits the cache
+        fields.append(field)
+    return InvestorBreakdown(*fields)
+
+
+def investor_sweep(initial_capital=INITIAL_CAPITAL, weekly_deposit=WEEKLY_DEPOSIT, apy=APY,
+                   asset_appreciation=ASSET_APPRECIATION, weeks_to_simulate=WEEKS_TO_SIMULATE):
+    """Final-week breakdown over the outer product of the given parameter axes.
+
+    Each argument is a scalar or a 1-D sequence of values to sweep. The result
+    fields have shape ``(len(initial_capital), len(weekly_deposit), len(apy),
+    len(asset_appreciation), len(weeks_to_simulate))``. Results are memoized on
+    the parameter tuple and returned read-only.
+    """
+    return _cached_sweep(_axis(initial_capital), _axis(weekly_deposit), _axis(apy),
+                         _axis(asset_appreciation), _axis(weeks_to_simulate))
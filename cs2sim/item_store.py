@@ -0,0 +1,244 @@
+"""Columnar, memory-mapped store of case contents, drop odds and item prices.
+
+A store is a directory of flat binary arrays (struct-of-arrays) plus a small
+``meta.json``. Items are numbered by integer ID and grouped by case, then by
+rarity, so each case's rarity pool is a contiguous ID range. Prices are
+float32 and keep one row per price snapshot. Everything is opened with
+``np.memmap``, so any number of worker processes can share one catalogue
+through the page cache without loading or copying it.
+
+Layout (N items, C cases, R rarities, S snapshots):
+
+    item_price.f32        (S, N)  price of every item in every snapshot
+    item_weight.f32       (N,)    relative drop weight within its rarity pool
+    item_case.i32         (N,)    owning case ID, -1 for loose items
+    item_rarity.u8        (N,)    index into meta["rarities"]
+    case_cost.f32         (C,)    price to open (or attempt) the case
+    case_rarity_prob.f32  (C, R)  rarity odds
+    case_pool_start.i64   (C, R + 1) item ID range of each rarity pool
+    item_names.bin / item_name_offsets.i64, case_names.bin / case_name_offsets.i64
+"""
+import json
+from pathlib import Path
+from typing import Mapping, NamedTuple
+
+import numpy as np
+
+from .case import COST_PER_CASE, PROBABILITIES, SKINS
+from .flipper import BUY_PRICE_PER_UNIT
+from .monte_carlo import CaseTables
+from .tradeup import COST_PER_ATTEMPT, TRADE_UP_OUTCOMES, raw_probs
+
+FORMAT_VERSION = 1
+
+_COLUMNS = {
+    "item_price": np.float32,
+    "item_weight": np.float32,
+    "item_case": np.int32,
+    "item_rarity": np.uint8,
+    "case_cost": np.float32,
+    "case_rarity_prob": np.float32,
+    "case_pool_start": np.int64,
+    "item_name_offsets": np.int64,
+    "case_name_offsets": np.int64,
+}
+_SUFFIX = {np.float32: "f32", np.int32: "i32", np.uint8: "u8", np.int64: "i64"}
+
+
+class CaseDefinition(NamedTuple):
+    """One case in the same shape as the scenes' tables.
+
+    ``skins`` maps rarity -> {item name: price}, ``probabilities`` maps rarity
+    -> odds. ``weights`` optionally maps item name -> relative drop weight
+    within its pool (uniform otherwise, as in a real case).
+    """
+    cost: float
+    skins: Mapping[str, Mapping[str, float]]
+    probabilities: Mapping[str, float]
+    weights: Mapping[str, float] = None
+
+
+# --- WRITING ---
+
+def _write_strings(directory, name, strings):
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(e) for e in encoded])
+    (directory / f"{name}.bin").write_bytes(b"".join(encoded))
+    return offsets
+
+
+def write_store(path, cases: Mapping[str, CaseDefinition], loose_items: Mapping[str, float] = None,
+                price_snapshots=None):
+    """Write ``cases`` (and optional case-less ``loose_items``) as a store at ``path``.
+
+    ``price_snapshots`` is an optional (S, N) array of extra price rows in item
+    ID order; the prices in the definitions are always snapshot 0.
+    """
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    loose_items = loose_items or {}
+
+    rarities = []
+    for case in cases.values():
+        rarities += [r for r in case.probabilities if r not in rarities]
+    rarity_index = {r: i for i, r in enumerate(rarities)}
+
+    names, prices, weights, owners, item_rarities = [], [], [], [], []
+    costs = np.zeros(len(cases), dtype=np.float32)
+    rarity_probs = np.zeros((len(cases), len(rarities)), dtype=np.float32)
+    pool_start = np.zeros((len(cases), len(rarities) + 1), dtype=np.int64)
+    for case_id, case in enumerate(cases.values()):
+        costs[case_id] = case.cost
+        for rarity in rarities:
+            pool_start[case_id, rarity_index[rarity]] = len(names)
+            rarity_probs[case_id, rarity_index[rarity]] = case.probabilities.get(rarity, 0.0)
+            for item, price in case.skins.get(rarity, {}).items():
+                names.append(item)
+                prices.append(price)
+                weights.append((case.weights or {}).get(item, 1.0))
+                owners.append(case_id)
+                item_rarities.append(rarity_index[rarity])
+        pool_start[case_id, -1] = len(names)
+    for item, price in loose_items.items():
+        names.append(item)
+        prices.append(price)
+        weights.append(1.0)
+        owners.append(-1)
+        item_rarities.append(0)
+
+    price_rows = np.array(prices, dtype=np.float32)[None, :]
+    if price_snapshots is not None:
+        price_rows = np.vstack([price_rows, np.asarray(price_snapshots, dtype=np.float32)])
+
+    columns = {
+        "item_price": price_rows,
+        "item_weight": np.array(weights, dtype=np.float32),
+        "item_case": np.array(owners, dtype=np.int32),
+        "item_rarity": np.array(item_rarities, dtype=np.uint8),
+        "case_cost": costs,
+        "case_rarity_prob": rarity_probs,
+        "case_pool_start": pool_start,
+        "item_name_offsets": _write_strings(directory, "item_names", names),
+        "case_name_offsets": _write_strings(directory, "case_names", list(cases)),
+    }
+    for name, array in columns.items():
+        np.ascontiguousarray(array, dtype=_COLUMNS[name]).tofile(directory / f"{name}.{_SUFFIX[_COLUMNS[name]]}")
+
+    meta = {"version": FORMAT_VERSION, "num_items": len(names), "num_cases": len(cases),
+            "num_snapshots": len(price_rows), "rarities": rarities}
+    (directory / "meta.json").write_text(json.dumps(meta, indent=2))
+    return ItemStore(directory)
+
+
+# --- READING ---
+
+class ItemStore:
+    """Read-only, memory-mapped view of a store written by ``write_store``."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        meta = json.loads((self.path / "meta.json").read_text())
+        if meta["version"] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported item store version {meta['version']} in {self.path}")
+        self.rarities = meta["rarities"]
+        self.num_items, self.num_cases = meta["num_items"], meta["num_cases"]
+        self.num_snapshots = meta["num_snapshots"]
+
+        shapes = {
+            "item_price": (self.num_snapshots, self.num_items),
+            "case_rarity_prob": (self.num_cases, len(self.rarities)),
+            "case_pool_start": (self.num_cases, len(self.rarities) + 1),
+            "item_name_offsets": (self.num_items + 1,),
+            "case_name_offsets": (self.num_cases + 1,),
+        }
+        for name, dtype in _COLUMNS.items():
+            shape = shapes.get(name, (self.num_cases,) if name.startswith("case_") else (self.num_items,))
+            file = self.path / f"{name}.{_SUFFIX[dtype]}"
+            # np.memmap refuses zero-length files, so empty columns are plain arrays.
+            array = np.memmap(file, dtype=dtype, mode="r", shape=shape) if np.prod(shape) else np.zeros(shape, dtype)
+            setattr(self, name, array)
+        self._item_ids = self._case_ids = None
+
+    # Names are only decoded for lookups and display.
+    def _names(self, kind):
+        blob = (self.path / f"{kind}_names.bin").read_bytes()
+        offsets = getattr(self, f"{kind}_name_offsets")
+        return [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(len(offsets) - 1)]
+
+    def case_names(self):
+        return self._names("case")
+
+    def item_name(self, item_id):
+        offsets = self.item_name_offsets
+        with open(self.path / "item_names.bin", "rb") as handle:
+            handle.seek(offsets[item_id])
+            return handle.read(offsets[item_id + 1] - offsets[item_id]).decode("utf-8")
+
+    def item_id(self, name) -> int:
+        if self._item_ids is None:
+            self._item_ids = {}
+            for item_id, item in enumerate(self._names("item")):
+                self._item_ids.setdefault(item, item_id)
+        return self._item_ids[name]
+
+    def case_id(self, name) -> int:
+        if self._case_ids is None:
+            self._case_ids = {case: case_id for case_id, case in enumerate(self._names("case"))}
+        return self._case_ids[name]
+
+    def prices(self, snapshot=-1):
+        return self.item_price[snapshot]
+
+    def pool(self, case_id, rarity_idx):
+        """Item ID range of one rarity pool of a case."""
+        return range(int(self.case_pool_start[case_id, rarity_idx]), int(self.case_pool_start[case_id, rarity_idx + 1]))
+
+    def outcome_distribution(self, case_id, snapshot=-1):
+        """Flat (item_ids, probabilities, prices) of every possible drop from ``case_id``."""
+        start, stop = int(self.case_pool_start[case_id, 0]), int(self.case_pool_start[case_id, -1])
+        item_ids = np.arange(start, stop)
+        weights = self.item_weight[start:stop].astype(np.float64)
+        rarity = self.item_rarity[start:stop]
+        pool_weight = np.bincount(rarity, weights, minlength=len(self.rarities))
+        probs = self.case_rarity_prob[case_id].astype(np.float64)[rarity] * weights / pool_weight[rarity]
+        return item_ids, probs / probs.sum(), self.item_price[snapshot, start:stop].astype(np.float64)
+
+    def case_tables(self, case_id, snapshot=-1):
+        """``monte_carlo.CaseTables`` for one case, built from index ranges only.
+
+        Pools whose items carry unequal drop weights keep them, so sampling
+        agrees with ``outcome_distribution``.
+        """
+        prices = self.item_price[snapshot]
+        present = [r for r in range(len(self.rarities)) if len(self.pool(case_id, r))]
+        pools = [slice(self.case_pool_start[case_id, r], self.case_pool_start[case_id, r + 1]) for r in present]
+        weights = [self.item_weight[pool].astype(np.float64) for pool in pools]
+        uniform = all(np.all(w == w[0]) for w in weights)
+        return CaseTables(
+            self.case_rarity_prob[case_id, present].astype(np.float64),
+            [prices[pool].astype(np.float64) for pool in pools],
+            [self.rarities[r] for r in present],
+            pool_weights=None if uniform else weights,
+        )
+
+
+# --- THE VIDEOS' DATA ---
+
+def default_cases():
+    """The Fever Case and the trade-up contract from the scenes, as ``CaseDefinition``s."""
+    return {
+        "Fever Case": CaseDefinition(COST_PER_CASE, SKINS, PROBABILITIES),
+        "Trade-Up Contract": CaseDefinition(COST_PER_ATTEMPT, {"Outcome": TRADE_UP_OUTCOMES}, {"Outcome": 1.0},
+                                            dict(zip(TRADE_UP_OUTCOMES, raw_probs))),
+    }
+
+
+def build_default_store(path):
+    return write_store(path, default_cases(), loose_items={"AK-47 | Slate": BUY_PRICE_PER_UNIT})
+
+
+if __name__ == "__main__":
+    import sys
+
+    print(build_default_store(sys.argv[1] if len(sys.argv) > 1 else "item_store").path)
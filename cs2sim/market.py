@@ -0,0 +1,258 @@
+"""Event-driven limit order book for the flipper's sell-off.
+
+``FlipperAnimation`` sells all ``NUM_UNITS`` at the day's walk price times
+the Steam fee, as if the market could absorb any quantity at that price. Here
+the walk is only the *fundamental* price that background traders anchor on.
+What the flipper actually receives comes from a limit order book:
+
+* Background buyers and sellers arrive as Poisson processes. Each posts a
+  limit order a random distance from the fundamental; orders near it trade,
+  orders further out rest in the book until they are filled or expire.
+* The flipper follows a sell schedule of ``SellOrder``s. A market order
+  sells straight into the highest buy orders, walking down the book. A
+  listing rests as an ask until buyers reach it.
+
+Bids and asks are heaps of integer-cent prices with arrival-order tiebreaks
+(price-time priority). Expired orders are dropped lazily when they surface
+at the top of a book, and the books are compacted once a day. Every arrival
+is drawn up front with NumPy, so the event queue is one pre-sorted array,
+and only the stretch of it around the flipper's schedule is processed.
+Each path of a sweep replays the same background market for every schedule,
+so the schedules are compared on common random numbers. Slippage is
+measured against the fundamental at submission of every scheduled unit, with
+units still unsold at the horizon marked at the final fundamental, so a
+listing that never fills is not flattered by only counting what it sold:
+
+    results = sweep_schedules({"dump": dump(), "twap": twap(), "list +3%": listing(premium=0.03)}, num_paths=2_000)
+    results["dump"].slippage.mean(), results["twap"].slippage_bps.mean()
+"""
+import heapq
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+from .flipper import BUY_PRICE_PER_UNIT, DAILY_PRICE_CHANGE_RANGE, DAYS_TO_SIMULATE, NUM_UNITS, STEAM_FEE_MULTIPLIER
+
+MIN_PRICE_CENTS = 3  # Steam's lowest listing price
+BUY, SELL, FLIPPER = 0, 1, 2  # event kinds
+
+
+class MarketParams(NamedTuple):
+    orders_per_day: float = 400.0       # background orders per day, buyers and sellers together
+    buy_fraction: float = 0.5
+    spread: float = 0.02                # mean distance of a background limit price from the fundamental
+    dispersion: float = 0.03            # spread of that distance; the tail that crosses the fundamental trades at once
+    mean_quantity: float = 1.5          # geometric order sizes
+    order_lifetime: float = 3.0         # days; exponentially distributed
+    fee_multiplier: float = STEAM_FEE_MULTIPLIER
+
+
+class SellOrder(NamedTuple):
+    day: float                  # time of submission, in days
+    units: int
+    premium: float = None       # None = sell into the buy orders now; else list at fundamental * (1 + premium)
+
+
+class SaleResult(NamedTuple):
+    """What one schedule realised; the fields are floats for one path and arrays for a sweep."""
+    proceeds: float             # dollars received after the fee
+    units_sold: int
+    units_unsold: int           # scheduled units still held at the horizon
+    average_price: float        # buyer-paid price per unit sold
+    benchmark: float            # after-fee fundamental value, at submission, of every scheduled unit
+    unsold_value: float         # after-fee fundamental value, at the horizon, of the unsold units
+    events: int                 # order events processed (see ``simulate_sale``'s warmup)
+
+    @property
+    def slippage(self):
+        return self.benchmark - self.proceeds - self.unsold_value
+
+    @property
+    def slippage_bps(self):
+        with np.errstate(divide="ignore", invalid="ignore"):  # nan for an empty schedule
+            return 1e4 * np.divide(self.slippage, self.benchmark)
+
+
+# --- SELL SCHEDULES ---
+
+def dump(units=NUM_UNITS, day=DAYS_TO_SIMULATE - 1):
+    """Everything into the buy orders at once, as the animation assumes."""
+    return [SellOrder(day, units)]
+
+
+def twap(units=NUM_UNITS, start=DAYS_TO_SIMULATE - 10, end=DAYS_TO_SIMULATE, slices=40):
+    """Equal market sells spread evenly over [start, end)."""
+    sizes = np.diff(np.linspace(0, units, slices + 1).round().astype(int))
+    return [SellOrder(day, int(size)) for day, size in zip(np.linspace(start, end, slices, endpoint=False), sizes) if size]
+
+
+def listing(units=NUM_UNITS, day=DAYS_TO_SIMULATE - 10, premium=0.03):
+    """List everything at once, ``premium`` above the fundamental, and wait for buyers."""
+    return [SellOrder(day, units, premium)]
+
+
+# --- SIMULATION ---
+
+def fundamental_walk(num_days, rng, start=BUY_PRICE_PER_UNIT, daily_change_range=DAILY_PRICE_CHANGE_RANGE):
+    """The flipper's biased daily random walk, one price per day (day 0 = ``start``)."""
+    steps = rng.uniform(*daily_change_range, size=num_days)
+    return np.maximum(start + np.concatenate([[0.0], np.cumsum(steps)]), MIN_PRICE_CENTS / 100)
+
+
+def _background_orders(num_days, fundamental, rng, params):
+    """Every background order of a path as (time, kind, price in cents, quantity, expiry) arrays, in time order."""
+    count = rng.poisson(params.orders_per_day * num_days)
+    times = np.sort(rng.uniform(0.0, num_days, count))
+    kinds = np.where(rng.random(count) < params.buy_fraction, BUY, SELL)
+    # Positive offsets are passive: buyers bid below the fundamental, sellers ask above it.
+    offset = rng.normal(params.spread, params.dispersion, count)
+    sign = np.where(kinds == BUY, -1.0, 1.0)
+    prices = np.rint(fundamental[times.astype(np.int64)] * (1.0 + sign * offset) * 100)
+    prices = np.maximum(prices, MIN_PRICE_CENTS).astype(np.int64)
+    quantities = rng.geometric(1.0 / params.mean_quantity, count)
+    expiries = times + rng.exponential(params.order_lifetime, count)
+    return times, kinds, prices, quantities, expiries
+
+
+def _compact(book, now):
+    live = [order for order in book if order[2] >= now]
+    heapq.heapify(live)
+    return live
+
+
+def simulate_sale(schedule, rng=None, params=MarketParams(), num_days=DAYS_TO_SIMULATE, warmup=None):
+    """Run one path of the market with the flipper following ``schedule``.
+
+    Only the events from ``warmup`` days (default: five order lifetimes)
+    before the flipper's first order are processed: by then the book has
+    forgotten its empty start. After the last market order nothing more can
+    happen to the flipper, unless a listing is still waiting for buyers.
+    The whole horizon is still drawn, so every schedule sees the same market.
+    """
+    rng = np.random.default_rng(rng)
+    fundamental = fundamental_walk(num_days, rng)
+    times, kinds, prices, quantities, expiries = _background_orders(num_days, fundamental, rng, params)
+
+    schedule = sorted(schedule, key=lambda order: order.day)
+    if schedule:
+        warmup = 5 * params.order_lifetime if warmup is None else warmup
+        first = np.searchsorted(times, schedule[0].day - warmup)
+        last = len(times) if any(order.premium is not None for order in schedule) else \
+            np.searchsorted(times, schedule[-1].day, side="right")
+        times, kinds, prices, quantities, expiries = (column[first:last] for column in (times, kinds, prices, quantities, expiries))
+
+    # The flipper's orders join the event queue; a stable sort keeps them after same-time arrivals.
+    own_times = np.array([order.day for order in schedule], dtype=np.float64)
+    own_fundamental = fundamental[np.minimum(own_times.astype(np.int64), num_days)]
+    own_prices = np.array([0 if order.premium is None else max(int(round(f * (1 + order.premium) * 100)), MIN_PRICE_CENTS)
+                           for order, f in zip(schedule, own_fundamental)], dtype=np.int64)
+    event_order = np.argsort(np.concatenate([times, own_times]), kind="stable")
+    columns = (np.concatenate([times, own_times]), np.concatenate([kinds, np.full(len(schedule), FLIPPER)]),
+               np.concatenate([prices, own_prices]), np.concatenate([quantities, [o.units for o in schedule]]),
+               np.concatenate([expiries, np.full(len(schedule), np.inf)]))
+    events = zip(*(column[event_order].tolist() for column in columns))
+
+    # Book entries are mutable [key, seq, expiry, quantity, own]: key is the price for asks and
+    # -price for bids, so both heaps pop their best order first. own marks the flipper's asks.
+    bids, asks = [], []
+    cents_sold = units_sold = 0
+    next_compaction = float(int(times[0]) + 1) if len(times) else 0.0
+    heappush, heappop = heapq.heappush, heapq.heappop
+    for seq, (now, kind, price, quantity, expiry) in enumerate(events):
+        if now >= next_compaction:
+            bids, asks = _compact(bids, now), _compact(asks, now)
+            next_compaction = float(int(now) + 1)
+
+        if kind == BUY:
+            while quantity and asks:
+                best = asks[0]
+                if best[2] < now:
+                    heappop(asks)
+                    continue
+                if best[0] > price:
+                    break
+                fill = min(quantity, best[3])
+                if best[4]:
+                    cents_sold += fill * best[0]
+                    units_sold += fill
+                quantity -= fill
+                best[3] -= fill
+                if not best[3]:
+                    heappop(asks)
+            if quantity:
+                heappush(bids, [-price, seq, expiry, quantity, 0.0])
+            continue
+
+        # Background sellers and the flipper both sell into the bids, best first.
+        own = kind == FLIPPER
+        while quantity and bids:
+            best = bids[0]
+            if best[2] < now:
+                heappop(bids)
+                continue
+            if -best[0] < price:
+                break
+            fill = min(quantity, best[3])
+            if own:
+                cents_sold -= fill * best[0]
+                units_sold += fill
+            quantity -= fill
+            best[3] -= fill
+            if not best[3]:
+                heappop(bids)
+        # Unfilled background sells and flipper listings rest in the book; a flipper market order's rest goes unsold.
+        if quantity and (not own or price):
+            heappush(asks, [price, seq, expiry, quantity, own])
+
+    fee = params.fee_multiplier
+    units = np.array([order.units for order in schedule], dtype=np.int64)
+    units_unsold = int(units.sum()) - units_sold
+    return SaleResult(fee * cents_sold / 100, units_sold, units_unsold,
+                      cents_sold / 100 / units_sold if units_sold else np.nan,
+                      fee * float(units @ own_fundamental), fee * units_unsold * float(fundamental[num_days]), len(event_order))
+
+
+# --- SWEEPS ---
+
+def _run_block(task):
+    schedules, params, num_days, path_seqs = task
+    # Every schedule replays the same market: one child seed per path, reused across schedules.
+    return {name: [simulate_sale(schedule, np.random.default_rng(seq), params, num_days) for seq in path_seqs]
+            for name, schedule in schedules.items()}
+
+
+def sweep_schedules(schedules, num_paths=1_000, seed=42, params=MarketParams(), num_days=DAYS_TO_SIMULATE,
+                    block_size=50, workers=0):
+    """Simulate ``num_paths`` markets for every named schedule in ``schedules``.
+
+    Returns ``{name: SaleResult}`` whose fields are arrays over paths. As in
+    ``sweep.run_sweep``, path ``i`` always draws from the same ``SeedSequence``
+    child, so the numbers do not depend on ``workers`` or ``block_size``.
+    """
+    path_seqs = np.random.SeedSequence(seed).spawn(num_paths)
+    tasks = [(schedules, params, num_days, path_seqs[start:start + block_size]) for start in range(0, num_paths, block_size)]
+    if workers == 0:
+        blocks = [_run_block(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers or os.cpu_count()) as pool:
+            blocks = list(pool.map(_run_block, tasks))
+    per_path = {name: [] for name in schedules}
+    for block in blocks:
+        for name, results in block.items():
+            per_path[name] += results
+    return {name: SaleResult(*map(np.array, zip(*results))) for name, results in per_path.items()}
+
+
+if __name__ == "__main__":
+    schedules = {"dump": dump(), "twap 10 days": twap(), "list +3%": listing(premium=0.03), "list +0%": listing(premium=0.0)}
+    start = time.perf_counter()
+    results = sweep_schedules(schedules, num_paths=400, workers=None)
+    elapsed = time.perf_counter() - start
+    for name, result in results.items():
+        print(f"{name:>13}: proceeds ${result.proceeds.mean():7.2f}  sold {result.units_sold.mean():5.1f}/{NUM_UNITS}  "
+              f"unsold ${result.unsold_value.mean():6.2f}  slippage ${result.slippage.mean():6.2f} ({np.nanmean(result.slippage_bps):6.1f} bps)")
+    events = sum(int(result.events.sum()) for result in results.values())
+    print(f"{events:,} order events in {elapsed:.1f} s ({events / elapsed:,.0f} events/s)")
@@ -0,0 +1,139 @@
+"""Batch Monte Carlo engines that simulate many independent paths at once.
+
+The scenes each animate a single seeded story; these functions run the same
+models for thousands or millions of paths so the story can be put in context.
+"""
+import numpy as np
+
+from .case import COST_PER_CASE, NUM_CASES_TO_OPEN, PROBABILITIES, SKINS, STARTING_BALANCE
+from .flipper import BUY_PRICE_PER_UNIT, DAILY_PRICE_CHANGE_RANGE, DAYS_TO_SIMULATE
+from .tradeup import COST_PER_ATTEMPT, NUM_ATTEMPTS, STEAM_FEE_MULTIPLIER, TRADE_UP_OUTCOMES
+from .tradeup import PROBABILITIES as TRADE_UP_PROBABILITIES
+from .tradeup import STARTING_BALANCE as TRADE_UP_STARTING_BALANCE
+
+# --- CASE OPENING ---
+
+class CaseTables:
+    """Flat lookup tables for sampling a case in bulk.
+
+    Rarities are drawn by a binary search in ``rarity_cdf`` and skins by a
+    uniform index into the rarity's row of ``values`` (padded with zeros).
+    When ``pool_weights`` gives per-skin drop weights, skins are drawn by a
+    binary search in ``skin_cdf`` instead: row ``r`` holds ``r`` plus the
+    pool's cumulative weights (padded with ``r + 1``), so one flat
+    ``searchsorted`` serves every rarity at once.
+    """
+
+    def __init__(self, rarity_probs, pool_values, rarities=None, names=None, pool_weights=None):
+        probs = np.asarray(rarity_probs, dtype=np.float64)
+        self.rarities = list(rarities) if rarities is not None else list(range(len(probs)))
+        self.rarity_cdf = np.cumsum(probs / probs.sum())
+        self.rarity_cdf[-1] = 1.0  # guard against round-off leaving a gap at the top
+
+        self.pool_sizes = np.array([len(pool) for pool in pool_values], dtype=np.int64)
+        self.values = np.zeros((len(probs), self.pool_sizes.max()), dtype=np.float64)
+        for row, pool in enumerate(pool_values):
+            self.values[row, :len(pool)] = pool
+        self.names = names
+
+        self.skin_cdf = None
+        if pool_weights is not None:
+            self.skin_cdf = np.ones_like(self.values)
+            for row, weights in enumerate(pool_weights):
+                weights = np.asarray(weights, dtype=np.float64)
+                self.skin_cdf[row, :len(weights)] = np.cumsum(weights / weights.sum())
+                self.skin_cdf[row, len(weights) - 1] = 1.0
+            self.skin_cdf += np.arange(len(probs))[:, None]
+            self.skin_cdf = self.skin_cdf.ravel()
+
+    @property
+    def skin_probs(self):
+        """(rarities, max pool) probability of each skin within its rarity."""
+        if self.skin_cdf is None:
+            return (np.arange(self.values.shape[1]) < self.pool_sizes[:, None]) / self.pool_sizes[:, None]
+        cdf = self.skin_cdf.reshape(self.values.shape) - np.arange(len(self.values))[:, None]
+        return np.diff(cdf, axis=1, prepend=0.0)
+
+    @classmethod
+    def from_dicts(cls, skins, probabilities):
+        """Build from the ``SKINS``/``PROBABILITIES`` dict shape used by the case scene."""
+        rarities = list(probabilities.keys())
+        return cls([probabilities[r] for r in rarities], [list(skins[r].values()) for r in rarities],
+                   rarities, [list(skins[r].keys()) for r in rarities])
+
+    def sample(self, rng, size):
+        """Draw ``size`` case openings, returning (rarity_idx, skin_idx, value) arrays."""
+        rarity_idx = np.searchsorted(self.rarity_cdf, rng.random(size), side="right")
+        skin_idx = self.sample_skins(rng, rarity_idx)
+        return rarity_idx, skin_idx, self.values[rarity_idx, skin_idx]
+
+    def sample_skins(self, rng, rarity_idx):
+        """Draw one skin index within each given rarity."""
+        u = rng.random(np.shape(rarity_idx))
+        if self.skin_cdf is None:
+            return (u * self.pool_sizes[rarity_idx]).astype(np.int64)
+        flat = np.searchsorted(self.skin_cdf, rarity_idx + u, side="right")
+        return flat - rarity_idx * self.values.shape[1]
+
+
+FEVER_CASE = CaseTables.from_dicts(SKINS, PROBABILITIES)
+
+
+def simulate_case_paths(num_paths, num_weeks=NUM_CASES_TO_OPEN, starting_balance=STARTING_BALANCE,
+                        cost_per_case=COST_PER_CASE, tables=FEVER_CASE, rng=None, dtype=np.float64):
+    """Simulate ``num_paths`` independent case-opening runs.
+
+    Each week a path opens one case if its balance covers ``cost_per_case``,
+    exactly like ``CaseOpeningAnimation``; once a path drops below the cost it
+    stops opening and its balance is frozen.
+
+    Returns a (num_paths, num_weeks) matrix of balances after each week.
+    """
+    rng = np.random.default_rng(rng)
+    balances = np.empty((num_paths, num_weeks), dtype=dtype)
+    current = np.full(num_paths, starting_balance, dtype=np.float64)
+
+    for week in range(num_weeks):
+        opening = current >= cost_per_case
+        _, _, value = tables.sample(rng, num_paths)
+        current += np.where(opening, value - cost_per_case, 0.0)
+        balances[:, week] = current
+
+    return balances
+
+
+# --- TRADE-UPS ---
+
+def simulate_tradeup_paths(num_paths, num_attempts=NUM_ATTEMPTS, starting_balance=TRADE_UP_STARTING_BALANCE,
+                           cost_per_attempt=COST_PER_ATTEMPT, fee_multiplier=STEAM_FEE_MULTIPLIER,
+                           outcome_values=tuple(TRADE_UP_OUTCOMES.values()),
+                           probabilities=tuple(TRADE_UP_PROBABILITIES), rng=None, dtype=np.float64):
+    """Simulate ``num_paths`` trade-up runs, returning a (num_paths, num_attempts) balance matrix.
+
+    Like ``TradeUpAnimation`` every attempt is made regardless of balance.
+    """
+    rng = np.random.default_rng(rng)
+    probs = np.asarray(probabilities, dtype=np.float64)
+    cdf = np.cumsum(probs / probs.sum())
+    cdf[-1] = 1.0
+    net = np.asarray(outcome_values, dtype=np.float64) * fee_multiplier - cost_per_attempt
+    outcome_idx = np.searchsorted(cdf, rng.random((num_paths, num_attempts)), side="right")
+    return (starting_balance + np.cumsum(net[outcome_idx], axis=1)).astype(dtype, copy=False)
+
+
+# --- SKIN FLIPPING ---
+
+def simulate_flipper_paths(num_paths, num_days=DAYS_TO_SIMULATE, buy_price=BUY_PRICE_PER_UNIT,
+                           daily_change_range=DAILY_PRICE_CHANGE_RANGE, rng=None, dtype=np.float64):
+    """Simulate ``num_paths`` per-unit price walks, returning a (num_paths, num_days) matrix."""
+    rng = np.random.default_rng(rng)
+    low, high = daily_change_range
+    steps = rng.uniform(low, high, size=(num_paths, num_days))
+    return (buy_price + np.cumsum(steps, axis=1)).astype(dtype, copy=False)
+
+
+def iter_flipper_chunks(num_paths, chunk_size=100_000, rng=None, **kwargs):
+    """Yield price matrices of at most ``chunk_size`` paths until ``num_paths`` have been produced."""
+    rng = np.random.default_rng(rng)
+    for start in range(0, num_paths, chunk_size):
+        yield simulate_flipper_paths(min(chunk_size, num_paths - start), rng=rng, **kwargs)
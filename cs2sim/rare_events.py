@@ -0,0 +1,261 @@
+"""Variance-reduced estimates of tail probabilities for case opening.
+
+Nearly all of the Fever Case upside comes from a handful of rare rarities
+(Red, ST_Red and the Gold knives), so plain Monte Carlo spends most of its
+paths on runs that can never end in profit. Two estimators target those
+runs directly:
+
+* ``importance_sampling`` draws rarities from tilted odds and reweights
+  every path by its likelihood ratio. By default the odds are tilted
+  exponentially so that the average tilted run ends at the threshold
+  (``exponential_tilt``).
+* ``stratified`` splits the runs by how many of their draws land in each tail
+  rarity. The odds of every count are exact (multinomial), so each stratum is
+  only sampled enough to pin down its own conditional probability.
+
+Which to use depends on how far out the threshold is. Near the starting
+balance (P(profit) is about 0.14) success hinges on one or two tail draws.
+That is exactly what the strata resolve, so ``stratified`` gains two orders
+of magnitude. The derived tilt only manages about 2.5x there, and no
+reweighting of the rarity odds gets past about 4x, because the event is not
+rare enough. Far out (a $1000 finish takes several
+knives) most of the probability sits in the last, catch-all stratum. There
+the mean-shifting tilt wins: about 50x at $1000 and far more beyond.
+
+Each returns an ``Estimate`` whose ``ess`` is the number of plain Monte Carlo
+paths that would give the same standard error:
+
+    plain_monte_carlo(1_000_000)                   # baseline
+    stratified(20_000)                             # P(profit): same precision, ~80x fewer paths
+    importance_sampling(100_000, threshold=1000)   # far tails: ~50x
+"""
+import itertools
+from math import comb, factorial, prod
+from typing import NamedTuple
+
+import numpy as np
+
+from .case import COST_PER_CASE, NUM_CASES_TO_OPEN, STARTING_BALANCE
+from .monte_carlo import FEVER_CASE
+
+TAIL_RARITIES = ("Red", "ST_Red", "Gold")
+
+
+class Estimate(NamedTuple):
+    estimate: float
+    std_error: float
+    ess: float       # plain Monte Carlo paths with the same standard error
+    num_paths: int
+
+    @property
+    def variance_reduction(self):
+        """How many times fewer paths this took than plain Monte Carlo would."""
+        return self.ess / self.num_paths if self.num_paths else 0.0
+
+
+def _estimate(estimate, variance, num_paths):
+    bernoulli = estimate * (1.0 - estimate)
+    ess = bernoulli / variance if variance > 0 else float(num_paths)
+    return Estimate(float(estimate), float(np.sqrt(variance)), float(ess), int(num_paths))
+
+
+# --- PATH SIMULATION ---
+
+def _run_paths(rarity_idx, rng, tables, starting_balance, cost_per_case):
+    """Final balances of paths whose per-week rarities are fixed up front.
+
+    Skins are drawn within each rarity by ``tables``. As in
+    ``simulate_case_paths`` a path stops opening once its balance drops below
+    the cost, so draws after that point are never used; ``opened`` marks the
+    ones that were.
+    """
+    skin_idx = tables.sample_skins(rng, rarity_idx)
+    net = tables.values[rarity_idx, skin_idx] - cost_per_case
+    balance = np.full(len(rarity_idx), starting_balance, dtype=np.float64)
+    opened = np.empty(rarity_idx.shape, dtype=bool)
+    for week in range(rarity_idx.shape[1]):
+        opened[:, week] = balance >= cost_per_case
+        balance += np.where(opened[:, week], net[:, week], 0.0)
+    return balance, opened
+
+
+def _rarity_probs(tables):
+    return np.diff(tables.rarity_cdf, prepend=0.0)
+
+
+def _rarity_means(tables):
+    return (tables.values * tables.skin_probs).sum(axis=1)
+
+
+def _tail_index(tables, tail_rarities):
+    return np.array([tables.rarities.index(r) for r in tail_rarities], dtype=np.int64)
+
+
+# --- ESTIMATORS ---
+
+def plain_monte_carlo(num_paths, threshold=STARTING_BALANCE, num_cases=NUM_CASES_TO_OPEN,
+                      starting_balance=STARTING_BALANCE, cost_per_case=COST_PER_CASE, tables=FEVER_CASE, rng=None):
+    """Baseline estimate of P(final balance > ``threshold``)."""
+    rng = np.random.default_rng(rng)
+    rarity_idx = np.searchsorted(tables.rarity_cdf, rng.random((num_paths, num_cases)), side="right")
+    final, _ = _run_paths(rarity_idx, rng, tables, starting_balance, cost_per_case)
+    hits = final > threshold
+    return _estimate(hits.mean(), hits.var(ddof=1) / num_paths, num_paths)
+
+
+def exponential_tilt(threshold=STARTING_BALANCE, num_cases=NUM_CASES_TO_OPEN, starting_balance=STARTING_BALANCE,
+                     cost_per_case=COST_PER_CASE, tables=FEVER_CASE):
+    """Rarity tilt factors under which the average run ends at ``threshold``.
+
+    The odds become ``q_r ~ p_r * exp(theta * m_r)``, where ``m_r`` is the mean
+    drop value of rarity ``r``. ``theta`` is solved by bisection so that the
+    expected drop under ``q`` covers the cost plus an equal share of
+    ``threshold - starting_balance`` every week. Thresholds the untilted
+    odds already reach on average get no tilt.
+    """
+    probs, means = _rarity_probs(tables), _rarity_means(tables)
+    target = cost_per_case + (threshold - starting_balance) / num_cases
+    if target <= probs @ means:
+        return {rarity: 1.0 for rarity in tables.rarities}
+    target = min(target, means.max() - 1e-9 * np.ptp(means))
+
+    def tilted(theta):
+        q = probs * np.exp(theta * (means - means.max()))
+        return q / q.sum()
+
+    low, high = 0.0, 1.0 / np.ptp(means)
+    while tilted(high) @ means < target:
+        low, high = high, 2 * high
+    for _ in range(100):
+        middle = (low + high) / 2
+        low, high = (middle, high) if tilted(middle) @ means < target else (low, middle)
+    return dict(zip(tables.rarities, (tilted(high) / probs).tolist()))
+
+
+def importance_sampling(num_paths, threshold=STARTING_BALANCE, tilt=None, num_cases=NUM_CASES_TO_OPEN,
+                        starting_balance=STARTING_BALANCE, cost_per_case=COST_PER_CASE, tables=FEVER_CASE, rng=None):
+    """Estimate P(final balance > ``threshold``) with rarity odds multiplied by ``tilt``.
+
+    ``tilt`` maps rarity -> factor applied to its odds before renormalizing,
+    and defaults to ``exponential_tilt`` for this threshold. Each path is
+    weighted by the product of p/q over the cases it actually opened, so the
+    estimate stays unbiased for any tilt.
+    """
+    rng = np.random.default_rng(rng)
+    probs = _rarity_probs(tables)
+    if tilt is None:
+        tilt = exponential_tilt(threshold, num_cases, starting_balance, cost_per_case, tables)
+    tilted = probs * np.array([tilt.get(r, 1.0) for r in tables.rarities])
+    tilted /= tilted.sum()
+    cdf = np.cumsum(tilted)
+    cdf[-1] = 1.0
+
+    rarity_idx = np.searchsorted(cdf, rng.random((num_paths, num_cases)), side="right")
+    final, opened = _run_paths(rarity_idx, rng, tables, starting_balance, cost_per_case)
+    log_ratio = np.where(opened, np.log(probs / tilted)[rarity_idx], 0.0).sum(axis=1)
+    weighted = np.where(final > threshold, np.exp(log_ratio), 0.0)
+    return _estimate(weighted.mean(), weighted.var(ddof=1) / num_paths, num_paths)
+
+
+def tail_strata(num_cases=NUM_CASES_TO_OPEN, tables=FEVER_CASE, tail_rarities=TAIL_RARITIES, max_tail=4):
+    """Every count vector over ``tail_rarities`` with at most ``max_tail`` draws, and its exact probability.
+
+    The counts are over all ``num_cases`` draws, used or not, so they follow a
+    multinomial distribution even though the barrier may stop a path early.
+    Runs with more than ``max_tail`` tail draws form one extra stratum, keyed
+    ``None``, holding the remaining probability.
+    """
+    tail_probs = _rarity_probs(tables)[_tail_index(tables, tail_rarities)]
+    body_prob = 1.0 - tail_probs.sum()
+    strata = {}
+    for counts in itertools.product(range(max_tail + 1), repeat=len(tail_rarities)):
+        total = sum(counts)
+        if total > max_tail:
+            continue
+        ways = comb(num_cases, total) * factorial(total) // prod(factorial(k) for k in counts)
+        strata[counts] = float(ways * np.prod(tail_probs ** np.array(counts)) * body_prob ** (num_cases - total))
+    strata[None] = max(1.0 - sum(strata.values()), 0.0)
+    return strata
+
+
+def _sample_stratum(counts, num_paths, rng, num_cases, tables, tail, max_tail):
+    probs = _rarity_probs(tables)
+    body = np.setdiff1d(np.arange(len(probs)), tail)
+    body_cdf = np.cumsum(probs[body] / probs[body].sum())
+    body_cdf[-1] = 1.0
+    rarity_idx = body[np.searchsorted(body_cdf, rng.random((num_paths, num_cases)), side="right")]
+
+    tail_probs = probs[tail] / probs[tail].sum()
+    if counts is None:
+        # More than max_tail tail draws: the count from the truncated binomial, then which rarities.
+        k = np.arange(max_tail + 1, num_cases + 1)
+        p_tail = probs[tail].sum()
+        pmf = np.array([comb(num_cases, n) for n in k], dtype=np.float64)
+        pmf *= p_tail ** k * (1.0 - p_tail) ** (num_cases - k)
+        totals = k[np.searchsorted(np.cumsum(pmf / pmf.sum()), rng.random(num_paths), side="right").clip(0, len(k) - 1)]
+        tail_cdf = np.cumsum(tail_probs)
+        tail_cdf[-1] = 1.0
+        draws = tail[np.searchsorted(tail_cdf, rng.random((num_paths, num_cases)), side="right")]
+    else:
+        totals = np.full(num_paths, sum(counts))
+        draws = np.broadcast_to(np.repeat(tail, counts), (num_paths, sum(counts)))
+        draws = np.pad(draws, ((0, 0), (0, num_cases - sum(counts))))
+
+    # Scatter the tail draws over uniformly random weeks.
+    weeks = np.argsort(rng.random((num_paths, num_cases)), axis=1)
+    in_tail = np.arange(num_cases) < totals[:, None]
+    rows = np.broadcast_to(np.arange(num_paths)[:, None], weeks.shape)
+    rarity_idx[rows[in_tail], weeks[in_tail]] = draws[in_tail]
+    return rarity_idx
+
+
+def stratified(num_paths, threshold=STARTING_BALANCE, tail_rarities=TAIL_RARITIES, max_tail=4, pilot_fraction=0.2,
+               num_cases=NUM_CASES_TO_OPEN, starting_balance=STARTING_BALANCE, cost_per_case=COST_PER_CASE,
+               tables=FEVER_CASE, rng=None):
+    """Estimate P(final balance > ``threshold``) stratified by tail-rarity counts.
+
+    A pilot of ``pilot_fraction`` of the paths is spread evenly over the
+    strata from ``tail_strata``. The rest go to each stratum in proportion
+    to its probability times its pilot standard deviation (Neyman
+    allocation), so strata that can never, or will always, end in profit
+    get almost nothing.
+    """
+    rng = np.random.default_rng(rng)
+    strata = tail_strata(num_cases, tables, tail_rarities, max_tail)
+    tail = _tail_index(tables, tail_rarities)
+    keys = [key for key, prob in strata.items() if prob > 0]
+    weights = np.array([strata[key] for key in keys])
+
+    def sample(key, n):
+        rarity_idx = _sample_stratum(key, n, rng, num_cases, tables, tail, max_tail)
+        final, _ = _run_paths(rarity_idx, rng, tables, starting_balance, cost_per_case)
+        return np.count_nonzero(final > threshold)
+
+    pilot = max(2, int(num_paths * pilot_fraction) // len(keys))
+    counts = np.full(len(keys), pilot)
+    hits = np.array([sample(key, pilot) for key in keys], dtype=np.float64)
+
+    # Keep a little spread for strata whose pilot saw no variation at all.
+    p_hat = (hits + 0.5) / (counts + 1.0)
+    share = weights * np.sqrt(p_hat * (1.0 - p_hat))
+    extra = np.floor(max(num_paths - counts.sum(), 0) * share / share.sum()).astype(np.int64)
+    for i, key in enumerate(keys):
+        if extra[i]:
+            hits[i] += sample(key, extra[i])
+    counts += extra
+
+    means = hits / counts
+    variance = (weights ** 2 * means * (1.0 - means) / np.maximum(counts - 1, 1)).sum()
+    return _estimate(weights @ means, variance, counts.sum())
+
+
+ESTIMATORS = {"plain": plain_monte_carlo, "importance": importance_sampling, "stratified": stratified}
+
+
+if __name__ == "__main__":
+    for threshold in (STARTING_BALANCE, 1000):
+        print(f"P(final balance > {threshold:g})")
+        for name, budget in (("plain", 1_000_000), ("importance", 100_000), ("stratified", 20_000)):
+            result = ESTIMATORS[name](budget, threshold=threshold, rng=1)
+            print(f"{name:>12}: {result.estimate:.6f} ± {result.std_error:.6f}  "
+                  f"paths={result.num_paths:>9,}  ESS={result.ess:>12,.0f}  ({result.variance_reduction:.1f}x)")
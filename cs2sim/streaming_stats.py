@@ -0,0 +1,155 @@
+"""Constant-memory statistics over streams of simulated paths.
+
+Paths arrive in NumPy chunks and are folded into per-step accumulators, so the
+memory used depends on the number of steps (days, weeks) and never on how many
+paths have been simulated.
+"""
+import numpy as np
+
+from .flipper import BREAK_EVEN_PORTFOLIO_VALUE, BUY_PRICE_PER_UNIT, NUM_UNITS
+from .monte_carlo import iter_flipper_chunks
+
+# --- ACCUMULATORS ---
+
+class RunningMoments:
+    """Per-column count, mean and variance, merged chunk by chunk (Chan et al.)."""
+
+    def __init__(self, num_columns):
+        self.count = 0
+        self.mean = np.zeros(num_columns)
+        self._m2 = np.zeros(num_columns)
+
+    def update(self, chunk):
+        n = len(chunk)
+        if n == 0:
+            return
+        chunk_mean = chunk.mean(axis=0)
+        chunk_m2 = ((chunk - chunk_mean) ** 2).sum(axis=0)
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self.mean += delta * n / total
+        self._m2 += chunk_m2 + delta ** 2 * self.count * n / total
+        self.count = total
+
+    @property
+    def variance(self):
+        return self._m2 / max(self.count - 1, 1)
+
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+
+
+class QuantileDigest:
+    """Per-column merging t-digest with the arcsine (k1) scale function.
+
+    Every column keeps at most ``compression + 1`` centroids. Clusters are
+    narrow near the tails and wide near the median, which is where 5% and 95%
+    fan bands need their accuracy. A chunk is first compressed on its own,
+    then merged by sorting its centroids together with the existing ones and
+    re-binning on the k-scale, for all columns at once.
+
+    Zero-weight rows are empty clusters and are ignored by ``quantile``.
+    """
+
+    def __init__(self, num_columns, compression=500):
+        self.compression = compression
+        self.num_columns = num_columns
+        self.means = np.zeros((0, num_columns))
+        self.weights = np.zeros((0, num_columns))
+
+    def _clusters(self, q):
+        scale = np.arcsin(np.clip(2 * q - 1, -1, 1)) / np.pi + 0.5
+        return np.minimum((scale * self.compression).astype(np.int64), self.compression)
+
+    def _compress_chunk(self, chunk):
+        # Raw samples all weigh 1, so after sorting every column shares the same
+        # cluster boundaries and a single reduceat compresses them all.
+        n = len(chunk)
+        ordered = np.sort(chunk.T, axis=1)
+        cluster = self._clusters((np.arange(n) + 0.5) / n)
+        starts = np.flatnonzero(np.diff(cluster, prepend=-1))
+        counts = np.diff(np.append(starts, n)).astype(np.float64)
+        sums = np.add.reduceat(ordered, starts, axis=1).T
+        return sums / counts[:, None], np.repeat(counts[:, None], self.num_columns, axis=1)
+
+    def update(self, chunk):
+        if len(chunk) == 0:
+            return
+        chunk_means, chunk_weights = self._compress_chunk(chunk)
+        values = np.concatenate([self.means, chunk_means])
+        weights = np.concatenate([self.weights, chunk_weights])
+        order = np.argsort(values, axis=0, kind="stable")
+        values = np.take_along_axis(values, order, axis=0)
+        weights = np.take_along_axis(weights, order, axis=0)
+
+        cumulative = np.cumsum(weights, axis=0)
+        cluster = self._clusters((cumulative - weights / 2) / cumulative[-1])
+
+        # Flatten (cluster, column) pairs so one bincount handles every column.
+        num_clusters = self.compression + 1
+        flat = (cluster * self.num_columns + np.arange(self.num_columns)).ravel()
+        size = num_clusters * self.num_columns
+        total_weight = np.bincount(flat, weights.ravel(), size).reshape(num_clusters, self.num_columns)
+        total_value = np.bincount(flat, (values * weights).ravel(), size).reshape(num_clusters, self.num_columns)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.means = np.where(total_weight > 0, total_value / total_weight, 0.0)
+        self.weights = total_weight
+
+    def quantile(self, q):
+        """Estimate the ``q`` quantile (0-1) of every column."""
+        out = np.empty(self.num_columns)
+        for column in range(self.num_columns):
+            present = self.weights[:, column] > 0
+            means, weights = self.means[present, column], self.weights[present, column]
+            centres = (np.cumsum(weights) - weights / 2) / weights.sum()
+            out[column] = np.interp(q, centres, means)
+        return out
+
+
+# --- FLIPPER FAN CHART ---
+
+class FanChart:
+    """Per-day summary of many flipper portfolio paths; index 0 is the purchase day."""
+
+    def __init__(self, num_paths, mean, std, quantiles, prob_above_break_even):
+        self.num_paths = num_paths
+        self.mean = mean
+        self.std = std
+        self.quantiles = quantiles
+        self.prob_above_break_even = prob_above_break_even
+
+    @property
+    def days(self):
+        return np.arange(len(self.mean))
+
+
+def flipper_fan_chart(num_paths, percentiles=(5, 50, 95), chunk_size=100_000, rng=None,
+                      compression=500, break_even=BREAK_EVEN_PORTFOLIO_VALUE, **walk_kwargs):
+    """Stream ``num_paths`` flipper random walks into a FanChart of portfolio values.
+
+    ``walk_kwargs`` are passed to ``monte_carlo.simulate_flipper_paths``.
+    """
+    if num_paths <= 0:
+        raise ValueError(f"A fan chart needs at least one path, got num_paths={num_paths}")
+    moments = digest = above = None
+    for prices in iter_flipper_chunks(num_paths, chunk_size, rng=rng, **walk_kwargs):
+        values = prices * NUM_UNITS
+        if moments is None:
+            moments = RunningMoments(values.shape[1])
+            digest = QuantileDigest(values.shape[1], compression)
+            above = np.zeros(values.shape[1], dtype=np.int64)
+        moments.update(values)
+        digest.update(values)
+        above += (values > break_even).sum(axis=0)
+
+    start_value = walk_kwargs.get("buy_price", BUY_PRICE_PER_UNIT) * NUM_UNITS
+    quantiles = {p: np.concatenate([[start_value], digest.quantile(p / 100)]) for p in percentiles}
+    return FanChart(
+        num_paths,
+        mean=np.concatenate([[start_value], moments.mean]),
+        std=np.concatenate([[0.0], moments.std]),
+        quantiles=quantiles,
+        prob_above_break_even=np.concatenate([[float(start_value > break_even)], above / num_paths]),
+    )
@@ -0,0 +1,135 @@
+"""Seed x parameter sweeps for all four strategies on a process pool.
+
+Every (parameter set, seed) pair is split into fixed-size blocks of paths. Each
+block draws from its own ``SeedSequence`` child, derived only from the seed,
+the parameter index and the block index, so the numbers never depend on how
+many workers ran the sweep or in which order blocks finished. Workers write
+their block straight into a shared-memory result array; only the small task
+description is pickled.
+"""
+import inspect
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from . import monte_carlo
+from .case import NUM_CASES_TO_OPEN
+from .flipper import DAYS_TO_SIMULATE, NUM_UNITS
+from .investor import WEEKS_TO_SIMULATE
+from .investor_model import investor_history
+from .tradeup import NUM_ATTEMPTS
+
+# --- STRATEGY REGISTRY ---
+
+def _case(num_paths, rng, **params):
+    return monte_carlo.simulate_case_paths(num_paths, rng=rng, **params)
+
+
+def _tradeup(num_paths, rng, **params):
+    return monte_carlo.simulate_tradeup_paths(num_paths, rng=rng, **params)
+
+
+def _flipper(num_paths, rng, num_units=NUM_UNITS, **params):
+    return monte_carlo.simulate_flipper_paths(num_paths, rng=rng, **params) * num_units
+
+
+def _investor(num_paths, rng, **params):
+    # Deterministic model: every path of a parameter set is the same curve.
+    total = investor_history(**params).total[1:]
+    return np.broadcast_to(total, (num_paths, len(total)))
+
+
+def _num_steps(strategy, params):
+    if strategy == "case":
+        return params.get("num_weeks", NUM_CASES_TO_OPEN)
+    if strategy == "tradeup":
+        return params.get("num_attempts", NUM_ATTEMPTS)
+    if strategy == "flipper":
+        return params.get("num_days", DAYS_TO_SIMULATE)
+    return params.get("weeks_to_simulate", WEEKS_TO_SIMULATE)
+
+
+STRATEGIES = {"case": _case, "tradeup": _tradeup, "flipper": _flipper, "investor": _investor}
+_MODELS = {"case": monte_carlo.simulate_case_paths, "tradeup": monte_carlo.simulate_tradeup_paths,
+           "flipper": monte_carlo.simulate_flipper_paths, "investor": investor_history}
+
+
+def strategy_params(strategy):
+    """Names of the model parameters a sweep of ``strategy`` can set."""
+    names = [name for name in inspect.signature(_MODELS[strategy]).parameters
+             if name not in ("num_paths", "rng", "dtype", "tables")]
+    return names + ["num_units"] if strategy == "flipper" else names
+
+
+# --- WORKERS ---
+
+_result = None
+
+
+def _attach(name, shape, dtype):
+    global _result
+    memory = shared_memory.SharedMemory(name=name)
+    _result = (memory, np.ndarray(shape, dtype=dtype, buffer=memory.buf))
+
+
+def _run_block(task):
+    strategy, params, param_idx, seed_idx, start, stop, seed_seq = task
+    rng = np.random.default_rng(seed_seq)
+    _result[1][param_idx, seed_idx, start:stop] = STRATEGIES[strategy](stop - start, rng, **params)
+
+
+def _tasks(strategy, param_sets, seeds, num_paths, block_size):
+    blocks = [(start, min(start + block_size, num_paths)) for start in range(0, num_paths, block_size)]
+    for seed_idx, seed in enumerate(seeds):
+        per_param = np.random.SeedSequence(seed).spawn(len(param_sets))
+        for param_idx, (params, param_seq) in enumerate(zip(param_sets, per_param)):
+            for (start, stop), block_seq in zip(blocks, param_seq.spawn(len(blocks))):
+                yield strategy, params, param_idx, seed_idx, start, stop, block_seq
+
+
+# --- PUBLIC API ---
+
+def param_grid(**axes):
+    """Expand ``name=[values...]`` axes into a list of parameter dicts (outer product)."""
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*axes.values())]
+
+
+def run_sweep(strategy, param_sets=({},), seeds=(42,), num_paths=10_000, block_size=10_000,
+              workers=None, dtype=np.float64):
+    """Simulate ``num_paths`` paths of ``strategy`` for every parameter set and seed.
+
+    Returns an array of shape (len(param_sets), len(seeds), num_paths, steps).
+    ``workers=0`` runs everything in this process, which is handy for
+    debugging and gives exactly the same numbers as any pool size.
+    """
+    global _result
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy {strategy!r}; expected one of {sorted(STRATEGIES)}")
+    param_sets = list(param_sets)
+    steps = {_num_steps(strategy, params) for params in param_sets}
+    if len(steps) != 1:
+        raise ValueError("All parameter sets in one sweep must simulate the same number of steps")
+
+    shape = (len(param_sets), len(seeds), num_paths, steps.pop())
+    dtype = np.dtype(dtype)
+    memory = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+    try:
+        tasks = _tasks(strategy, param_sets, seeds, num_paths, block_size)
+        if workers == 0:
+            _result = (memory, np.ndarray(shape, dtype=dtype, buffer=memory.buf))
+            for task in tasks:
+                _run_block(task)
+        else:
+            with ProcessPoolExecutor(workers or os.cpu_count(), initializer=_attach,
+                                     initargs=(memory.name, shape, dtype)) as pool:
+                for _ in pool.map(_run_block, tasks, chunksize=4):
+                    pass
+        return np.ndarray(shape, dtype=dtype, buffer=memory.buf).copy()
+    finally:
+        _result = None  # release the buffer view before closing the segment
+        memory.close()
+        memory.unlink()
@@ -0,0 +1,137 @@
+"""Content-addressed on-disk cache for simulation traces.
+
+A trace is a dict of NumPy arrays. Its key is a SHA-256 over the strategy
+name, every input parameter (normally all of the strategy's constants), the
+seed and a code version, which is a hash of the source files that produce
+the trace. Changing any constant or any of that code gives a new key, so
+stale entries are never read. They stop being used and are pruned: every
+read marks an entry as recently used, and every write removes the least
+recently used entries beyond ``max_bytes``. The entry just written is always
+kept, even on its own over budget, so the next render still hits it.
+
+Entries are compressed ``.npz`` files under ``$CS2_TRACE_CACHE`` (default
+``~/.cache/cs2sim/traces``). Nothing in an entry depends on render quality, so
+one simulation serves every re-render at every quality level.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+CACHE_ENV = "CS2_TRACE_CACHE"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "cs2sim" / "traces"
+DEFAULT_MAX_BYTES = 64 * 1024 ** 2
+
+
+# --- KEYS ---
+
+def module_constants(module):
+    """The module's UPPER_CASE names and their values."""
+    return {name: value for name, value in vars(module).items() if name.isupper()}
+
+
+def code_version(*modules):
+    """Hash of the source files of ``modules``."""
+    digest = hashlib.sha256()
+    for module in modules:
+        digest.update(module.__name__.encode())
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def _jsonable(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot hash a {type(value).__name__} trace parameter")
+
+
+def trace_key(strategy, params, seed, version):
+    payload = {"strategy": strategy, "params": params, "seed": seed, "version": version}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=_jsonable).encode()).hexdigest()
+
+
+# --- STORAGE ---
+
+class TraceCache:
+    """Compressed ``.npz`` traces, one file per key, kept under ``max_bytes`` in total."""
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory or os.environ.get(CACHE_ENV) or DEFAULT_CACHE_DIR)
+        self.max_bytes = max_bytes
+        self.hits = self.misses = 0
+
+    def path(self, key):
+        return self.directory / key[:2] / f"{key}.npz"
+
+    def load(self, key):
+        path = self.path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+            os.utime(path)  # the modification time doubles as the last use, for pruning
+            return arrays
+        except (FileNotFoundError, zipfile.BadZipFile, EOFError, ValueError):
+            return None
+
+    def store(self, key, arrays):
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file and rename it, so parallel renders never read half an entry.
+        handle, temp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                np.savez_compressed(file, **arrays)
+            os.replace(temp, path)
+        except BaseException:
+            os.unlink(temp)
+            raise
+        if self.max_bytes is not None:
+            self.prune(self.max_bytes, keep=(key,))
+
+    def prune(self, max_bytes=None, max_age=None, keep=()):
+        """Delete entries unused for ``max_age`` seconds, then the least recently used beyond ``max_bytes``.
+
+        Entries whose key is in ``keep`` are never deleted, but still count
+        towards ``max_bytes``. Returns the number of entries removed.
+        """
+        keep = {self.path(key) for key in keep}
+        entries = []
+        for path in self.directory.glob("*/*.npz"):
+            try:
+                entries.append((path.stat(), path))
+            except FileNotFoundError:  # pruned by a parallel render
+                continue
+        entries.sort(key=lambda entry: entry[0].st_mtime, reverse=True)
+
+        now, kept, removed = time.time(), 0, 0
+        for stat, path in entries:
+            kept += stat.st_size
+            if path in keep:
+                continue
+            if (max_age is not None and now - stat.st_mtime > max_age) or (max_bytes is not None and kept > max_bytes):
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def get_or_compute(self, strategy, params, seed, compute, modules=()):
+        """Load the trace for these inputs, or run ``compute()`` and store its arrays."""
+        key = trace_key(strategy, params, seed, code_version(*modules))
+        arrays = self.load(key)
+        if arrays is not None:
+            self.hits += 1
+            return arrays
+        self.misses += 1
+        arrays = {name: np.asarray(value) for name, value in compute().items()}
+        self.store(key, arrays)
+        return arrays
+
+    def clear(self):
+        for path in self.directory.glob("*/*.npz"):
+            path.unlink()
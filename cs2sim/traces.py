@@ -0,0 +1,92 @@
+"""Step-by-step traces of the single seeded story each scene animates.
+
+These reproduce the exact draws the scenes used to make inside their
+animation loops, so a scene can compute its whole story up front and then
+animate it. Each function keeps its own RNG instances, seeded the way the
+scene seeds the global ones, and leaves global random state untouched.
+"""
+import random
+from typing import NamedTuple
+
+import numpy as np
+
+# --- CASE OPENING ---
+
+class CaseStep(NamedTuple):
+    week: int
+    opened: bool
+    rarity: str
+    skin: str
+    value: float
+    balance: float
+
+
+def case_opening_trace(skins, probabilities, cost_per_case, starting_balance, num_cases, seed=42):
+    """Replay ``CaseOpeningAnimation``'s loop: NumPy picks the rarity, ``random`` picks the skin."""
+    py_rng, np_rng = random.Random(seed), np.random.RandomState(seed)
+    rarities, rarity_probs = list(probabilities.keys()), list(probabilities.values())
+
+    trace, balance = [], starting_balance
+    for week in range(1, num_cases + 1):
+        if balance < cost_per_case:
+            trace.append(CaseStep(week, False, "", "", 0.0, balance))
+            continue
+        balance -= cost_per_case
+        rarity = str(np_rng.choice(rarities, p=rarity_probs))
+        skin_pool = skins[rarity]
+        skin = py_rng.choice(list(skin_pool.keys()))
+        balance += skin_pool[skin]
+        trace.append(CaseStep(week, True, rarity, skin, skin_pool[skin], balance))
+    return trace
+
+
+# --- TRADE-UPS ---
+
+class TradeUpStep(NamedTuple):
+    attempt: int
+    outcome: str
+    market_value: float
+    value_after_fees: float
+    fee: float
+    profit: float
+    balance: float
+
+
+def tradeup_trace(outcomes, probabilities, cost_per_attempt, fee_multiplier, starting_balance,
+                  num_attempts, seed=None):
+    """Replay ``TradeUpAnimation``'s loop.
+
+    The scene passes ``tradeup.SEED``. ``seed=None`` seeds a fresh RNG from
+    the OS instead, so every call tells a different story.
+    """
+    np_rng = np.random.RandomState(seed)
+    names = list(outcomes.keys())
+
+    trace, balance = [], starting_balance
+    for attempt in range(1, num_attempts + 1):
+        balance -= cost_per_attempt
+        name = str(np_rng.choice(names, p=probabilities))
+        market_value = outcomes[name]
+        value_after_fees = market_value * fee_multiplier
+        balance += value_after_fees
+        trace.append(TradeUpStep(attempt, name, market_value, value_after_fees, market_value - value_after_fees,
+                                 value_after_fees - cost_per_attempt, balance))
+    return trace
+
+
+# --- SKIN FLIPPING ---
+
+class FlipperStep(NamedTuple):
+    day: int
+    price: float
+    portfolio_value: float
+
+
+def flipper_trace(buy_price, num_units, daily_change_range, num_days, seed=5):
+    """Replay ``FlipperAnimation``'s random walk."""
+    py_rng = random.Random(seed)
+    trace, price = [], buy_price
+    for day in range(1, num_days + 1):
+        price += py_rng.uniform(*daily_change_range)
+        trace.append(FlipperStep(day, price, price * num_units))
+    return trace
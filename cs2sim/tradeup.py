@@ -0,0 +1,22 @@
+"""Trade-up contract data used by ``TradeUpAnimation``."""
+
+STEAM_FEE_MULTIPLIER = 0.85 # Represents the 85% you keep after the 15% fee
+
+COST_PER_ATTEMPT = 4.33
+STARTING_BALANCE = 200.00
+NUM_ATTEMPTS = 52
+SEED = 42 # Pins the outcome draws, so every render and segment replays the same story
+
+TRADE_UP_OUTCOMES = {
+    'Galil AR | Stone Cold': 15.11,
+    'M249 | Nebula Crusader': 9.05,
+    'P250 | Wingshot': 7.40,
+    'MP7 | Special Delivery': 7.40,
+    'USP-S | Ticket to Hell': 1.89,
+    'M4A1-S | Night Terror': 1.99,
+    'G3SG1 | Dream Glade': 2.11,
+    'PP-Bizon | Space Cat': 1.61,
+    'XM1014 | Zombie Offensive': 1.58,
+}
+raw_probs = [13.64, 13.64, 13.64, 9.09, 9.09, 9.09, 9.09, 9.09, 9.09]
+PROBABILITIES = tuple(p / sum(raw_probs) for p in raw_probs)
@@ -0,0 +1,283 @@
+"""Search every 10-input trade-up contract for the best post-fee odds.
+
+A contract takes ten inputs of one rarity. The outcomes of every input's
+collection go into one pool: with ``n_c`` inputs from collection ``c``,
+which has ``k_c`` next-rarity skins, each of those skins comes out with
+probability ``n_c / sum(n * k)``. A 6/4 split over a 3-skin and a 6-skin
+collection gives 6/42 and 4/42, the odds ``TradeUpAnimation`` uses. So only
+the number of inputs taken from each collection matters, and for a given
+count the cheapest listings of that collection are always the ones to buy.
+A contract is therefore a composition of 10 over the collections.
+
+``optimize`` walks those compositions depth first, one collection at a time.
+It prunes every branch whose upper bound cannot beat the current top ``k``
+and evaluates the last few collections of each branch as one NumPy batch:
+
+    catalogue = Catalogue(inputs, outputs)
+    optimize(catalogue, objective="ev", top=5)
+    optimize(catalogue, objective="p_profit_per_cost")
+"""
+import heapq
+import itertools
+from functools import lru_cache
+from typing import Dict, NamedTuple
+
+import numpy as np
+
+from .tradeup import STEAM_FEE_MULTIPLIER
+
+CONTRACT_SIZE = 10
+OBJECTIVES = ("ev", "p_profit_per_cost")
+
+
+class InputSkin(NamedTuple):
+    name: str
+    collection: str
+    price: float
+    available: int = CONTRACT_SIZE  # listings that can be bought at this price
+
+
+class OutputSkin(NamedTuple):
+    name: str
+    collection: str
+    price: float
+
+
+class Contract(NamedTuple):
+    score: float               # value of the objective searched for
+    cost: float
+    ev: float                  # expected post-fee value of the outcome
+    p_profit: float            # P(post-fee outcome value > cost)
+    counts: Dict[str, int]     # collection -> number of inputs
+    inputs: Dict[str, int]     # input skin -> number bought
+
+    @property
+    def expected_profit(self):
+        return self.ev - self.cost
+
+
+# --- CATALOGUE ---
+
+class Catalogue:
+    """Input listings and outcome skins compiled into per-collection tables.
+
+    Collections with no outcome skins cannot be traded up and are dropped.
+    """
+
+    def __init__(self, inputs, outputs, fee_multiplier=STEAM_FEE_MULTIPLIER):
+        outcome_values = {}
+        self._outcomes = {}
+        for skin in outputs:
+            outcome_values.setdefault(skin.collection, []).append(skin.price * fee_multiplier)
+            self._outcomes.setdefault(skin.collection, []).append(skin.name)
+        self.collections = [c for c in dict.fromkeys(skin.collection for skin in inputs) if c in outcome_values]
+        self.fee_multiplier = fee_multiplier
+
+        # cumulative_cost[c, n]: cheapest way to buy n inputs from collection c (inf when too few are listed).
+        size = len(self.collections)
+        self.cumulative_cost = np.full((size, CONTRACT_SIZE + 1), np.inf)
+        self._units = []
+        for c, collection in enumerate(self.collections):
+            listings = sorted((skin for skin in inputs if skin.collection == collection), key=lambda skin: skin.price)
+            units = [skin for skin in listings for _ in range(min(skin.available, CONTRACT_SIZE))][:CONTRACT_SIZE]
+            self._units.append(units)
+            self.cumulative_cost[c, :len(units) + 1] = np.concatenate([[0.0], np.cumsum([u.price for u in units])])
+
+        # Post-fee outcome values per collection, sorted and padded with -inf up to the longest collection.
+        width = max(len(outcome_values[c]) for c in self.collections) if size else 0
+        self.outcome_values = np.full((size, width), -np.inf)
+        self.num_outcomes = np.zeros(size, dtype=np.int64)
+        for c, collection in enumerate(self.collections):
+            values = np.sort(outcome_values[collection])
+            self.outcome_values[c, width - len(values):] = values
+            self.num_outcomes[c] = len(values)
+        self.outcome_sum = np.array([np.sum(outcome_values[c]) for c in self.collections])
+        self.mean_outcome = self.outcome_sum / self.num_outcomes
+
+    def __len__(self):
+        return len(self.collections)
+
+    # --- BATCHED EVALUATION ---
+
+    def evaluate(self, counts):
+        """Cost, post-fee EV and P(profit) of every row of a (B, collections) count matrix.
+
+        Every outcome of collection ``c`` has probability ``n_c / sum(n * k)``,
+        so both EV and P(profit) are ratios over the pooled outcome count.
+        """
+        counts = np.atleast_2d(counts)
+        cost = self.cumulative_cost[np.arange(len(self)), counts].sum(axis=1)
+        pooled = counts @ self.num_outcomes
+        return cost, counts @ self.outcome_sum / pooled, (counts * self.winning_count(cost)).sum(axis=1) / pooled
+
+    def winning_count(self, cost, collections=None):
+        """(len(cost), C) number of each collection's outcomes worth more than each cost, after the fee."""
+        collections = slice(None) if collections is None else collections
+        cost = np.atleast_1d(cost)[:, None, None]
+        # The -inf padding never counts, so each row only needs one broadcast comparison.
+        return (self.outcome_values[collections] > cost).sum(axis=2)
+
+    def outcome_probabilities(self, counts):
+        """{outcome skin: probability} for one contract's per-collection input counts."""
+        counts = np.asarray(counts, dtype=np.int64)
+        pooled = counts @ self.num_outcomes
+        probabilities = {}
+        for c in np.flatnonzero(counts):
+            for name in self._outcomes[self.collections[c]]:
+                probabilities[name] = probabilities.get(name, 0.0) + counts[c] / pooled
+        return probabilities
+
+    def contract(self, counts, score=None):
+        counts = np.asarray(counts, dtype=np.int64)
+        cost, ev, p_profit = (float(x[0]) for x in self.evaluate(counts))
+        inputs = {}
+        for c in np.flatnonzero(counts):
+            for unit in self._units[c][:counts[c]]:
+                inputs[unit.name] = inputs.get(unit.name, 0) + 1
+        return Contract(score if score is not None else _score(ev, p_profit, cost, "ev"), cost, ev, p_profit,
+                        {self.collections[c]: int(counts[c]) for c in np.flatnonzero(counts)}, inputs)
+
+
+def _score(ev, p_profit, cost, objective):
+    if objective == "ev":
+        return ev - cost
+    return p_profit / cost
+
+
+@lru_cache(maxsize=None)
+def compositions(total, parts):
+    """Every way to split ``total`` inputs over ``parts`` collections, as a read-only (N, parts) array."""
+    if parts == 0:
+        table = np.zeros((1 if total == 0 else 0, 0), dtype=np.int64)
+    else:
+        # Stars and bars: choose where the parts - 1 dividers go among total + parts - 1 slots.
+        rows = []
+        for bars in itertools.combinations(range(total + parts - 1), parts - 1):
+            edges = (-1,) + bars + (total + parts - 1,)
+            rows.append([edges[i + 1] - edges[i] - 1 for i in range(parts)])
+        table = np.array(rows, dtype=np.int64).reshape(-1, parts)
+    table.flags.writeable = False
+    return table
+
+
+# --- SEARCH ---
+
+def optimize(catalogue, objective="ev", top=10, batch_collections=4):
+    """The ``top`` contracts for ``objective``, best first.
+
+    ``objective`` is ``"ev"`` (expected post-fee profit per contract) or
+    ``"p_profit_per_cost"`` (chance the outcome is worth more than the
+    inputs, per dollar spent). The last ``batch_collections`` collections of
+    every branch are enumerated and scored as one NumPy batch.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective {objective!r}; expected one of {OBJECTIVES}")
+    size = len(catalogue)
+    if size == 0:
+        return []
+
+    # Search the most promising collections first, so good contracts are found early and prune more.
+    # Listings are sorted, so a collection's first input is also its cheapest marginal one.
+    unit_cost = catalogue.cumulative_cost[:, 1]
+    # A contract with all ten inputs from one collection is scored as the potential of that collection.
+    all_in = CONTRACT_SIZE * unit_cost
+    if objective == "ev":
+        potential = catalogue.mean_outcome - all_in
+    else:
+        potential = np.diag(catalogue.winning_count(all_in)) / catalogue.num_outcomes / all_in
+    order = np.argsort(-potential, kind="stable")
+    cost_table = catalogue.cumulative_cost[order]
+    outcome_sum = catalogue.outcome_sum[order]
+    num_outcomes = catalogue.num_outcomes[order]
+    # Cheapest input over each suffix of the search order.
+    cheapest_suffix = np.minimum.accumulate(unit_cost[order][::-1])[::-1]
+
+    best = []  # min-heap of (score, tiebreak, counts) holding the current top contracts
+    counter = itertools.count()
+    split = max(size - batch_collections, 0)
+    counts = np.zeros(size, dtype=np.int64)
+
+    def threshold():
+        return best[0][0] if len(best) == top else -np.inf
+
+    def bound(depth, remaining, cost, value, pooled):
+        # value and pooled are sum(n * outcome_sum) and sum(n * num_outcomes) over the committed collections.
+        if remaining == 0 or depth == size:
+            return np.inf
+        # Every remaining input costs at least the cheapest one left.
+        cost_floor = cost + remaining * cheapest_suffix[depth]
+        if objective == "ev":
+            numerator, per_input = value, outcome_sum[depth:]
+        else:
+            # Cost can only rise, so no collection wins more outcomes than it does at cost_floor.
+            winning = catalogue.winning_count(cost_floor, order)[0]
+            numerator, per_input = counts[:depth] @ winning[:depth], winning[depth:]
+        # Both EV and P(profit) are (a + sum(n * x)) / (b + sum(n * k)). A ratio of linear functions peaks at a
+        # vertex, so no mix of the remaining inputs beats putting all of them in one collection.
+        ratio = ((numerator + remaining * per_input) / (pooled + remaining * num_outcomes[depth:])).max()
+        return ratio - cost_floor if objective == "ev" else ratio / cost_floor
+
+    def leaves(depth, remaining):
+        tail = compositions(remaining, size - depth)
+        batch = np.broadcast_to(counts[:depth], (len(tail), depth))
+        batch = np.concatenate([batch, tail], axis=1)
+        original = np.empty_like(batch)
+        original[:, order] = batch
+        cost, ev, p_profit = catalogue.evaluate(original)
+        scores = _score(ev, p_profit, cost, objective)
+        scores[~np.isfinite(cost)] = -np.inf
+        # Only rows that could enter the top list are pushed.
+        for row in np.flatnonzero(scores > threshold()):
+            entry = (scores[row], next(counter), batch[row].copy())
+            if len(best) < top:
+                heapq.heappush(best, entry)
+            elif entry[0] > best[0][0]:
+                heapq.heapreplace(best, entry)
+
+    def search(depth, remaining, cost, value, pooled):
+        if depth >= split:
+            leaves(depth, remaining)
+            return
+        # Try larger counts first: the first collections are the most promising ones.
+        for n in range(remaining, -1, -1):
+            step_cost = cost_table[depth, n]
+            if not np.isfinite(step_cost):
+                continue
+            counts[depth] = n
+            state = (cost + step_cost, value + n * outcome_sum[depth], pooled + n * num_outcomes[depth])
+            if remaining - n == 0:
+                leaves(depth + 1, 0)
+            elif bound(depth + 1, remaining - n, *state) > threshold():
+                search(depth + 1, remaining - n, *state)
+        counts[depth] = 0
+
+    search(0, CONTRACT_SIZE, 0.0, 0.0, 0)
+    results = []
+    for score, _, ordered_counts in sorted(best, key=lambda entry: (-entry[0], entry[1])):
+        original = np.zeros(size, dtype=np.int64)
+        original[order] = ordered_counts
+        results.append(catalogue.contract(original, float(score)))
+    return results
+
+
+def brute_force(catalogue, objective="ev", top=10):
+    """Score every composition at once; only for small catalogues, as a check on ``optimize``."""
+    batch = compositions(CONTRACT_SIZE, len(catalogue))
+    cost, ev, p_profit = catalogue.evaluate(batch)
+    scores = np.where(np.isfinite(cost), _score(ev, p_profit, cost, objective), -np.inf)
+    best = np.argsort(-scores, kind="stable")[:top]
+    return [catalogue.contract(batch[i], float(scores[i])) for i in best if np.isfinite(scores[i])]
+
+
+def random_catalogue(num_collections, outputs_per_collection=(1, 6), inputs_per_collection=(1, 4), rng=None):
+    """A synthetic catalogue for trying out the search; prices are log-normal around trade-up levels."""
+    rng = np.random.default_rng(rng)
+    inputs, outputs = [], []
+    for c in range(num_collections):
+        collection = f"Collection {c + 1}"
+        for i in range(rng.integers(*inputs_per_collection, endpoint=True)):
+            inputs.append(InputSkin(f"{collection} input {i + 1}", collection, round(float(rng.lognormal(-1.0, 0.6)), 2),
+                                    int(rng.integers(1, CONTRACT_SIZE + 1))))
+        for o in range(rng.integers(*outputs_per_collection, endpoint=True)):
+            outputs.append(OutputSkin(f"{collection} outcome {o + 1}", collection, round(float(rng.lognormal(1.0, 0.9)), 2)))
+    return Catalogue(inputs, outputs)
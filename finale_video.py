@@ -0,0 +1,112 @@
+# Save this code as finale_video.py
+from manim import *
+import numpy as np
+from segmented_render import checkpoint
+from polyline import ProgressivePolyline
+from instrumentation import instrumentable
+from cs2sim.finale import RACE_WEEKS, race_traces
+
+# --- DATA & CONFIGURATION ---
+
+# 1. Color Palette
+class Colors:
+    BACKGROUND = "#152B57"
+    TEXT = "#FFFFFF"
+    AXES = "#FFFFFF"
+    MARKER_RED = "#E06C75"
+    STRATEGIES = {'case': "#C82822", 'tradeup': "#61AFEF", 'flipper': "#E5C07B", 'investor': "#12DA2D"}
+
+# 2. Race Settings
+STRATEGY_NAMES = {'case': "Case Opening", 'tradeup': "Trade-Ups", 'flipper': "Skin Flipping", 'investor': "Smart Investor"}
+STARTING_BALANCE = 200.00
+SECONDS_PER_YEAR = 6.0
+
+# --- THE MANIM ANIMATION SCENE ---
+
+@instrumentable
+class GrandFinale(Scene):
+    render_segments = ("setup", "year 1", "year 2", "year 3", "result") # Split points for segmented_render.py
+
+    def construct(self):
+        self.camera.background_color = Colors.BACKGROUND
+
+        # --- 1. DATA GATHERING (simulated once, then read from the trace cache) ---
+        traces = race_traces(RACE_WEEKS)
+        balances = {strategy: trace["balance"] for strategy, trace in traces.items()}
+        weeks = np.arange(RACE_WEEKS + 1)
+        opened = traces['case']["rarity"] != ""
+        bust_week = int(np.argmin(opened)) + 1 if not opened.all() else None
+
+        checkpoint(self, "setup")
+        # --- 2. SETUP THE RACE ---
+        title = Text("The Grand Finale: A 3-Year Race", font_size=44, color=Colors.TEXT).to_edge(UP)
+        y_max = int(np.ceil(max(b.max() for b in balances.values()) / 100) * 100)
+        axes = Axes(x_range=[0, RACE_WEEKS, 26], y_range=[0, y_max, 100 if y_max <= 800 else 200], x_length=7.5, y_length=5.5, axis_config={"color": Colors.AXES}, y_axis_config={"decimal_number_config": {"num_decimal_places": 0, "color": Colors.AXES}}).to_corner(DL, buff=0.75)
+        x_label = axes.get_x_axis_label(Text("Weeks", color=Colors.TEXT, font_size=28))
+        y_label = axes.get_y_axis_label(Text("Balance ($)", color=Colors.TEXT, font_size=28).rotate(90 * DEGREES))
+        start_line = DashedLine(axes.c2p(0, STARTING_BALANCE), axes.c2p(RACE_WEEKS, STARTING_BALANCE), color=Colors.AXES, stroke_opacity=0.5)
+
+        week = ValueTracker(0)
+        week_counter = VGroup(Text("Week:", font_size=32, color=Colors.TEXT), Integer(0, font_size=32, color=Colors.TEXT)).arrange(RIGHT)
+        week_counter[1].add_updater(lambda m: m.set_value(int(week.get_value())))
+
+        # One racing line per strategy; its points are computed once and revealed up to the current week.
+        lines, dots, rows = {}, {}, {}
+        for strategy, balance in balances.items():
+            line = ProgressivePolyline.from_series(axes, weeks, balance, stroke_color=Colors.STRATEGIES[strategy], stroke_width=4 if strategy != 'investor' else 5).follow(week.get_value)
+            dot = Dot(line.get_start(), color=Colors.STRATEGIES[strategy])
+            dot.add_updater(lambda m, line=line: m.move_to(line.get_end()))
+            value = DecimalNumber(STARTING_BALANCE, font_size=28, color=Colors.STRATEGIES[strategy], num_decimal_places=2)
+            value.add_updater(lambda m, balance=balance: m.set_value(np.interp(week.get_value(), weeks, balance)))
+            rows[strategy] = VGroup(Dot(color=Colors.STRATEGIES[strategy]), Text(STRATEGY_NAMES[strategy], font_size=24, color=Colors.TEXT), Text("$", font_size=28, color=Colors.TEXT), value).arrange(RIGHT, buff=0.2)
+            lines[strategy], dots[strategy] = line, dot
+
+        leaderboard = VGroup(*rows.values()).arrange(DOWN, buff=0.35, aligned_edge=LEFT)
+        info_panel = VGroup(week_counter, leaderboard).arrange(DOWN, buff=0.6, aligned_edge=LEFT).to_edge(RIGHT, buff=0.5)
+        slots = [row.get_y() for row in leaderboard]
+
+        self.play(Write(title), Create(axes), Write(x_label), Write(y_label))
+        self.play(Create(start_line), FadeIn(info_panel), *[FadeIn(dot) for dot in dots.values()])
+        self.add(*lines.values(), *dots.values())
+        self.wait(1)
+
+        # The case opener runs out of money long before the end; mark the week it happens.
+        if bust_week is not None:
+            bust_marker = VGroup(Cross(stroke_color=Colors.MARKER_RED, scale_factor=0.15).move_to(axes.c2p(bust_week, balances['case'][bust_week])), Text("Broke!", font_size=22, color=Colors.MARKER_RED).next_to(axes.c2p(bust_week, balances['case'][bust_week]), UP, buff=0.2))
+            bust_marker.add_updater(lambda m: m.set_opacity(1 if week.get_value() >= bust_week else 0))
+            self.add(bust_marker)
+
+        # --- 3. THE RACE, ONE YEAR AT A TIME ---
+        for year in (1, 2, 3):
+            checkpoint(self, f"year {year}")
+            year_end = min(52 * year, RACE_WEEKS)
+            year_text = Text(f"Year {year}", font_size=32, color=Colors.TEXT).next_to(axes, UP, buff=0.1).align_to(axes, LEFT).shift(RIGHT * 0.5)
+            self.play(FadeIn(year_text, shift=DOWN * 0.2), run_time=0.5)
+            self.play(week.animate.set_value(year_end), run_time=SECONDS_PER_YEAR, rate_func=linear)
+
+            # Re-rank the leaderboard by balance at the end of the year.
+            ranking = sorted(balances, key=lambda strategy: balances[strategy][year_end], reverse=True)
+            self.play(*[rows[strategy].animate.set_y(slot) for strategy, slot in zip(ranking, slots)], FadeOut(year_text), run_time=1.0)
+            self.wait(1)
+
+        checkpoint(self, "result")
+        # --- 4. FINAL STANDINGS ---
+        for mob in (week_counter[1], *dots.values(), *[row[3] for row in rows.values()]):
+            mob.clear_updaters()
+        for line in lines.values():
+            line.freeze()
+        standings_title = Text("Final Standings", font_size=32, weight=BOLD, color=Colors.TEXT)
+        standings = VGroup(standings_title)
+        for place, strategy in enumerate(ranking, start=1):
+            net = balances[strategy][-1] - STARTING_BALANCE
+            standings.add(VGroup(Text(f"{place}. {STRATEGY_NAMES[strategy]}", font_size=26, color=Colors.STRATEGIES[strategy]), Text(f"{'+' if net >= 0 else '-'}${abs(net):.2f}", font_size=28, weight=BOLD, color=Colors.STRATEGIES['investor'] if net >= 0 else Colors.MARKER_RED)).arrange(RIGHT, buff=0.4))
+        standings.arrange(DOWN, buff=0.4, aligned_edge=LEFT).move_to(info_panel.get_center())
+
+        winner = ranking[0]
+        winner_highlight = lines[winner].copy().set_stroke(width=10, opacity=0.4)
+        self.play(ReplacementTransform(info_panel, standings), FadeIn(winner_highlight))
+        self.wait(5)
+
+        # --- 5. CREATE THE CLEAN PLATE FOR AFTER EFFECTS ---
+        self.play(FadeOut(standings, title, winner_highlight))
+        self.wait(5)
@@ -1,6 +1,12 @@
 # Save this code as flipper_video.py
 from manim import *
-import random
+from playback import PlaybackStep, play_steps
+from polyline import ProgressivePolyline
+from cs2sim.flipper import (BREAK_EVEN_PORTFOLIO_VALUE, BUY_PRICE_PER_UNIT, DAILY_PRICE_CHANGE_RANGE, DAYS_TO_SIMULATE,
+                             INITIAL_COST, NUM_UNITS)
+from cs2sim.traces import flipper_trace
+from segmented_render import checkpoint
+from instrumentation import instrumentable
 
 # --- DATA & CONFIGURATION ---
 
@@ -14,25 +20,22 @@ class Colors:
     BALANCE_GREEN = "#12DA2D"
     RED_LOSS = "#C82822"
 
-# 2. Skin Flipper Specific Data
-INITIAL_CAPITAL = 200.00
-BUY_PRICE_PER_UNIT = 2.70
-NUM_UNITS = 74
-INITIAL_COST = BUY_PRICE_PER_UNIT * NUM_UNITS
+# 2. Render Options
+PLAYBACK_MODE = True # Play the whole walk as one precomputed animation (False = one self.play per day)
 
-STEAM_FEE_MULTIPLIER = 0.85
-DAYS_TO_SIMULATE = 90
-
-BREAK_EVEN_PRICE = BUY_PRICE_PER_UNIT / STEAM_FEE_MULTIPLIER
-BREAK_EVEN_PORTFOLIO_VALUE = BREAK_EVEN_PRICE * NUM_UNITS
+# Optional Monte Carlo context: shade the 5-95% range of this many simulated walks (0 = off)
+FAN_CHART_PATHS = 0
 
 # --- THE MANIM ANIMATION SCENE ---
 
+@instrumentable
 class FlipperAnimation(Scene):
+    render_segments = ("setup", "simulation", "result") # Split points for segmented_render.py
+
     def construct(self):
-        random.seed(5) 
         self.camera.background_color = Colors.BACKGROUND
 
+        checkpoint(self, "setup")
         # --- 1. SETUP & "BUY" EVENT ---
         title = Text("The Skin Flipper's Ordeal", font_size=48, color=Colors.TEXT).to_edge(UP)
         self.play(Write(title))
@@ -49,6 +52,7 @@ class FlipperAnimation(Scene):
         self.wait(2)
         self.play(FadeOut(buy_box))
 
+        checkpoint(self, "simulation")
         # --- 2. THE SIMULATION (FINAL REFINED LAYOUT) ---
         axes = Axes(
             x_range=[0, DAYS_TO_SIMULATE, 15],
@@ -81,33 +85,36 @@ class FlipperAnimation(Scene):
         )
         break_even_label = Text("Break-Even Point", color=Colors.RED_LOSS, font_size=24).next_to(break_even_line, UP, buff=0.1).align_to(break_even_line, LEFT)
         self.play(Create(break_even_line), Write(break_even_label))
+
+        if FAN_CHART_PATHS:
+            from cs2sim.streaming_stats import flipper_fan_chart # Only needed when the fan chart is on
+            fan = flipper_fan_chart(FAN_CHART_PATHS, rng=5)
+            upper_band = [axes.c2p(day, value) for day, value in zip(fan.days, fan.quantiles[95])]
+            lower_band = [axes.c2p(day, value) for day, value in zip(fan.days, fan.quantiles[5])]
+            fan_band = Polygon(*upper_band, *reversed(lower_band), stroke_width=0, fill_color=Colors.LINE_BLUE, fill_opacity=0.15)
+            median_line = DashedVMobject(axes.plot_line_graph(x_values=fan.days, y_values=fan.quantiles[50], add_vertex_dots=False, line_color=Colors.LINE_BLUE, stroke_width=2)["line_graph"])
+            self.play(FadeIn(fan_band), Create(median_line))
         
         # Run the realistic random walk
+        trace = flipper_trace(BUY_PRICE_PER_UNIT, NUM_UNITS, DAILY_PRICE_CHANGE_RANGE, DAYS_TO_SIMULATE, seed=5)
         dot = Dot(point=axes.c2p(0, INITIAL_COST), color=Colors.DOT_GOLD)
-        line_trace = TracedPath(dot.get_center, stroke_color=Colors.LINE_BLUE, stroke_width=4)
+        line_trace = ProgressivePolyline.from_series(axes, range(DAYS_TO_SIMULATE + 1), [INITIAL_COST] + [step.portfolio_value for step in trace], stroke_color=Colors.LINE_BLUE, stroke_width=4).follow_x(axes, dot)
         self.add(line_trace, dot)
-
-        current_price_per_unit = BUY_PRICE_PER_UNIT
-        final_price = 0
-        final_portfolio_value = 0
-        for day in range(1, DAYS_TO_SIMULATE + 1):
-            total_daily_change = random.uniform(-0.05, 0.065)
-            current_price_per_unit += total_daily_change
-            current_portfolio_value = current_price_per_unit * NUM_UNITS
-            new_point = axes.c2p(day, current_portfolio_value)
-            
-            self.play(
+        steps = [
+            PlaybackStep(0.05, lambda day=step.day, value=step.portfolio_value, point=axes.c2p(step.day, step.portfolio_value): [
                 day_counter[1].animate.set_value(day),
-                portfolio_value_text[1].animate.set_value(current_portfolio_value),
-                dot.animate.move_to(new_point),
-                run_time=0.05
-            )
-            if day == DAYS_TO_SIMULATE:
-                final_price = current_price_per_unit
-                final_portfolio_value = current_portfolio_value
+                portfolio_value_text[1].animate.set_value(value),
+                dot.animate.move_to(point),
+            ], step.day)
+            for step in trace
+        ]
+        play_steps(self, steps, anchor=live_stats, single_pass=PLAYBACK_MODE)
+        final_price = trace[-1].price
+        final_portfolio_value = trace[-1].portfolio_value
         
         self.wait(1)
         
+        checkpoint(self, "result")
         # --- 3. THE "SELL" EVENT (UPGRADED AND REPOSITIONED) ---
         sell_box_text = VGroup(
             Text("SELL", color=Colors.BALANCE_GREEN, weight=BOLD, font_size=28),
@@ -0,0 +1,275 @@
+"""Opt-in timing of where a render spends its time.
+
+An ``Instrumentation`` attached to a scene wraps its ``play``/``wait`` calls
+and the per-frame work inside them. Every call records:
+- its wall time;
+- the frames it produced;
+- the mobjects on screen;
+- the memory it allocated (tracemalloc);
+- the simulation step that was playing (set by ``playback``).
+
+Each call's time is split into ``construct`` (the scene code run since the
+previous call: simulation, ``Text``/``VGroup`` building), ``update``
+(interpolating animations and running updaters such as the balance lines) and
+``render`` (drawing and encoding frames).
+
+Scenes decorated with ``@instrumentable`` are instrumented when
+``CS2_INSTRUMENT`` names an output file:
+
+    CS2_INSTRUMENT=case_trace.json manim render -ql cs2_simulation_video.py CaseOpeningAnimation
+    python instrumentation.py cs2_simulation_video.py CaseOpeningAnimation -o case_trace.json --budget 60
+
+The output is a Chrome trace (open it in chrome://tracing or Perfetto) and a
+summary table of the slowest calls and simulation steps is printed.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from typing import NamedTuple
+
+from segmented_render import load_scene
+
+INSTRUMENT_ENV = "CS2_INSTRUMENT"
+ALLOCATIONS_ENV = "CS2_INSTRUMENT_ALLOCATIONS"
+
+_sim_step = None
+
+
+def set_sim_step(step):
+    """Tag everything recorded from now on with simulation ``step`` (a week, attempt or day; None = outside)."""
+    global _sim_step
+    _sim_step = step
+
+
+class CallRecord(NamedTuple):
+    index: int
+    kind: str           # "play" or "wait"
+    animations: str
+    start: float        # seconds since the render started
+    construct: float    # scene code run since the previous call ended
+    seconds: float
+    update: float       # part of ``seconds`` spent interpolating and running updaters
+    render: float       # part of ``seconds`` spent drawing and writing frames
+    frames: int
+    mobjects: int
+    allocated: int      # net bytes still allocated after the call
+    peak: int           # peak traced bytes during the call, above the level at its start
+    sim_step: object    # first simulation step the call played (None outside the simulation)
+    last_sim_step: object
+
+
+class FrameRecord(NamedTuple):
+    call: int
+    start: float
+    update: float
+    render: float
+    sim_step: object
+
+
+class Instrumentation:
+    """Collects ``CallRecord``s and ``FrameRecord``s for one scene render."""
+
+    def __init__(self, name, trace_allocations=True):
+        self.name = name
+        self.trace_allocations = trace_allocations
+        self.calls, self.frames = [], []
+        self._origin = self._last_end = None
+        self._depth = 0
+        self._frame = None
+
+    def __enter__(self):
+        self._origin = self._last_end = time.perf_counter()
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        else:
+            self._started_tracing = False
+        return self
+
+    def __exit__(self, *exc):
+        if self._started_tracing:
+            tracemalloc.stop()
+
+    # --- WRAPPING ---
+
+    def attach(self, scene):
+        """Wrap ``scene``'s ``play``/``wait`` and its renderer's per-frame calls."""
+        if self._origin is None:
+            self.__enter__()
+        play, wait, update_to_time = scene.play, scene.wait, scene.update_to_time
+        renderer = scene.renderer
+        render_frame = renderer.render
+
+        # Scene.wait is itself a play(Wait(...)); only the outermost call is recorded.
+        scene.play = lambda *args, **kwargs: self._call(scene, "play", play, args, kwargs)
+        scene.wait = lambda *args, **kwargs: self._call(scene, "wait", wait, args, kwargs)
+
+        def timed_update(t):
+            start = time.perf_counter()
+            update_to_time(t)
+            self._frame = (start, time.perf_counter() - start)
+        scene.update_to_time = timed_update
+
+        def timed_render(*args, **kwargs):
+            start = time.perf_counter()
+            render_frame(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+            update_start, update = self._frame or (start, 0.0)
+            self._frame = None
+            self.frames.append(FrameRecord(len(self.calls), update_start - self._origin, update, elapsed, _sim_step))
+        renderer.render = timed_render
+        return scene
+
+    def _call(self, scene, kind, method, args, kwargs):
+        if self._depth:
+            return method(*args, **kwargs)
+        self._depth += 1
+        first_frame, step_at_start = len(self.frames), _sim_step
+        rendered_time = scene.renderer.time
+        if self.trace_allocations:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            end = time.perf_counter()
+            self._depth -= 1
+            allocated = peak = 0
+            if self.trace_allocations:
+                current, peak = tracemalloc.get_traced_memory()
+                allocated, peak = current - before, peak - before
+            frames = self.frames[first_frame:]
+            # A single TracePlayback call plays many steps; take the range from its frames.
+            steps = [f.sim_step for f in frames if f.sim_step is not None] or [step_at_start]
+            self.calls.append(CallRecord(
+                len(self.calls), kind, ", ".join(type(a).__name__ for a in args) if kind == "play" else kind,
+                start - self._origin, start - self._last_end, end - start,
+                sum(f.update for f in frames), sum(f.render for f in frames),
+                int(round((scene.renderer.time - rendered_time) * scene.renderer.camera.frame_rate)),
+                len(scene.get_mobject_family_members()), allocated, peak, steps[0], steps[-1],
+            ))
+            self._last_end = end
+
+    # --- OUTPUT ---
+
+    def chrome_trace(self):
+        """The records as Chrome trace events (microseconds): construct and calls on one track, frames on another."""
+        us = 1e6
+        events = [{"name": "process_name", "ph": "M", "pid": 0, "args": {"name": self.name}},
+                  {"name": "thread_name", "ph": "M", "pid": 0, "tid": 0, "args": {"name": "scene"}},
+                  {"name": "thread_name", "ph": "M", "pid": 0, "tid": 1, "args": {"name": "frames"}}]
+        for call in self.calls:
+            args = {key: value for key, value in call._asdict().items() if key not in ("start", "seconds")}
+            events.append({"name": "construct", "cat": "construct", "ph": "X", "pid": 0, "tid": 0,
+                           "ts": (call.start - call.construct) * us, "dur": call.construct * us})
+            events.append({"name": f"{call.kind} {call.animations}", "cat": call.kind, "ph": "X", "pid": 0, "tid": 0,
+                           "ts": call.start * us, "dur": call.seconds * us, "args": args})
+        for frame in self.frames:
+            events.append({"name": "update", "cat": "frame", "ph": "X", "pid": 0, "tid": 1, "ts": frame.start * us,
+                           "dur": frame.update * us, "args": {"call": frame.call, "sim_step": frame.sim_step}})
+            events.append({"name": "render", "cat": "frame", "ph": "X", "pid": 0, "tid": 1,
+                           "ts": (frame.start + frame.update) * us, "dur": frame.render * us,
+                           "args": {"call": frame.call, "sim_step": frame.sim_step}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path):
+        Path(path).write_text(json.dumps(self.chrome_trace()))
+        return Path(path)
+
+    def totals(self):
+        seconds = sum(c.seconds for c in self.calls)
+        update = sum(c.update for c in self.calls)
+        render = sum(c.render for c in self.calls)
+        return {"calls": len(self.calls), "frames": sum(c.frames for c in self.calls),
+                "construct": sum(c.construct for c in self.calls), "update": update, "render": render,
+                "other": seconds - update - render, "total": self._last_end - self._origin if self.calls else 0.0}
+
+    def step_seconds(self):
+        """Wall time per simulation step, from the frames rendered while each step played."""
+        per_step = defaultdict(float)
+        for frame in self.frames:
+            if frame.sim_step is not None:
+                per_step[frame.sim_step] += frame.update + frame.render
+        return dict(per_step)
+
+    def summary(self, top=10):
+        totals = self.totals()
+        lines = [f"{self.name}: {totals['total']:.2f} s, {totals['calls']} calls, {totals['frames']} frames",
+                 "  " + ", ".join(f"{key} {totals[key]:.2f} s" for key in ("construct", "update", "render", "other")),
+                 "",
+                 f"  {'#':>4} {'call':<28} {'step':>9} {'frames':>6} {'seconds':>8} {'ms/frame':>8} "
+                 f"{'construct':>9} {'mobjects':>8} {'alloc KiB':>9}"]
+        for call in sorted(self.calls, key=lambda c: c.seconds, reverse=True)[:top]:
+            step = "" if call.sim_step is None else (f"{call.sim_step}" if call.sim_step == call.last_sim_step
+                                                     else f"{call.sim_step}-{call.last_sim_step}")
+            lines.append(f"  {call.index:>4} {call.animations[:28]:<28} {step:>9} {call.frames:>6} {call.seconds:>8.3f} "
+                         f"{call.seconds * 1000 / max(call.frames, 1):>8.2f} {call.construct:>9.3f} {call.mobjects:>8} "
+                         f"{call.allocated / 1024:>9.1f}")
+        steps = sorted(self.step_seconds().items(), key=lambda item: item[1], reverse=True)[:top]
+        if steps:
+            lines += ["", "  slowest simulation steps: " + ", ".join(f"{step} ({seconds * 1000:.0f} ms)" for step, seconds in steps)]
+        return "\n".join(lines)
+
+
+# --- SCENE HOOKS ---
+
+def instrumentable(scene_cls):
+    """Class decorator: instrument renders of ``scene_cls`` while ``CS2_INSTRUMENT`` names an output file."""
+    original_render = scene_cls.render
+
+    def render(self, *args, **kwargs):
+        output = os.environ.get(INSTRUMENT_ENV)
+        if not output:
+            return original_render(self, *args, **kwargs)
+        with Instrumentation(type(self).__name__, os.environ.get(ALLOCATIONS_ENV, "1") != "0") as instrumentation:
+            instrumentation.attach(self)
+            try:
+                return original_render(self, *args, **kwargs)
+            finally:
+                instrumentation.write(output)
+                print(instrumentation.summary())
+
+    scene_cls.render = render
+    return scene_cls
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("script")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", default="low_quality",
+                        choices=["low_quality", "medium_quality", "high_quality", "production_quality", "fourk_quality"])
+    parser.add_argument("-o", "--output", default=None, help="Chrome trace JSON (default: <scene>_trace.json)")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--no-allocations", action="store_true", help="skip tracemalloc, which slows rendering down")
+    parser.add_argument("--write-movie", action="store_true", help="include video encoding in the timings")
+    parser.add_argument("--budget", type=float, default=None, help="fail if the render takes longer than this many seconds")
+    args = parser.parse_args(argv)
+
+    from manim import tempconfig
+
+    scene_cls = load_scene(args.script, args.scene)
+    options = {"quality": args.quality, "write_to_movie": args.write_movie, "disable_caching": True,
+               "preview": False, "verbosity": "ERROR", "progress_bar": "none"}
+    with tempconfig(options), Instrumentation(args.scene, not args.no_allocations) as instrumentation:
+        scene = scene_cls()
+        instrumentation.attach(scene)
+        scene.render()
+    print(instrumentation.write(args.output or f"{args.scene}_trace.json"))
+    print(instrumentation.summary(args.top))
+
+    total = instrumentation.totals()["total"]
+    if args.budget is not None and total > args.budget:
+        print(f"OVER BUDGET: {args.scene} took {total:.2f} s (budget {args.budget:.2f} s)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
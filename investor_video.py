@@ -1,7 +1,9 @@
 # Save this code as investor_video.py
 from manim import *
-import random
-import numpy as np
+from segmented_render import checkpoint
+from instrumentation import instrumentable
+from cs2sim.investor import APY, ASSET_APPRECIATION, INITIAL_CAPITAL, WEEKLY_DEPOSIT, WEEKS_TO_SIMULATE
+from cs2sim.investor_model import investor_history
 
 # --- DATA & CONFIGURATION ---
 
@@ -15,40 +17,24 @@ class Colors:
     ASSET_LINE = "#E5C07B"
     MARKER_RED = "#E06C75"
 
-# 2. Smart Investor Specific Data
-INITIAL_CAPITAL = 200.00
-WEEKLY_DEPOSIT = 0.50
-WEEKS_TO_SIMULATE = 156 
-APY = 0.15
-ASSET_APPRECIATION = 0.30
-
 # --- THE MANIM ANIMATION SCENE ---
 
+@instrumentable
 class SmartInvestorAnimation(Scene):
+    render_segments = ("year 1", "year 2", "year 3", "payoff") # Split points for segmented_render.py
+
     def construct(self):
         self.camera.background_color = Colors.BACKGROUND
 
         # --- 1. DATA GATHERING FOR THE FULL 3-YEAR PERIOD ---
-        principal_history, deposits_history, apy_gains_history, asset_gains_history = [], [], [], []
-        current_principal, total_deposits, total_apy_gains = INITIAL_CAPITAL, 0, 0
-
-        for week in range(WEEKS_TO_SIMULATE + 1):
-            if week > 0:
-                current_principal += WEEKLY_DEPOSIT
-                total_deposits += WEEKLY_DEPOSIT
-                weekly_apy_rate = (1 + APY)**(1/52) - 1
-                apy_gain_this_week = current_principal * weekly_apy_rate
-                total_apy_gains += apy_gain_this_week
-                current_principal += apy_gain_this_week
-            base_value_for_asset_gain = INITIAL_CAPITAL + total_deposits + total_apy_gains
-            total_asset_gains = base_value_for_asset_gain * (ASSET_APPRECIATION * (week / WEEKS_TO_SIMULATE))
-            principal_history.append(INITIAL_CAPITAL); deposits_history.append(total_deposits); apy_gains_history.append(total_apy_gains); asset_gains_history.append(total_asset_gains)
+        history = investor_history(INITIAL_CAPITAL, WEEKLY_DEPOSIT, APY, ASSET_APPRECIATION, WEEKS_TO_SIMULATE)
 
         x_values = list(range(WEEKS_TO_SIMULATE + 1))
-        y_baseline = np.add(principal_history, deposits_history)
-        y_with_apy = np.add(y_baseline, apy_gains_history)
-        y_total = np.add(y_with_apy, asset_gains_history)
+        y_baseline = history.baseline
+        y_with_apy = history.with_apy
+        y_total = history.total
         
+        checkpoint(self, "year 1")
         # --- 2. SETUP FOR YEAR 1 ---
         title = Text("The Smart Investor's Strategy", font_size=48, color=Colors.TEXT).to_edge(UP)
         axes_y1 = Axes(x_range=[0, 52, 10], y_range=[0, 400, 100], x_length=8, y_length=5.0, axis_config={"color": Colors.AXES}, y_axis_config={"decimal_number_config": {"num_decimal_places": 0, "color": Colors.AXES}}).to_corner(DL, buff=0.75)
@@ -67,6 +53,7 @@ class SmartInvestorAnimation(Scene):
         marker_y1 = VGroup(Dot(axes_y1.c2p(52, y_total[52]), color=Colors.MARKER_RED), DashedLine(axes_y1.c2p(0, y_total[52]), axes_y1.c2p(52, y_total[52]), color=Colors.MARKER_RED), DashedLine(axes_y1.c2p(52, 0), axes_y1.c2p(52, y_total[52]), color=Colors.MARKER_RED))
         self.play(Create(marker_y1)); self.wait(1.5)
 
+        checkpoint(self, "year 2")
         # --- 4. DYNAMIC TRANSFORMATION TO YEAR 2 ---
         look_ahead_text_y2 = Text("Simulating Year 2...", font_size=32, color=Colors.TEXT).next_to(info_panel, DOWN, buff=-5.5, aligned_edge=LEFT)
         self.play(Write(look_ahead_text_y2))
@@ -78,6 +65,7 @@ class SmartInvestorAnimation(Scene):
         marker_y2 = VGroup(Dot(axes_y2.c2p(104, y_total[104]), color=Colors.MARKER_RED), DashedLine(axes_y2.c2p(0, y_total[104]), axes_y2.c2p(104, y_total[104]), color=Colors.MARKER_RED), DashedLine(axes_y2.c2p(104, 0), axes_y2.c2p(104, y_total[104]), color=Colors.MARKER_RED))
         self.play(Create(marker_y2)); self.wait(1.5)
 
+        checkpoint(self, "year 3")
         # --- 5. DYNAMIC TRANSFORMATION TO YEAR 3 ---
         look_ahead_text_y3 = Text("Simulating Year 3...", font_size=32, color=Colors.TEXT).next_to(info_panel, DOWN, buff=-5.5, aligned_edge=LEFT)
         self.play(Write(look_ahead_text_y3))
@@ -90,6 +78,7 @@ class SmartInvestorAnimation(Scene):
         marker_y3 = VGroup(Dot(axes_y3.c2p(156, y_total[-1]), color=Colors.MARKER_RED), DashedLine(axes_y3.c2p(0, y_total[-1]), axes_y3.c2p(156, y_total[-1]), color=Colors.MARKER_RED), DashedLine(axes_y3.c2p(156, 0), axes_y3.c2p(156, y_total[-1]), color=Colors.MARKER_RED))
         self.play(Create(marker_y3)); self.wait(2)
         
+        checkpoint(self, "payoff")
         # --- 6. THE FINAL "ANNUAL GROWTH" PAYOFF ---
         profit_y1 = y_total[52] - INITIAL_CAPITAL
         profit_y2 = y_total[104] - y_total[52]
@@ -0,0 +1,119 @@
+"""Play a precomputed sequence of simulation steps as one Manim animation.
+
+A scene describes its simulation as a list of ``PlaybackStep``s, one per
+``self.play``/``self.wait`` call it would otherwise make. ``play_steps`` then
+either plays them one by one, or hands them all to a single ``TracePlayback``
+so Manim only pays its per-play setup, hashing and partial-movie-file cost
+once.
+
+``TracePlayback`` gives each step exactly the frames its own ``play`` would
+have rendered and begins, interpolates and finishes the step's animations the
+way ``Scene.play`` does, so both modes produce the same frames.
+"""
+from typing import Callable, List, NamedTuple
+
+import numpy as np
+from manim import Animation, config
+
+from instrumentation import set_sim_step
+
+
+class PlaybackStep(NamedTuple):
+    run_time: float
+    build: Callable[[], List[Animation]]  # called when the step starts; an empty list is a wait
+    sim_step: object = None  # simulation step (week, attempt, day) it belongs to; several steps may share one
+
+
+def _frames_for(run_time, frame_rate):
+    # Same time progression Scene.play renders for a single call.
+    return len(np.arange(0, run_time, 1 / frame_rate))
+
+
+class TracePlayback(Animation):
+    """Drive a whole list of ``PlaybackStep``s from one time-indexed animation.
+
+    ``anchor`` should be the earliest mobject in the scene that any step
+    changes: Manim re-renders every mobject from the animation's mobject
+    onward, and caches everything before it as a static background.
+    """
+
+    def __init__(self, scene, steps, anchor, **kwargs):
+        self.scene = scene
+        self.steps = list(steps)
+        self.frame_rate = config.frame_rate
+        frame_counts = [_frames_for(step.run_time, self.frame_rate) for step in self.steps]
+        self.end_frames = np.cumsum(frame_counts)
+        self.start_frames = self.end_frames - frame_counts
+        self.total_frames = int(self.end_frames[-1]) if self.steps else 0
+        # Half a frame short, so Scene.play's own np.arange yields exactly total_frames frames.
+        run_time = max(self.total_frames - 0.5, 0.5) / self.frame_rate
+        super().__init__(anchor, run_time=run_time, rate_func=lambda t: t, suspend_mobject_updating=False, **kwargs)
+
+    def begin(self):
+        self.step_index = -1
+        self.active = []
+        self.interpolate(0)
+
+    def finish(self):
+        self.interpolate(1)
+        set_sim_step(None)
+
+    def update_mobjects(self, dt):
+        for animation in self.active:
+            animation.update_mobjects(dt)
+
+    def _start_step(self, index):
+        self.step_index = index
+        set_sim_step(self.steps[index].sim_step)
+        self.active = self.steps[index].build()
+        self.scene.add_mobjects_from_animations(self.active)
+        for animation in self.active:
+            animation._setup_scene(self.scene)
+            animation.begin()
+
+    def _finish_step(self):
+        for animation in self.active:
+            animation.finish()
+            animation.clean_up_from_scene(self.scene)
+            if animation.is_remover():
+                # Scene.remove leaves the snapshot Scene.play renders every frame from untouched, and a
+                # remover is reset to its start state, so a faded-out panel would reappear at full opacity.
+                family = set(animation.mobject.get_family())
+                for name in ("moving_mobjects", "static_mobjects"):
+                    if getattr(self.scene, name, None):
+                        setattr(self.scene, name, [m for m in getattr(self.scene, name) if m not in family])
+        self.active = []
+        # Scene.play lets updaters (e.g. the balance lines) see every play's end state,
+        # even when skipping; do the same so skipped playback keeps each step.
+        self.scene.update_mobjects(0)
+
+    def interpolate(self, alpha):
+        frame = self.total_frames if alpha >= 1 else int(round(alpha * self.run_time * self.frame_rate))
+        while self.step_index < len(self.steps) and (self.step_index < 0 or frame >= self.end_frames[self.step_index]):
+            if self.step_index >= 0:
+                self._finish_step()
+            if self.step_index + 1 == len(self.steps):
+                self.step_index = len(self.steps)
+                break
+            self._start_step(self.step_index + 1)
+
+        if self.step_index < len(self.steps):
+            step = self.steps[self.step_index]
+            local_alpha = (frame - self.start_frames[self.step_index]) / self.frame_rate / step.run_time
+            for animation in self.active:
+                animation.interpolate(local_alpha)
+
+
+def play_steps(scene, steps, anchor, single_pass=True):
+    """Play ``steps`` in one ``TracePlayback``, or one ``play``/``wait`` per step."""
+    if single_pass:
+        scene.play(TracePlayback(scene, steps, anchor))
+        return
+    for step in steps:
+        set_sim_step(step.sim_step)
+        animations = step.build()
+        if animations:
+            scene.play(*animations, run_time=step.run_time)
+        else:
+            scene.wait(step.run_time)
+    set_sim_step(None)
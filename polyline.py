@@ -0,0 +1,93 @@
+"""A polyline over a precomputed series, revealed a little more every frame.
+
+``TracedPath`` appends the followed point every frame, which reallocates
+and re-processes its whole growing path each time. A scene's balance curve
+is known before it is animated, so ``ProgressivePolyline`` builds every
+segment once into a preallocated buffer. Revealing it only moves an end
+index and rewrites the one partially drawn segment, so the update costs
+the same on frame 10 as on frame 10,000. Drawing still grows with the
+visible length.
+
+    line = ProgressivePolyline.from_series(axes, days, values, stroke_color=BLUE)
+    line.follow(lambda: tracker.get_value())          # reveal up to a day
+    line.follow_x(axes, dot)                           # or up to a moving dot, like TracedPath
+    ...
+    line.freeze()                                      # before transforming the finished line
+"""
+import numpy as np
+from manim import VMobject
+
+
+class ProgressivePolyline(VMobject):
+    """Straight segments through ``corners``, drawn up to ``position``.
+
+    ``position`` counts corners: 0 shows only the first corner, 2.5 runs
+    through the third corner and halfway to the fourth.
+    """
+
+    def __init__(self, corners, position=0.0, **kwargs):
+        super().__init__(**kwargs)
+        corners = np.asarray(corners, dtype=np.float64)
+        if corners.ndim != 2 or len(corners) < 2:
+            raise ValueError("ProgressivePolyline needs at least two corners")
+        self.corners = corners
+        # Segment i is the straight cubic Bezier corners[i] -> corners[i + 1]; handles sit at thirds.
+        start, end = corners[:-1], corners[1:]
+        curves = np.stack([start, (2 * start + end) / 3, (start + 2 * end) / 3, end], axis=1)
+        self._full = curves.reshape(-1, 3)
+        self._working = self._full.copy()
+        self._dirty = None  # segment in _working that currently differs from _full
+        self.position = None
+        self.reveal(position)
+
+    @classmethod
+    def from_series(cls, axes, x_values, y_values, **kwargs):
+        return cls([axes.c2p(x, y) for x, y in zip(x_values, y_values)], **kwargs)
+
+    @property
+    def num_corners(self):
+        return len(self.corners)
+
+    def reveal(self, position):
+        """Show the line up to ``position`` (clipped to the series)."""
+        position = min(max(float(position), 0.0), self.num_corners - 1.0)
+        if position == self.position:
+            return self
+        self.position = position
+        whole = int(position)
+        fraction = position - whole
+
+        if self._dirty is not None:
+            slot = slice(4 * self._dirty, 4 * self._dirty + 4)
+            self._working[slot] = self._full[slot]
+            self._dirty = None
+
+        if fraction > 0 or whole == 0:
+            # The segment being drawn runs from its corner to the interpolated head
+            # (at position 0 it collapses to the first corner, so the line has an end).
+            start = self.corners[whole]
+            head = start + fraction * (self.corners[whole + 1] - start)
+            self._working[4 * whole:4 * whole + 4] = [start, (2 * start + head) / 3, (start + 2 * head) / 3, head]
+            self._dirty = whole
+            whole += 1
+        # A view into the buffer: nothing is allocated or copied per frame.
+        self.points = self._working[:4 * whole]
+        return self
+
+    def follow(self, position_func):
+        """Reveal up to ``position_func()`` on every frame."""
+        self.add_updater(lambda mob: mob.reveal(position_func()))
+        return self
+
+    def follow_x(self, axes, mobject, x_values=None):
+        """Reveal up to ``mobject``'s x coordinate on ``axes``; ``x_values`` defaults to 0, 1, 2, ..."""
+        if x_values is None:
+            return self.follow(lambda: axes.p2c(mobject.get_center())[0])
+        indices = np.arange(len(x_values))
+        return self.follow(lambda: np.interp(axes.p2c(mobject.get_center())[0], x_values, indices))
+
+    def freeze(self):
+        """Stop revealing and give the line its own points, so it can be moved and transformed."""
+        self.clear_updaters()
+        self.points = self.points.copy()
+        return self
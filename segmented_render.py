@@ -0,0 +1,123 @@
+"""Render a scene's segments in parallel and stitch them into one video.
+
+Scenes declare their segments in a ``render_segments`` class attribute and
+mark where each one begins with ``checkpoint(self, name)``. Each segment is
+rendered by its own ``manim`` process. That process replays ``construct`` with
+every other segment's animations skipped: skipped plays jump straight to
+their final state, so the segment starts from exactly the state the full
+render would have reached. The job description (script, scene, segment,
+quality) is all a worker needs. That only works because every scene draws
+its story from a fixed seed (``tradeup.SEED``, the case and flipper scenes'
+literal seeds): an unseeded scene would simulate a different story in every
+segment process, and the stitched video would not add up.
+
+Usage:
+    python segmented_render.py investor_video.py SmartInvestorAnimation -q h -j 4
+"""
+import argparse
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+SEGMENT_ENV = "CS2_RENDER_SEGMENT"
+
+
+def checkpoint(scene, name):
+    """Start segment ``name``; when a single segment is being rendered, skip all the others."""
+    selected = os.environ.get(SEGMENT_ENV)
+    scene.next_section(name, skip_animations=selected is not None and selected != name)
+
+
+# --- ORCHESTRATION ---
+
+class SegmentJob(NamedTuple):
+    script: str
+    scene: str
+    segment: str
+    index: int
+    quality: str
+    media_dir: str
+
+
+def load_scene(script, scene):
+    """Import ``script`` by path and return its ``scene`` class."""
+    spec = importlib.util.spec_from_file_location(Path(script).stem, script)
+    module = importlib.util.module_from_spec(spec)
+    sys.path.insert(0, str(Path(script).resolve().parent))
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.pop(0)
+    return getattr(module, scene)
+
+
+def scene_segments(script, scene):
+    """Read the ``render_segments`` a scene class declares."""
+    return tuple(load_scene(script, scene).render_segments)
+
+
+def _render(job):
+    output_name = f"{job.index:02d}_{job.segment.replace(' ', '_')}"
+    subprocess.run(
+        ["manim", "render", f"-q{job.quality}", job.script, job.scene, "--media_dir", job.media_dir, "-o", output_name],
+        env={**os.environ, SEGMENT_ENV: job.segment},
+        check=True,
+    )
+    movies = [path for path in Path(job.media_dir, "videos").rglob(f"{output_name}.mp4") if "partial_movie_files" not in path.parts]
+    if not movies:
+        raise FileNotFoundError(f"manim did not produce a movie for segment {job.segment!r} of {job.scene}")
+    return movies[0]
+
+
+def concatenate(movies, output):
+    """Join movie files that share one encoding, without re-encoding them."""
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        for movie in movies:
+            listing.write(f"file '{Path(movie).resolve()}'\n")
+    try:
+        subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", listing.name,
+                        "-c", "copy", str(output)], check=True)
+    finally:
+        os.unlink(listing.name)
+    return Path(output)
+
+
+def render_segmented(script, scene, quality="h", workers=None, output=None, media_dir="media/segments", segments=None):
+    """Render every segment of ``scene`` on up to ``workers`` processes and concatenate them."""
+    segments = segments or scene_segments(script, scene)
+    scene_dir = Path(media_dir, scene)
+    jobs = [SegmentJob(script, scene, segment, index, quality, str(scene_dir / f"{index:02d}"))
+            for index, segment in enumerate(segments)]
+
+    # Each job is its own manim process; threads only wait on them.
+    with ThreadPoolExecutor(workers or os.cpu_count()) as pool:
+        movies = list(pool.map(_render, jobs))
+
+    output = Path(output or scene_dir / f"{scene}.mp4")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if len(movies) == 1:
+        shutil.copyfile(movies[0], output)
+        return output
+    return concatenate(movies, output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("script")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", default="h", choices=list("lmhpk"))
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument("-o", "--output", default=None)
+    parser.add_argument("--media_dir", default="media/segments")
+    args = parser.parse_args(argv)
+    print(render_segmented(args.script, args.scene, args.quality, args.workers, args.output, args.media_dir))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from cs2sim.case import COST_PER_CASE
+from cs2sim.case_index import CaseIndex, case_stats, compile_definition, compile_store_case
+from cs2sim.exact_distribution import case_outcomes
+from cs2sim.item_store import CaseDefinition, build_default_store, default_cases
+from cs2sim.monte_carlo import FEVER_CASE
+
+
+@pytest.fixture(scope="module")
+def store(tmp_path_factory):
+    return build_default_store(tmp_path_factory.mktemp("store"))
+
+
+def test_store_cases_compile_to_float64_cents(store):
+    case = compile_store_case(store, store.case_id("Trade-Up Contract"))
+    assert case.cost == 4.33
+    assert case.values.dtype == np.float64
+    np.testing.assert_array_equal(case.values, np.round(case.values, 2))
+
+
+def test_store_and_definition_give_the_same_stats(store):
+    index = CaseIndex.from_store(store)
+    for name, definition in default_cases().items():
+        expected = case_stats(name, compile_definition(definition))
+        actual = index.stats[name]
+        assert actual.cost == expected.cost
+        assert actual.ev == pytest.approx(expected.ev, rel=1e-6)
+        assert actual.p_profit == pytest.approx(expected.p_profit, rel=1e-6)
+
+
+def test_fever_case_stats():
+    stats = case_stats("Fever Case", compile_definition(default_cases()["Fever Case"]))
+    changes, probs = case_outcomes()
+    assert stats.ev - COST_PER_CASE == pytest.approx(changes @ probs)
+    assert stats.knife_mass == pytest.approx(0.0026, rel=1e-3)
+    # With no bankroll barrier the 52 openings are i.i.d.; compare with a fixed-seed Monte Carlo.
+    _, _, value = FEVER_CASE.sample(np.random.default_rng(0), (100_000, 52))
+    assert stats.p_profit == pytest.approx(np.mean(value.sum(axis=1) > 52 * COST_PER_CASE), abs=0.005)
+
+
+def test_refresh_recomputes_only_changed_cases():
+    cases = default_cases()
+    index = CaseIndex.from_definitions(cases)
+    assert index.refresh(cases) == []
+    fever = cases["Fever Case"]
+    cheaper = {**cases, "Fever Case": CaseDefinition(1.0, fever.skins, fever.probabilities)}
+    assert index.refresh(cheaper) == ["Fever Case"]
+    assert index.top(1)[0].name == "Fever Case"
+    del cheaper["Trade-Up Contract"]
+    index.refresh(cheaper)
+    assert len(index) == 1
+
+
+def test_update_keeps_the_cases_it_is_not_given():
+    cases = default_cases()
+    index = CaseIndex.from_definitions(cases)
+    fever = cases["Fever Case"]
+    assert index.update({"Fever Case": CaseDefinition(1.0, fever.skins, fever.probabilities)}) == ["Fever Case"]
+    assert len(index) == len(cases)
+    assert index.stats["Fever Case"].cost == pytest.approx(1.0)
+    assert index.update({"Fever Case": CaseDefinition(1.0, fever.skins, fever.probabilities)}) == []
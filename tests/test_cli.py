@@ -0,0 +1,56 @@
+import csv
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from cs2sim.cli import SUMMARY_STATS, main
+
+
+def test_package_imports_without_manim():
+    code = ("import sys, cs2sim, cs2sim.cli, cs2sim.market, cs2sim.rare_events, cs2sim.tradeup_optimizer; "
+            "print('manim' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=Path(__file__).resolve().parents[1])
+    assert result.stdout.strip() == "False"
+
+
+def test_csv_has_one_row_per_path(tmp_path):
+    output = tmp_path / "tradeup.csv"
+    assert main(["tradeup", "-n", "5", "--seeds", "1", "2", "--set", "cost_per_attempt=4.33,5", "-o", str(output)]) == 0
+    rows = list(csv.reader(output.open()))
+    assert rows[0][:3] == ["cost_per_attempt", "seed", "path"]
+    assert len(rows) == 1 + 2 * 2 * 5
+    assert len(rows[1]) == 3 + 52
+
+
+def test_summary_json_matches_npy(tmp_path):
+    args = ["case", "-n", "200", "--seeds", "7", "--summary"]
+    main(args + ["-f", "json", "-o", str(tmp_path / "case.json")])
+    main(args + ["-f", "npy", "-o", str(tmp_path / "case.npy")])
+    runs = json.loads((tmp_path / "case.json").read_text())["runs"]
+    summary = np.load(tmp_path / "case.npy")
+    assert summary.shape == (1, 1, len(SUMMARY_STATS))
+    assert [runs[0]["summary"][stat] for stat in SUMMARY_STATS] == pytest.approx(summary[0, 0].tolist())
+
+
+def test_malformed_set_is_a_usage_error():
+    with pytest.raises(SystemExit):
+        main(["case", "--set", "cost_per_case"])
+
+
+def test_unknown_parameter_is_a_usage_error(capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["case", "-n", "3", "--set", "num_days=10"])
+    assert exit_info.value.code == 2
+    assert "unknown case parameter(s) num_days" in capsys.readouterr().err
+
+
+def test_mixed_step_counts_are_a_usage_error(capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["flipper", "-n", "3", "--set", "num_days=10,20"])
+    assert exit_info.value.code == 2
+    assert "same number of steps" in capsys.readouterr().err
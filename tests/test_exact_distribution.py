@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from cs2sim import exact_distribution, monte_carlo
+
+
+def test_step_kernel_keeps_on_grid_outcomes_in_place():
+    kernel, offset = exact_distribution.step_kernel([-0.02, 0.03], [0.25, 0.75])
+    assert offset == -2
+    np.testing.assert_allclose(kernel, [0.25, 0, 0, 0, 0, 0.75])
+
+
+def test_step_kernel_splits_off_grid_outcomes_and_keeps_the_mean():
+    kernel, offset = exact_distribution.step_kernel([0.0125], [1.0])
+    assert offset == 1
+    np.testing.assert_allclose(kernel, [0.75, 0.25])
+    assert (offset + np.arange(len(kernel))) @ kernel == pytest.approx(1.25)
+
+
+def test_tradeup_mean_is_exact():
+    changes, probs = exact_distribution.tradeup_outcomes()
+    distribution = exact_distribution.tradeup_final_distribution()
+    assert distribution.pmf.sum() == pytest.approx(1.0)
+    assert distribution.mean() == pytest.approx(200.0 + 52 * changes @ probs, abs=1e-9)
+
+
+def test_case_distribution_matches_monte_carlo():
+    distribution = exact_distribution.case_final_distribution()
+    final = monte_carlo.simulate_case_paths(200_000, rng=7)[:, -1]
+    assert distribution.mean() == pytest.approx(final.mean(), rel=0.01)
+    assert distribution.prob_above(200) == pytest.approx(np.mean(final > 200), abs=0.004)
+
+
+def test_tradeup_percentiles_match_monte_carlo():
+    distribution = exact_distribution.tradeup_final_distribution()
+    final = monte_carlo.simulate_tradeup_paths(200_000, rng=7)[:, -1]
+    np.testing.assert_allclose(distribution.percentile([5, 50, 95]), np.percentile(final, [5, 50, 95]), atol=0.5)
+
+
+def test_every_step_convolves_once_per_step(monkeypatch):
+    final = exact_distribution.case_final_distribution()
+    calls = []
+    convolve = exact_distribution._convolve
+    monkeypatch.setattr(exact_distribution, "_convolve", lambda a, kernel: calls.append(len(a)) or convolve(a, kernel))
+    monkeypatch.setattr(exact_distribution, "_kernel_power", None)  # no step may be recomputed from scratch
+    distributions = list(exact_distribution.iter_case_distributions())
+    assert len(calls) == len(distributions) == 52
+    # The negligible many-knife tail is trimmed, so the carried grid stays far below 52 kernel widths.
+    kernel, _ = exact_distribution.step_kernel(*exact_distribution.case_outcomes())
+    assert max(calls) < 12 * len(kernel)
+    assert distributions[-1].mean() == pytest.approx(final.mean(), abs=1e-9)
+    assert distributions[-1].prob_above(200) == pytest.approx(final.prob_above(200), abs=1e-12)
+    np.testing.assert_array_equal(distributions[-1].percentile([5, 50, 95]), final.percentile([5, 50, 95]))
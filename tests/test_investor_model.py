@@ -0,0 +1,39 @@
+import numpy as np
+
+from cs2sim.investor import APY, ASSET_APPRECIATION, INITIAL_CAPITAL, WEEKLY_DEPOSIT, WEEKS_TO_SIMULATE
+from cs2sim.investor_model import investor_breakdown, investor_history, investor_sweep
+
+
+def weekly_loop(capital, deposit, apy, appreciation, weeks):
+    """The loop SmartInvestorAnimation used before the closed form."""
+    totals, principal, deposits, apy_gains = [], capital, 0.0, 0.0
+    for week in range(weeks + 1):
+        if week > 0:
+            principal += deposit
+            deposits += deposit
+            gain = principal * ((1 + apy) ** (1 / 52) - 1)
+            apy_gains += gain
+            principal += gain
+        base = capital + deposits + apy_gains
+        totals.append(base + base * appreciation * week / weeks)
+    return np.array(totals)
+
+
+def test_closed_form_matches_the_weekly_loop():
+    history = investor_history()
+    expected = weekly_loop(INITIAL_CAPITAL, WEEKLY_DEPOSIT, APY, ASSET_APPRECIATION, WEEKS_TO_SIMULATE)
+    np.testing.assert_allclose(history.total, expected, rtol=1e-12)
+
+
+def test_zero_apy_is_plain_saving():
+    breakdown = investor_breakdown(10, apy=0.0, asset_appreciation=0.0)
+    assert breakdown.total == INITIAL_CAPITAL + 10 * WEEKLY_DEPOSIT
+
+
+def test_sweep_matches_single_evaluations_and_is_read_only():
+    sweep = investor_sweep(initial_capital=[100, 200], apy=[0.05, 0.15, 0.3])
+    assert sweep.total.shape == (2, 1, 3, 1, 1)
+    single = weekly_loop(100, WEEKLY_DEPOSIT, 0.3, ASSET_APPRECIATION, WEEKS_TO_SIMULATE)[-1]
+    np.testing.assert_allclose(sweep.total[0, 0, 2, 0, 0], single, rtol=1e-12)
+    assert not any(field.flags.writeable for field in sweep)
+    assert investor_sweep(initial_capital=[100, 200], apy=[0.05, 0.15, 0.3]) is sweep
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from cs2sim.case import COST_PER_CASE, PROBABILITIES, SKINS
+from cs2sim.item_store import CaseDefinition, ItemStore, build_default_store, write_store
+from cs2sim.monte_carlo import FEVER_CASE
+from cs2sim.tradeup import PROBABILITIES as TRADE_UP_PROBABILITIES
+
+
+@pytest.fixture(scope="module")
+def store(tmp_path_factory):
+    return build_default_store(tmp_path_factory.mktemp("store"))
+
+
+def test_round_trip(store):
+    reopened = ItemStore(store.path)
+    case_id = reopened.case_id("Fever Case")
+    assert reopened.case_cost[case_id] == pytest.approx(COST_PER_CASE)
+    item_id = reopened.item_id("AWP | Printstream")
+    assert reopened.item_name(item_id) == "AWP | Printstream"
+    assert reopened.prices()[item_id] == pytest.approx(SKINS["Red"]["AWP | Printstream"])
+    assert reopened.item_case[reopened.item_id("AK-47 | Slate")] == -1
+
+
+def test_uniform_case_tables_match_the_scene_tables(store):
+    tables = store.case_tables(store.case_id("Fever Case"))
+    assert tables.skin_cdf is None
+    assert tables.rarities == list(PROBABILITIES)
+    np.testing.assert_allclose(tables.values, FEVER_CASE.values, rtol=1e-6)
+
+
+def test_weighted_case_tables_agree_with_outcome_distribution(store):
+    case_id = store.case_id("Trade-Up Contract")
+    _, probs, _ = store.outcome_distribution(case_id)
+    np.testing.assert_allclose(probs, TRADE_UP_PROBABILITIES, rtol=1e-6)
+
+    tables = store.case_tables(case_id)
+    np.testing.assert_allclose(tables.skin_probs[0], probs, rtol=1e-6)
+    _, skin_idx, _ = tables.sample(np.random.default_rng(0), 400_000)
+    np.testing.assert_allclose(np.bincount(skin_idx) / len(skin_idx), probs, atol=0.002)
+
+
+def test_weighted_pools_sample_within_their_own_rarity(tmp_path):
+    case = CaseDefinition(1.0, {"A": {"a1": 1.0, "a2": 2.0}, "B": {"b1": 3.0, "b2": 4.0, "b3": 5.0}},
+                          {"A": 0.5, "B": 0.5}, {"a1": 3.0, "b3": 8.0})
+    tables = write_store(tmp_path, {"Weighted": case}).case_tables(0)
+    rarity_idx, skin_idx, value = tables.sample(np.random.default_rng(1), 200_000)
+    assert skin_idx[rarity_idx == 0].max() == 1 and skin_idx[rarity_idx == 1].max() == 2
+    np.testing.assert_allclose(np.mean(skin_idx[rarity_idx == 0] == 0), 0.75, atol=0.005)
+    np.testing.assert_allclose(np.mean(skin_idx[rarity_idx == 1] == 2), 0.8, atol=0.005)
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from cs2sim.market import MarketParams, SellOrder, dump, fundamental_walk, listing, simulate_sale, sweep_schedules, twap
+
+NUM_DAYS = 20
+PARAMS = MarketParams(orders_per_day=100.0)
+SCHEDULES = {"dump": dump(20, day=15), "twap": twap(20, start=10, end=15, slices=5),
+             "list": listing(20, day=10, premium=0.05)}
+
+
+def test_results_do_not_depend_on_workers_or_block_size():
+    serial = sweep_schedules(SCHEDULES, num_paths=12, seed=7, params=PARAMS, num_days=NUM_DAYS, block_size=5, workers=0)
+    pooled = sweep_schedules(SCHEDULES, num_paths=12, seed=7, params=PARAMS, num_days=NUM_DAYS, block_size=3, workers=2)
+    for name in SCHEDULES:
+        for a, b in zip(serial[name], pooled[name]):
+            np.testing.assert_array_equal(a, b)
+
+
+def test_schedules_share_the_market():
+    results = sweep_schedules(SCHEDULES, num_paths=8, seed=3, params=PARAMS, num_days=NUM_DAYS, workers=0)
+    # Every schedule submits all 20 units on days whose fundamental comes from the same walk.
+    for i, seq in enumerate(np.random.SeedSequence(3).spawn(8)):
+        walk = fundamental_walk(NUM_DAYS, np.random.default_rng(seq))
+        assert results["dump"].benchmark[i] == pytest.approx(PARAMS.fee_multiplier * 20 * walk[15])
+        assert results["list"].benchmark[i] == pytest.approx(PARAMS.fee_multiplier * 20 * walk[10])
+
+
+def test_every_scheduled_unit_is_benchmarked():
+    results = sweep_schedules(SCHEDULES, num_paths=8, seed=5, params=PARAMS, num_days=NUM_DAYS, workers=0)
+    for result in results.values():
+        np.testing.assert_array_equal(result.units_sold + result.units_unsold, 20)
+        np.testing.assert_allclose(result.slippage, result.benchmark - result.proceeds - result.unsold_value)
+    # A listing far above the market never fills: everything is marked at the final fundamental.
+    unfilled = simulate_sale(listing(20, day=10, premium=5.0), 11, PARAMS, NUM_DAYS)
+    walk = fundamental_walk(NUM_DAYS, np.random.default_rng(11))
+    assert (unfilled.units_sold, unfilled.units_unsold, unfilled.proceeds) == (0, 20, 0.0)
+    assert unfilled.unsold_value == pytest.approx(PARAMS.fee_multiplier * 20 * walk[-1])
+    assert np.isfinite(unfilled.slippage_bps)
+
+
+def test_empty_schedule_sells_nothing():
+    result = simulate_sale([], 0, PARAMS, NUM_DAYS)
+    assert (result.units_sold, result.units_unsold, result.benchmark) == (0, 0, 0.0)
+    assert np.isnan(result.slippage_bps)
+
+
+def test_market_order_sells_into_the_bids():
+    result = simulate_sale([SellOrder(15.0, 3)], 2, PARAMS, NUM_DAYS)
+    assert result.units_sold + result.units_unsold == 3
+    assert result.proceeds == pytest.approx(PARAMS.fee_multiplier * result.units_sold * result.average_price)
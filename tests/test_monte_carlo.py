@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from cs2sim import monte_carlo
+from cs2sim.case import COST_PER_CASE, PROBABILITIES, SKINS
+from cs2sim.exact_distribution import case_outcomes
+
+
+def test_case_tables_sample_the_case_odds():
+    rarity_idx, skin_idx, value = monte_carlo.FEVER_CASE.sample(np.random.default_rng(0), 500_000)
+    frequency = np.bincount(rarity_idx, minlength=len(PROBABILITIES)) / len(rarity_idx)
+    np.testing.assert_allclose(frequency, list(PROBABILITIES.values()), atol=0.002)
+    changes, probs = case_outcomes()
+    assert value.mean() - COST_PER_CASE == pytest.approx(changes @ probs, rel=0.02)
+    assert all(skin_idx[rarity_idx == r].max() < len(SKINS[name]) for r, name in enumerate(PROBABILITIES))
+
+
+def test_case_paths_stop_opening_below_the_case_cost():
+    balances = monte_carlo.simulate_case_paths(20_000, starting_balance=10.0, rng=1)
+    broke = balances[:, :-1] < COST_PER_CASE
+    np.testing.assert_array_equal(balances[:, 1:][broke], balances[:, :-1][broke])
+    assert balances.shape == (20_000, 52)
+    assert broke.any()
+
+
+def test_engines_are_reproducible_from_a_seed():
+    for simulate in (monte_carlo.simulate_case_paths, monte_carlo.simulate_tradeup_paths,
+                     monte_carlo.simulate_flipper_paths):
+        np.testing.assert_array_equal(simulate(1_000, rng=5), simulate(1_000, rng=5))
+
+
+def test_flipper_chunks_concatenate_to_one_batch():
+    chunks = list(monte_carlo.iter_flipper_chunks(2_500, chunk_size=1_000, rng=2))
+    assert [len(chunk) for chunk in chunks] == [1_000, 1_000, 500]
+    np.testing.assert_array_equal(np.concatenate(chunks), monte_carlo.simulate_flipper_paths(2_500, rng=2))
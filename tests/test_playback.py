@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+manim = pytest.importorskip("manim")
+
+import instrumentation  # noqa: E402
+from playback import PlaybackStep, TracePlayback  # noqa: E402
+
+
+def run(playback):
+    """Drive ``playback`` the way ``Scene.play`` does, returning the step that is active on every frame."""
+    scene = playback.scene
+    # Scene.play snapshots the mobjects it redraws on every frame before the animation begins.
+    scene.moving_mobjects = [playback.mobject]
+    playback._setup_scene(scene)
+    playback.begin()
+    active = []
+    for t in np.arange(0, playback.run_time, 1 / playback.frame_rate):
+        playback.interpolate(t / playback.run_time)
+        active.append(playback.step_index)
+    playback.finish()
+    return active
+
+
+def test_every_step_gets_the_frames_of_its_own_play():
+    with manim.tempconfig({"frame_rate": 15}):
+        scene = manim.Scene()
+        anchor = manim.Dot()
+        scene.add(anchor)
+        started = []
+        steps = [PlaybackStep(run_time, lambda: started.append(instrumentation._sim_step) or [], sim_step)
+                 for run_time, sim_step in [(1.0, "week 1"), (0.5, "week 1"), (0.2, "week 2")]]
+        playback = TracePlayback(scene, steps, anchor)
+        assert playback.start_frames.tolist() == [0, 15, 23]
+        assert playback.end_frames.tolist() == [15, 23, 26]
+        assert run(playback) == [0] * 15 + [1] * 8 + [2] * 3
+    assert started == ["week 1", "week 1", "week 2"]
+    assert instrumentation._sim_step is None
+
+
+def test_faded_out_mobjects_leave_the_rendered_snapshot():
+    with manim.tempconfig({"frame_rate": 15}):
+        scene = manim.Scene()
+        anchor = manim.Dot()
+        scene.add(anchor)
+        panel = manim.VGroup(manim.Square(), manim.Circle())
+        steps = [PlaybackStep(0.4, lambda: [manim.FadeIn(panel)]), PlaybackStep(0.4, lambda: [manim.FadeOut(panel)]),
+                 PlaybackStep(0.4, lambda: [])]
+        run(TracePlayback(scene, steps, anchor))
+    family = set(panel.get_family())
+    assert not family & set(scene.moving_mobjects)
+    assert not family & set(scene.mobjects)
+    assert anchor in scene.mobjects
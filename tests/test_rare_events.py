@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from cs2sim.case import PROBABILITIES
+from cs2sim.exact_distribution import case_final_distribution
+from cs2sim.monte_carlo import FEVER_CASE
+from cs2sim.rare_events import (exponential_tilt, importance_sampling, plain_monte_carlo, stratified,
+                                tail_strata)
+
+EXACT = case_final_distribution()
+
+
+def test_tail_strata_hold_all_the_probability():
+    strata = tail_strata()
+    assert sum(strata.values()) == pytest.approx(1.0)
+    tail = PROBABILITIES["Red"] + PROBABILITIES["ST_Red"] + PROBABILITIES["Gold"]
+    assert strata[(0, 0, 0)] == pytest.approx((1 - tail) ** 52)
+
+
+def test_exponential_tilt_moves_the_mean_run_to_the_threshold():
+    tilt = exponential_tilt(1000)
+    probs = np.diff(FEVER_CASE.rarity_cdf, prepend=0.0)
+    q = probs * np.array([tilt[r] for r in FEVER_CASE.rarities])
+    means = (FEVER_CASE.values * FEVER_CASE.skin_probs).sum(axis=1)
+    assert q.sum() == pytest.approx(1.0)
+    assert q @ means == pytest.approx(3.48 + 800 / 52)
+    assert exponential_tilt(0) == {r: 1.0 for r in FEVER_CASE.rarities}
+
+
+@pytest.mark.parametrize("estimator, num_paths", [(plain_monte_carlo, 100_000), (importance_sampling, 50_000),
+                                                  (stratified, 20_000)])
+@pytest.mark.parametrize("threshold", [200, 1000])
+def test_estimators_agree_with_the_exact_distribution(estimator, num_paths, threshold):
+    result = estimator(num_paths, threshold=threshold, rng=3)
+    assert abs(result.estimate - EXACT.prob_above(threshold)) < 4 * result.std_error
+
+
+def test_each_estimator_wins_its_own_regime():
+    assert stratified(20_000, threshold=200, rng=4).variance_reduction > 30
+    assert importance_sampling(50_000, threshold=1000, rng=4).variance_reduction > 20
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from cs2sim import monte_carlo
+from cs2sim.flipper import NUM_UNITS
+from cs2sim.streaming_stats import QuantileDigest, RunningMoments, flipper_fan_chart
+
+
+def test_running_moments_match_numpy_across_chunks():
+    data = np.random.default_rng(0).normal(3.0, 2.0, size=(10_001, 4))
+    moments = RunningMoments(4)
+    for chunk in np.array_split(data, 7):
+        moments.update(chunk)
+    moments.update(data[:0])
+    np.testing.assert_allclose(moments.mean, data.mean(axis=0))
+    np.testing.assert_allclose(moments.std, data.std(axis=0, ddof=1))
+
+
+def test_quantile_digest_tracks_tail_quantiles():
+    data = np.random.default_rng(1).lognormal(0.0, 1.0, size=(200_000, 3))
+    digest = QuantileDigest(3)
+    for chunk in np.array_split(data, 20):
+        digest.update(chunk)
+    for q in (0.05, 0.5, 0.95):
+        exact = np.quantile(data, q, axis=0)
+        np.testing.assert_allclose(digest.quantile(q), exact, rtol=0.01)
+
+
+def test_fan_chart_matches_in_memory_paths():
+    # Streaming in chunks must draw exactly the paths that one big batch would.
+    chart = flipper_fan_chart(50_000, chunk_size=50_000, rng=3)
+    values = monte_carlo.simulate_flipper_paths(50_000, rng=3) * NUM_UNITS
+    np.testing.assert_allclose(chart.mean[1:], values.mean(axis=0))
+    for p in (5, 50, 95):
+        np.testing.assert_allclose(chart.quantiles[p][1:], np.percentile(values, p, axis=0), rtol=0.005)
+
+
+def test_fan_chart_rejects_zero_paths():
+    with pytest.raises(ValueError):
+        flipper_fan_chart(0)
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from cs2sim.sweep import param_grid, run_sweep
+
+
+def test_param_grid_is_the_outer_product():
+    assert param_grid(a=[1, 2], b=[3]) == [{"a": 1, "b": 3}, {"a": 2, "b": 3}]
+
+
+def test_results_do_not_depend_on_workers():
+    params = param_grid(cost_per_attempt=[4.33, 5.0])
+    serial = run_sweep("tradeup", params, seeds=(1, 2), num_paths=300, block_size=100, workers=0)
+    pooled = run_sweep("tradeup", params, seeds=(1, 2), num_paths=300, block_size=100, workers=2)
+    assert serial.shape == (2, 2, 300, 52)
+    np.testing.assert_array_equal(serial, pooled)
+
+
+def test_seeds_and_parameter_sets_get_independent_streams():
+    result = run_sweep("case", param_grid(cost_per_case=[3.48, 3.48]), seeds=(1, 2), num_paths=200, workers=0)
+    assert not np.array_equal(result[0, 0], result[1, 0])
+    assert not np.array_equal(result[0, 0], result[0, 1])
+
+
+def test_unknown_strategy_and_mixed_lengths_are_rejected():
+    with pytest.raises(ValueError):
+        run_sweep("lottery", workers=0)
+    with pytest.raises(ValueError):
+        run_sweep("flipper", [{"num_days": 10}, {"num_days": 20}], workers=0)
@@ -0,0 +1,92 @@
+import os
+
+import numpy as np
+import pytest
+
+from cs2sim import finale, tradeup
+from cs2sim.trace_cache import TraceCache, trace_key
+from cs2sim.traces import tradeup_trace
+
+
+def test_get_or_compute_stores_once(tmp_path):
+    cache = TraceCache(tmp_path)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"balance": [1.0, 2.0]}
+
+    first = cache.get_or_compute("demo", {"a": 1}, 0, compute)
+    second = cache.get_or_compute("demo", {"a": 1}, 0, compute)
+    np.testing.assert_array_equal(first["balance"], second["balance"])
+    assert (len(calls), cache.hits, cache.misses) == (1, 1, 1)
+
+
+def test_keys_change_with_every_input():
+    base = trace_key("demo", {"a": 1}, 0, "v1")
+    assert len({base, trace_key("demo", {"a": 2}, 0, "v1"), trace_key("demo", {"a": 1}, 1, "v1"),
+                trace_key("demo", {"a": 1}, 0, "v2")}) == 4
+
+
+def test_writes_prune_the_least_recently_used_entries(tmp_path):
+    cache = TraceCache(tmp_path, max_bytes=None)
+    for seed in range(3):
+        cache.store(trace_key("demo", {}, seed, "v"), {"x": np.random.default_rng(seed).random(1000)})
+    size = cache.path(trace_key("demo", {}, 0, "v")).stat().st_size
+    for age, seed in enumerate((1, 0, 2)):  # seed 1 is the stalest, seed 2 the freshest
+        os.utime(cache.path(trace_key("demo", {}, seed, "v")), (1000 + age, 1000 + age))
+    assert cache.load(trace_key("demo", {}, 0, "v")) is not None  # a read counts as a use
+
+    cache.max_bytes = int(2.5 * size)
+    cache.store(trace_key("demo", {}, 3, "v"), {"x": np.random.default_rng(3).random(1000)})
+    remaining = {seed for seed in range(4) if cache.path(trace_key("demo", {}, seed, "v")).exists()}
+    assert remaining == {0, 3}
+
+
+def test_an_entry_over_budget_survives_its_own_write(tmp_path):
+    cache = TraceCache(tmp_path, max_bytes=None)
+    cache.store(trace_key("demo", {}, 0, "v"), {"x": np.zeros(10)})
+    cache.max_bytes = 1024
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"x": np.random.default_rng(0).random(10_000)}
+
+    for _ in range(2):
+        cache.get_or_compute("demo", {}, 1, compute)
+    assert (len(calls), cache.hits, cache.misses) == (1, 1, 1)
+    assert not cache.path(trace_key("demo", {}, 0, "v")).exists()  # older entries still make room
+
+
+def test_prune_by_age(tmp_path):
+    cache = TraceCache(tmp_path)
+    cache.store("ab" * 32, {"x": np.zeros(3)})
+    os.utime(cache.path("ab" * 32), (0, 0))
+    assert cache.prune(max_age=3600) == 1
+    assert cache.load("ab" * 32) is None
+
+
+def test_finale_tradeup_line_matches_the_video(tmp_path):
+    race = finale.race_trace("tradeup", weeks=tradeup.NUM_ATTEMPTS, cache=TraceCache(tmp_path))
+    video = tradeup_trace(tradeup.TRADE_UP_OUTCOMES, tradeup.PROBABILITIES, tradeup.COST_PER_ATTEMPT,
+                          tradeup.STEAM_FEE_MULTIPLIER, tradeup.STARTING_BALANCE, tradeup.NUM_ATTEMPTS,
+                          seed=tradeup.SEED)
+    np.testing.assert_allclose(race["balance"][1:], [step.balance for step in video])
+
+
+def test_race_traces_have_one_balance_per_week(tmp_path):
+    traces = finale.race_traces(weeks=20, cache=TraceCache(tmp_path))
+    assert set(traces) == {"case", "tradeup", "flipper", "investor"}
+    for trace in traces.values():
+        assert len(trace["balance"]) == 21
+        assert trace["balance"][0] == pytest.approx(200.0)
+
+
+def test_unseeded_tradeup_trace_leaves_global_state_alone():
+    np.random.seed(0)
+    expected = np.random.random()
+    np.random.seed(0)
+    tradeup_trace(tradeup.TRADE_UP_OUTCOMES, tradeup.PROBABILITIES, tradeup.COST_PER_ATTEMPT,
+                  tradeup.STEAM_FEE_MULTIPLIER, tradeup.STARTING_BALANCE, tradeup.NUM_ATTEMPTS)
+    assert np.random.random() == expected
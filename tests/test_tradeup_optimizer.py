@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from cs2sim.tradeup import PROBABILITIES, STEAM_FEE_MULTIPLIER, TRADE_UP_OUTCOMES
+from cs2sim.tradeup_optimizer import (CONTRACT_SIZE, OBJECTIVES, Catalogue, InputSkin, OutputSkin, brute_force,
+                                      compositions, optimize, random_catalogue)
+
+
+def video_catalogue():
+    """The video's contract: the first three outcomes come from one collection, the other six from another."""
+    outputs = [OutputSkin(name, "Three" if i < 3 else "Six", price) for i, (name, price) in enumerate(TRADE_UP_OUTCOMES.items())]
+    inputs = [InputSkin("Three input", "Three", 0.40), InputSkin("Six input", "Six", 0.45)]
+    return Catalogue(inputs, outputs)
+
+
+def test_pooled_odds_reproduce_the_video():
+    catalogue = video_catalogue()
+    probabilities = catalogue.outcome_probabilities([6, 4])
+    assert list(probabilities) == list(TRADE_UP_OUTCOMES)
+    assert list(probabilities.values()) == pytest.approx(PROBABILITIES, abs=1e-4)
+    assert probabilities["Galil AR | Stone Cold"] == pytest.approx(6 / 42)
+    assert probabilities["PP-Bizon | Space Cat"] == pytest.approx(4 / 42)
+
+
+def test_evaluate_matches_the_outcome_pool():
+    rng = np.random.default_rng(0)
+    inputs = [InputSkin(f"input {c}", f"C{c}", round(float(rng.uniform(0.1, 1.0)), 2)) for c in range(4)]
+    outputs = [OutputSkin(f"C{c} outcome {o}", f"C{c}", round(float(rng.lognormal(1.0, 0.9)), 2))
+               for c in range(4) for o in range(c + 1)]
+    catalogue = Catalogue(inputs, outputs)
+    value = {skin.name: skin.price * STEAM_FEE_MULTIPLIER for skin in outputs}
+    for counts in compositions(CONTRACT_SIZE, len(catalogue)):
+        cost, ev, p_profit = (float(x[0]) for x in catalogue.evaluate(counts))
+        pool = catalogue.outcome_probabilities(counts)
+        assert sum(pool.values()) == pytest.approx(1.0)
+        assert cost == pytest.approx(counts @ [skin.price for skin in inputs])
+        assert ev == pytest.approx(sum(p * value[name] for name, p in pool.items()))
+        assert p_profit == pytest.approx(sum(p for name, p in pool.items() if value[name] > cost))
+
+
+@pytest.mark.parametrize("objective", OBJECTIVES)
+@pytest.mark.parametrize("seed", range(10))
+def test_optimize_matches_brute_force(objective, seed):
+    catalogue = random_catalogue(6, rng=seed)
+    found = optimize(catalogue, objective, top=5, batch_collections=2)
+    expected = brute_force(catalogue, objective, top=5)
+    assert [c.score for c in found] == pytest.approx([c.score for c in expected])
+    for contract in found:
+        assert sum(contract.counts.values()) == CONTRACT_SIZE
+        assert sum(contract.inputs.values()) == CONTRACT_SIZE
+
+
+def test_unknown_objective_is_rejected():
+    with pytest.raises(ValueError):
+        optimize(video_catalogue(), "roi")
@@ -0,0 +1,52 @@
+"""Bounded caches of prebuilt Text/VGroup templates for per-step outcome panels.
+
+Building a ``Text`` runs Pango layout and SVG parsing, but the case and
+trade-up scenes only ever show a few dozen distinct labels. Templates are
+built once per key and every caller gets its own ``copy()``, so animating or
+moving one panel never touches the cached template.
+"""
+from collections import OrderedDict
+
+from manim import DEFAULT_FONT_SIZE, NORMAL, WHITE, Text
+
+
+class MobjectCache:
+    """Least-recently-used cache of mobject templates, handing out copies."""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._templates = OrderedDict()
+        self.hits = self.misses = 0
+
+    def get(self, key, build):
+        """Return a copy of the template for ``key``, calling ``build()`` to make it on a miss."""
+        template = self._templates.get(key)
+        if template is None:
+            self.misses += 1
+            template = build()
+            self._templates[key] = template
+            if len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+        else:
+            self.hits += 1
+            self._templates.move_to_end(key)
+        return template.copy()
+
+    def clear(self):
+        self._templates.clear()
+        self.hits = self.misses = 0
+
+
+TEXT_CACHE = MobjectCache(maxsize=512)
+PANEL_CACHE = MobjectCache(maxsize=256)
+
+
+def cached_text(string, color=WHITE, font_size=DEFAULT_FONT_SIZE, weight=NORMAL):
+    """A fresh copy of ``Text(string, color=..., font_size=..., weight=...)``."""
+    key = (string, str(color), font_size, weight)
+    return TEXT_CACHE.get(key, lambda: Text(string, color=color, font_size=font_size, weight=weight))
+
+
+def cached_panel(key, build):
+    """A fresh copy of the VGroup ``build()`` makes for ``key``, e.g. one outcome panel per skin."""
+    return PANEL_CACHE.get(key, build)
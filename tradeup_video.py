@@ -1,7 +1,12 @@
 # Save this code as tradeup_video.py
 from manim import *
-import random
-import numpy as np
+from playback import PlaybackStep, play_steps
+from polyline import ProgressivePolyline
+from text_cache import cached_panel, cached_text
+from cs2sim.tradeup import COST_PER_ATTEMPT, NUM_ATTEMPTS, PROBABILITIES, SEED, STARTING_BALANCE, STEAM_FEE_MULTIPLIER, TRADE_UP_OUTCOMES
+from cs2sim.traces import tradeup_trace
+from segmented_render import checkpoint
+from instrumentation import instrumentable
 
 # --- DATA & CONFIGURATION ---
 
@@ -16,35 +21,19 @@ class Colors:
     RED_LOSS = "#C82822"
     GOLD_RARITY = GOLD
 
-# 2. Trade-Up Specific Data
-# --- NEW: Added the Steam Fee Multiplier ---
-STEAM_FEE_MULTIPLIER = 0.85 # Represents the 85% you keep after the 15% fee
-
-COST_PER_ATTEMPT = 4.33
-STARTING_BALANCE = 200.00
-NUM_ATTEMPTS = 52
-
-TRADE_UP_OUTCOMES = {
-    'Galil AR | Stone Cold': 15.11,
-    'M249 | Nebula Crusader': 9.05,
-    'P250 | Wingshot': 7.40,
-    'MP7 | Special Delivery': 7.40,
-    'USP-S | Ticket to Hell': 1.89,
-    'M4A1-S | Night Terror': 1.99,
-    'G3SG1 | Dream Glade': 2.11,
-    'PP-Bizon | Space Cat': 1.61,
-    'XM1014 | Zombie Offensive': 1.58,
-}
-raw_probs = [13.64, 13.64, 13.64, 9.09, 9.09, 9.09, 9.09, 9.09, 9.09]
-PROBABILITIES = np.array(raw_probs) / sum(raw_probs)
+# 2. Render Options
+PLAYBACK_MODE = True # Play the whole simulation as one precomputed animation (False = one self.play per step)
 
 # --- THE MANIM ANIMATION SCENE ---
 
+@instrumentable
 class TradeUpAnimation(Scene):
+    render_segments = ("setup", "simulation", "result") # Split points for segmented_render.py
+
     def construct(self):
-        random.seed(42) # This seed still produces a profit, which is a great story!
         self.camera.background_color = Colors.BACKGROUND
 
+        checkpoint(self, "setup")
         # --- 1. SETUP THE SCENE ---
         axes = Axes(
             x_range=[0, NUM_ATTEMPTS, 10],
@@ -68,50 +57,45 @@ class TradeUpAnimation(Scene):
         self.play(Write(title), Create(graph_area), Write(info_panel), Create(outcome_box))
         self.wait(1)
 
+        checkpoint(self, "simulation")
         # --- 2. RUN THE SIMULATION WITH FEE CALCULATION ---
+        # The whole seeded story is drawn up front, then animated attempt by attempt.
+        trace = tradeup_trace(TRADE_UP_OUTCOMES, PROBABILITIES, COST_PER_ATTEMPT, STEAM_FEE_MULTIPLIER, STARTING_BALANCE, NUM_ATTEMPTS, seed=SEED)
         dot = Dot(point=axes.c2p(0, STARTING_BALANCE), color=Colors.DOT_GOLD)
-        line_trace = TracedPath(dot.get_center, stroke_color=Colors.LINE_BLUE, stroke_width=4)
+        line_trace = ProgressivePolyline.from_series(axes, range(NUM_ATTEMPTS + 1), [STARTING_BALANCE] + [step.balance for step in trace], stroke_color=Colors.LINE_BLUE, stroke_width=4).follow_x(axes, dot)
         self.add(line_trace, dot)
-
-        current_balance = STARTING_BALANCE
-        outcome_names = list(TRADE_UP_OUTCOMES.keys())
-
-        for i in range(1, NUM_ATTEMPTS + 1):
-            current_balance -= COST_PER_ATTEMPT
-            chosen_outcome_name = np.random.choice(outcome_names, p=PROBABILITIES)
-            outcome_value = TRADE_UP_OUTCOMES[chosen_outcome_name]
-            
-            # --- CORE LOGIC CHANGE: CALCULATE AND APPLY THE FEE ---
-            value_after_fees = outcome_value * STEAM_FEE_MULTIPLIER
-            fee_amount = outcome_value - value_after_fees
-            current_balance += value_after_fees # Add the post-fee value to the balance
-            
-            # Profit is now calculated based on the post-fee value
-            profit_or_loss = value_after_fees - COST_PER_ATTEMPT
-            result_color = Colors.BALANCE_GREEN if profit_or_loss >= 0 else Colors.RED_LOSS
+        steps = []
+        for step in trace:
+            result_color = Colors.BALANCE_GREEN if step.profit >= 0 else Colors.RED_LOSS
 
             # --- VISUAL CHANGE: DISPLAY THE FEE IN THE OUTCOME BOX ---
-            name_text = Text(str(chosen_outcome_name), color=Colors.TEXT, font_size=24)
-            value_text = Text(f"Market Value: ${outcome_value:.2f}", color=Colors.TEXT, font_size=20)
-            fee_text = Text(f"- ${fee_amount:.2f} (15% Fee)", color=Colors.RED_LOSS, font_size=20)
-            profit_text = Text(f"Net Profit: {profit_or_loss:+.2f}", color=result_color, font_size=24)
-            outcome_display = VGroup(name_text, value_text, fee_text, profit_text).arrange(DOWN).move_to(outcome_box.get_center())
-
-            new_point = axes.c2p(i, current_balance)
-
-            self.play(
-                attempt_counter[1].animate.set_value(i),
-                balance_tracker[1].animate.set_value(current_balance),
-                FadeIn(outcome_display),
-                dot.animate.move_to(new_point),
-                run_time=0.75
-            )
-            self.wait(0.5)
-            self.play(FadeOut(outcome_display), run_time=0.5)
+            # Every field depends only on the outcome, so each of the nine panels is built once and copied after that.
+            def build_outcome_display(step=step, result_color=result_color):
+                name_text = cached_text(str(step.outcome), color=Colors.TEXT, font_size=24)
+                value_text = cached_text(f"Market Value: ${step.market_value:.2f}", color=Colors.TEXT, font_size=20)
+                fee_text = cached_text(f"- ${step.fee:.2f} (15% Fee)", color=Colors.RED_LOSS, font_size=20)
+                profit_text = cached_text(f"Net Profit: {step.profit:+.2f}", color=result_color, font_size=24)
+                return VGroup(name_text, value_text, fee_text, profit_text).arrange(DOWN)
+            outcome_display = cached_panel(("tradeup", step.outcome), build_outcome_display).move_to(outcome_box.get_center())
+
+            new_point = axes.c2p(step.attempt, step.balance)
+
+            steps.append(PlaybackStep(0.75, lambda attempt=step.attempt, balance=step.balance, display=outcome_display, point=new_point: [
+                attempt_counter[1].animate.set_value(attempt),
+                balance_tracker[1].animate.set_value(balance),
+                FadeIn(display),
+                dot.animate.move_to(point),
+            ], step.attempt))
+            steps.append(PlaybackStep(0.5, lambda: [], step.attempt)) # self.wait(0.5)
+            steps.append(PlaybackStep(0.5, lambda display=outcome_display: [FadeOut(display)], step.attempt))
+
+        play_steps(self, steps, anchor=info_panel, single_pass=PLAYBACK_MODE)
         
         self.wait(1)
         
+        checkpoint(self, "result")
         # --- 3. DYNAMIC TRANSITION FOR YOUR AFTER EFFECTS WORK ---
+        line_trace.freeze() # The finished line is transformed below, so it stops following the dot
         full_graph_group = VGroup(graph_area, line_trace, dot)
         shrunken_graph_target = full_graph_group.copy().scale(0.65).to_corner(UL)
 